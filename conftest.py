@@ -7,7 +7,17 @@ import allure  # type: ignore
 import pytest
 from playwright.sync_api import Page, ViewportSize
 
-from constants import BASE_URL
+from constants import (
+    ASSET_CACHE_SIZE_MB,
+    BASE_URL,
+    CONSOLE_CAPTURE_MAX_RECORDS,
+)
+from utils.asset_cache import AssetCache
+from utils.compare_service import compare_service
+from utils.console_capture import ConsoleCapture
+from utils.network_profile import NetworkBlocker, network_profiles
+from utils.page_snapshot import PageSnapshot
+from utils.warm_context import WarmContext
 
 # Allow assert representation
 pytest.register_assert_rewrite(
@@ -51,11 +61,96 @@ def pytest_addoption(parser):
                      default=0.3,
                      help="Snapshot comparison threshold in range 0...1.")
 
+    parser.addoption("--entity-pool-size",
+                     action="store",
+                     type=int,
+                     default=0,
+                     help="Number of entities of each type/options to "
+                     "pre-create in background for entity fixtures "
+                     "(e.g. 'new_product'). Defaults to 0 (disabled).")
+
+    parser.addoption("--teardown-workers",
+                     action="store",
+                     type=int,
+                     default=0,
+                     help="Number of background threads to delete test "
+                     "entities after tests. Deletion is awaited only at the "
+                     "end of the session. Defaults to 0 (entities are "
+                     "deleted on each test's teardown).")
+
+    parser.addoption("--category-navigation",
+                     action="store",
+                     choices=("click", "direct", "auto"),
+                     default="auto",
+                     help="Navigation to admin category pages: 'click' - "
+                     "by side menu, 'direct' - by category page URL, "
+                     "'auto' - by URL in fixtures and by side menu in tests "
+                     "of the menu. Defaults to 'auto'.")
+
+    parser.addoption("--asset-cache-size",
+                     action="store",
+                     type=int,
+                     default=ASSET_CACHE_SIZE_MB,
+                     help="Max size (MB) of the worker's on-disk cache of "
+                     "static assets (CSS, JS, fonts, images) shared by "
+                     f"tests. Set 0 to disable. Defaults to "
+                     f"{ASSET_CACHE_SIZE_MB}.")
+
+    parser.addoption("--reuse-context",
+                     action="store_true",
+                     default=False,
+                     help="Keep one browser context/page per worker and "
+                     "reset it between tests instead of creating a new one "
+                     "for each test. Note: pytest-playwright's tracing, "
+                     "video and screenshot options are not applied to "
+                     "reused context.")
+
+    parser.addoption("--network-profile",
+                     action="store",
+                     default=None,
+                     help="Network profile (from "
+                     "'resources/network_profiles.ini') to abort or stub "
+                     "page requests not needed by tests (fonts, analytics, "
+                     "etc.). Overrides 'network_profile' ini option.")
+
+    parser.addoption("--async-compare",
+                     action="store",
+                     type=int,
+                     default=0,
+                     help="Number of background processes to compare "
+                     "snapshots and images in, while test continues. "
+                     "Results are checked at the end of the test. "
+                     "Defaults to 0 (images are compared inline).")
+
+    parser.addini("network_profile",
+                  "Network profile to abort or stub page requests",
+                  default="none")
+
     parser.addini("allure.console_errors_to_step",
                   "Attach browser console error to Allure step",
                   type='bool',
                   default=True)
 
+    parser.addini("allure.attach_compared_images",
+                  "Attach compared images to Allure report even if "
+                  "images match",
+                  type='bool',
+                  default=False)
+
+    parser.addini("console_capture.max_records",
+                  "Max number of unique browser errors kept per test",
+                  default=str(CONSOLE_CAPTURE_MAX_RECORDS))
+
+    parser.addini("console_capture.page_errors",
+                  "Capture uncaught exceptions of the page",
+                  type='bool',
+                  default=True)
+
+    parser.addini("console_capture.failed_requests",
+                  "Capture failed requests of the page",
+                  type='bool',
+                  default=False)
+
 
 def pytest_configure(config):
     """Configure pytest before tests execution"""
@@ -72,6 +167,15 @@ def pytest_configure(config):
                             "new_product_options(add_iamges): sets desired "
                             "options for 'new_product' fixture")
 
+    config.addinivalue_line("markers",
+                            "new_products_options(count, add_images): sets "
+                            "desired options for 'new_products' fixture")
+
+    config.addinivalue_line("markers",
+                            "network_profile(name): sets network profile "
+                            "for the test (e.g. 'none' for snapshot tests, "
+                            "that need real assets)")
+
     window_size = None
     if config.getoption("--maximized"):
         # Dirty way to get screen size to emulate
@@ -101,15 +205,213 @@ def pytest_configure(config):
 
     pytest.pw_attach_console_errors_to_step = \
         config.getini("allure.console_errors_to_step")
+    setattr(
+        pytest, "pw_attach_compared_images",
+        config.getini("allure.attach_compared_images")
+    )
+    setattr(
+        pytest, "pw_console_capture_options",
+        {
+            "max_records": int(config.getini("console_capture.max_records")),
+            "page_errors": config.getini("console_capture.page_errors"),
+            "failed_requests": config.getini(
+                "console_capture.failed_requests"
+            ),
+        }
+    )
+
+    network_profile = (
+        config.getoption("--network-profile")
+        or config.getini("network_profile")
+    )
+    if network_profile not in network_profiles.names:
+        raise pytest.UsageError(
+            f'Unknown network profile "{network_profile}", available '
+            f'profiles: {", ".join(network_profiles.names)}'
+        )
+    setattr(pytest, "pw_network_profile", network_profile)
+
+    compare_service.configure(config.getoption("--async-compare"))
+
+
+def pytest_unconfigure():
+    """Cleanup after tests execution"""
+    compare_service.close()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call():
+    """Resolves images comparisons, that are still pending
+    at the end of the test"""
+    outcome = yield
+    if outcome.excinfo is not None:
+        compare_service.discard()
+        return
+
+    if not compare_service.pending:
+        return
+
+    try:
+        with allure.step("Check results of images comparisons"):
+            compare_service.resolve()
+    except AssertionError as err:
+        outcome.force_exception(err)
+
+
+@pytest.fixture(scope="session")
+def asset_cache(request, worker_id: str) -> Generator[
+    AssetCache | None, None, None
+]:
+    """Worker-level cache of static assets, kept in pytest cache
+    between runs. None if disabled by '--asset-cache-size=0'"""
+    max_size = request.config.getoption("--asset-cache-size")
+    if max_size <= 0:
+        yield None
+        return
+
+    cache = AssetCache(
+        request.config.cache.mkdir(f"assets_{worker_id}"),
+        max_size * 1024 * 1024
+    )
+    yield cache
+
+    cache.close()
+    logging.info(
+        "Asset cache statistics: %s (size: %s bytes)",
+        cache.stats, cache.size
+    )
+
+
+@pytest.fixture(scope="session")
+def warm_context(request) -> Generator[WarmContext | None, None, None]:
+    """Worker-level warm browser context, reused by tests.
+    None if '--reuse-context' CLI option is not set"""
+    if not request.config.getoption("--reuse-context"):
+        yield None
+        return
+
+    context = WarmContext(
+        request.getfixturevalue("browser"),
+        request.getfixturevalue("browser_context_args")
+    )
+    yield context
+
+    context.close()
+    logging.info("Warm context statistics: %s", context.stats)
+
+
+@pytest.fixture
+def browser_page(
+    request, warm_context: WarmContext | None
+) -> Generator[Page, None, None]:
+    """Page for the test: page of warm context if '--reuse-context'
+    CLI option was set (page is reset after the test), otherwise
+    new page"""
+    if warm_context is None:
+        yield request.getfixturevalue("page")
+        return
+
+    page = warm_context.acquire()
+    yield page
+
+    # Imported here, as elements are imported by tests after
+    # registration of assert rewriting
+    from utils.elements.table import unwatch_tables
+    unwatch_tables(page)
+    warm_context.reset()
+
+
+@pytest.fixture
+def page_asset_cache(
+    browser_page: Page, asset_cache: AssetCache | None
+) -> Generator[AssetCache | None, None, None]:
+    """Serves static assets of the page from worker's asset cache"""
+    if asset_cache is None:
+        yield None
+        return
+
+    asset_cache.install(browser_page)
+    yield asset_cache
+    asset_cache.uninstall(browser_page)
+
+
+@pytest.fixture
+def network_blocker(
+    request, browser_page: Page, page_asset_cache: AssetCache | None
+) -> Generator[NetworkBlocker, None, None]:
+    """Aborts or stubs requests of the page by network profile
+    ('--network-profile' CLI option or 'network_profile' marker).
+    Installed after asset cache, as routes run in reverse order
+    of registration, so requests, that are not blocked, fall back
+    to cache"""
+    marker = request.node.get_closest_marker("network_profile")
+    blocker = NetworkBlocker(
+        browser_page,
+        network_profiles.get(
+            marker.args[0] if marker else pytest.pw_network_profile
+        )
+    ).install()
+    yield blocker
+
+    # --- Attaches blocked requests stats to Allure report ---
+    blocker.uninstall()
+    if blocker.requests:
+        logging.info(
+            "Network profile '%s' blocked %s request(s), %s byte(s)",
+            blocker.profile.name, blocker.requests, blocker.bytes
+        )
+        allure.attach(
+            blocker.summary(), "Blocked Requests", allure.attachment_type.TEXT
+        )
+
+
+@pytest.fixture
+def console_capture(
+    browser_page: Page, network_blocker: NetworkBlocker
+) -> Generator[ConsoleCapture, None, None]:
+    """Captures browser console errors (and optionally page errors and
+    failed requests, except blocked ones) with optional attachement
+    to allure steps"""
+    capture = ConsoleCapture(
+        browser_page,
+        attach_to_step=pytest.pw_attach_console_errors_to_step,
+        ignore_request=network_blocker.is_aborted,
+        **pytest.pw_console_capture_options
+    ).install()
+    yield capture
+
+    # --- Attaches browser errors to Allure report ---
+    capture.uninstall()
+    if capture.records:
+        capture.attach()
+        logging.warning(
+            "There were %s browser error(s) occured during the test "
+            "(%s unique, %s dropped).",
+            capture.total, len(capture.records), capture.dropped
+        )
 
 
 @pytest.fixture
-def prepared_page(page: Page, assert_snapshot) -> Generator[Page, None, None]:
+def prepared_page(
+    request,
+    browser_page: Page,
+    assert_snapshot
+) -> Page:
     """Prepares the page for tests:
-    - add handling of browser console errors and optional
-    attachement of browser errorr to allure steps;
+    - use page of warm context or new page (see 'browser_page');
+    - serve static assets from worker's asset cache, abort or stub
+    requests by network profile, capture browser errors
+    (see 'console_capture');
     - maximize viewport if '--maximized' CLI option was set;
+    - add snapshot assertion, that skips pixel comparison when
+    screenshot is identical to golden snapshot by block hash;
     """
+    page = browser_page
+
+    # --- Page's handlers ---
+    # Asset cache and network profile are installed by dependencies
+    # of console capture
+    request.getfixturevalue("console_capture")
 
     # --- Window size ---
     # Set window size if '--maximized' CLI option was used
@@ -118,56 +420,23 @@ def prepared_page(page: Page, assert_snapshot) -> Generator[Page, None, None]:
     if pytest.pw_window_size:
         page.set_viewport_size(cast(ViewportSize, pytest.pw_window_size))
 
-    # --- Handle browser console errors ---
-    browser_errors = []
-
-    def log_console_error_msg(msg):
-        """Logs browser console error to log"""
-        if msg.type != 'error':
-            return
-
-        reported_error = f"Page: {msg.page}; text: {msg.text}."
-        logging.warning(
-            "Browser Console error! %s",
-            reported_error
-        )
-        browser_errors.append(reported_error)
-        if pytest.pw_attach_console_errors_to_step:
-            allure.attach(
-                reported_error,
-                "Browser Error",
-                allure.attachment_type.TEXT
-            )
-
-    page.on("console", log_console_error_msg)
-
     # --- Snapshot comparison ---
-    def assert_page_snapshot():
+    page_snapshot = PageSnapshot(
+        page, request, assert_snapshot, pytest.pw_snapshot_threshold
+    )
+
+    def assert_page_snapshot(
+        regions: dict[str, str] | None = None,
+        masks: list[str] | None = None
+    ):
         if pytest.pw_skip_snapshot_check:
             logging.warning('Skipping snapshot comparison')
             return
 
-        assert_snapshot(
-            page.screenshot(),
-            threshold=pytest.pw_snapshot_threshold
-        )
+        page_snapshot(regions, masks)
     setattr(page, "assert_snapshot", assert_page_snapshot)
 
-    yield page
-
-    # --- Attaches browser errors to Allure report ---
-    if not browser_errors:
-        return
-
-    allure.attach(
-        '\n'.join(browser_errors),
-        "Browser Errors (All)",
-        allure.attachment_type.TEXT
-    )
-    logging.warning(
-        "There were %s browser console error(s) occured during the test.",
-        len(browser_errors)
-    )
+    return page
 
 
 @pytest.fixture
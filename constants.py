@@ -4,11 +4,28 @@
 BASE_URL = 'http://192.168.56.104'
 
 MESSAGES_REPOSITORY = 'resources/messages.ini'
+NETWORK_PROFILES_REPOSITORY = 'resources/network_profiles.ini'
 
 # Admin user-pass for test environemnt
 SUPERADMIN_USERNAME = "admin"
 SUPERADMIN_PASSWORD = "secret"
 
+# API sessions settings: size of keep-alive connections pool,
+# number of retries on connection errors and request timeout (seconds)
+API_POOL_SIZE = 10
+API_REQUEST_RETRIES = 3
+API_REQUEST_TIMEOUT = 10
+# Max number of concurrent API requests for bulk operations
+API_MAX_WORKERS = 8
+# Number of attempts to delete entity on teardown
+# and delay (seconds) before the first retry (doubled on each retry)
+DELETION_ATTEMPTS = 3
+DELETION_RETRY_DELAY = 0.5
+# Default max size (megabytes) of the worker's static assets cache
+ASSET_CACHE_SIZE_MB = 100
+# Default max number of unique browser errors kept per test
+CONSOLE_CAPTURE_MAX_RECORDS = 100
+
 
 COUNTRIES_ORDERING_RULES = [
     ('Åland Islands', 'Aland Islands'),
@@ -32,7 +32,7 @@ def test_delete(
         admin_category_page.reload()
 
     with given("there is created Product entity in the table"):
-        row = admin_category_page.find_in_table(new_product, True)
+        row = admin_category_page.find_in_table(new_product)
 
     with when("user clicks 'Edit' button for existing Product"):
         edit_page: AdminCatalogEditFormPage = (
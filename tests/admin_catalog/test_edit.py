@@ -30,7 +30,7 @@ def test_edit(
         admin_category_page.reload()
 
     with given("there is created Product entity in the table"):
-        row = admin_category_page.find_in_table(new_product, True)
+        row = admin_category_page.find_in_table(new_product)
 
     with when("user clicks Edit button for entity and opens Edit form"):
         edit_form: AdminCatalogEditFormPage = (
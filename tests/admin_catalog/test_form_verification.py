@@ -15,6 +15,7 @@ from .metadata import EPIC, FEATURE, STORY
 @allure.feature(FEATURE)
 @allure.story(STORY)
 @pytest.mark.admin_category_page(AdminCategory.CATALOG)
+@pytest.mark.network_profile("none")
 def test_form_verification(admin_category_page: AdminCatalogPage):
     """It is possible to access Create New Product from
     Admin -> Catalog page"""
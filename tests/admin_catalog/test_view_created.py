@@ -29,9 +29,7 @@ def test_view_created(
         admin_category_page.reload()
 
     with given("there is created Geozone entity in the table"):
-        row_idx = admin_category_page.find_in_table(
-            new_product, True
-        )
+        row_idx = admin_category_page.find_in_table(new_product)
 
     with when("user clicks Edit button for entity"):
         form: AdminCatalogEditFormPage = (
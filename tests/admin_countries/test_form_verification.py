@@ -17,6 +17,7 @@ from .metadata import EPIC, FEATURE, STORY
 @allure.feature(FEATURE)
 @allure.story(STORY)
 @pytest.mark.admin_category_page(AdminCategory.COUNTRIES)
+@pytest.mark.network_profile("none")
 def test_order(admin_category_page: AdminCountriesPage):
     """Tests that countries at Admin -> Countries section
     are listed in A-Z order except:
@@ -34,7 +34,7 @@ def test_delete(
         admin_category_page.reload()
 
     with given("there is created Geozone entity in the table"):
-        row = admin_category_page.find_in_table(new_geozone, True)
+        row = admin_category_page.find_in_table(new_geozone)
 
     with when("user clicks 'Edit' button for existing Geo Zone"):
         edit_page: AdminGeozonesEditFormPage = (
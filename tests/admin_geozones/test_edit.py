@@ -36,7 +36,7 @@ def test_edit(
         admin_category_page.reload()
 
     with given("there is created Geozone entity in the table"):
-        row = admin_category_page.find_in_table(new_geozone, True)
+        row = admin_category_page.find_in_table(new_geozone)
 
     with when("user clicks Edit button for entity and opens Edit form"):
         edit_form: AdminGeozonesEditFormPage = (
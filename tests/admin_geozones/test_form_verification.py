@@ -23,6 +23,7 @@ from .metadata import EPIC, FEATURE, STORY
 @allure.epic(FEATURE)
 @allure.epic(STORY)
 @pytest.mark.admin_category_page(AdminCategory.GEOZONES)
+@pytest.mark.network_profile("none")
 def test_form_verification(admin_category_page: AdminGeozonesPage):
     """It is possible to access Create New Geo Zone from
     Admin -> Geo Zones page,
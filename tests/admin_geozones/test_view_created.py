@@ -35,9 +35,7 @@ def test_view_created(
         admin_category_page.reload()
 
     with given("there is created Geozone entity in the table"):
-        row_idx = admin_category_page.find_in_table(
-            new_geozone, True
-        )
+        row_idx = admin_category_page.find_in_table(new_geozone)
 
     with when("user clicks Edit button for entity"):
         edit_form: AdminGeozonesEditFormPage = (
@@ -1,6 +1,7 @@
 from typing import cast
 
 import allure  # type: ignore
+import pytest
 
 from constants import SUPERADMIN_PASSWORD, SUPERADMIN_USERNAME
 from utils.bdd import given, then, when
@@ -14,6 +15,7 @@ from .metadata import EPIC, FEATURE, STORY
 @allure.epic(EPIC)
 @allure.feature(FEATURE)
 @allure.story(STORY)
+@pytest.mark.network_profile("none")
 def test_login(admin_login_page: AdminLoginPage):
     """User with valid creds can log in and main admin page is loaded"""
     with given("admin user with valid credentials is at login page"):
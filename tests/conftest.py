@@ -1,28 +1,154 @@
 """Fixtures related to tests"""
 import logging
-from typing import Generator, cast
+from typing import Any, Generator, cast
 
 import allure  # type: ignore
 import pytest
+from playwright.sync_api import Page
 
 import utils.api_helpers as api
+from utils.components import AdminSideMenu
 from constants import SUPERADMIN_PASSWORD, SUPERADMIN_USERNAME
+from utils.deletion_queue import DeletionQueue
+from utils.elements.base_element import locator_counter
+from utils.entity_pool import EntityPool
 from utils.models.base_entity import BackOfficeEntity
 from utils.models.entitiy_types import EntityType
 from utils.models.admin_user import UserEntity
 from utils.models.admin_geozone import GeozoneEntity
 from utils.models.admin_catalog import ProductEntity
+from utils.models.navigation_mode import NavigationMode
 from utils.pages import AdminBasicCategoryPage, AdminLoginPage, AdminMainPage
+from utils.pages import base_page
+from utils.storage_state import StorageStateCache
 
 
 # --- Pages
 # --- Helper functions
 @allure.step("Login as Admin")
-def login_as_admin_step(page):
-    """Step to fullfill login form and log in"""
+def login_as_admin_step(
+    page: Page, storage_state: StorageStateCache | None = None
+) -> AdminMainPage:
+    """Step to log in as admin.
+
+    Re-uses cached admin session if available, otherwise fullfills
+    login form and caches new session. Expired cached session is
+    invalidated and replaced with a new one."""
+    if storage_state is not None and storage_state.apply(page.context):
+        admin_page = AdminMainPage(page)
+        # Session may be expired and page redirected to login form,
+        # so page's readiness is not awaited
+        admin_page.visit(wait_until="domcontentloaded")
+        if not AdminLoginPage.is_login_url(page.url):
+            return admin_page
+
+        logging.info("Cached admin session is expired, logging in again")
+        storage_state.invalidate()
+
     login_page = AdminLoginPage(page)
     login_page.visit()
-    return login_page.login(SUPERADMIN_USERNAME, SUPERADMIN_PASSWORD)
+    admin_page = cast(
+        AdminMainPage,
+        login_page.login(SUPERADMIN_USERNAME, SUPERADMIN_PASSWORD)
+    )
+
+    if storage_state is not None:
+        page.wait_for_url(
+            lambda url: not AdminLoginPage.is_login_url(url)
+        )
+        storage_state.save(page.context)
+
+    return admin_page
+
+
+# --- Session fixtures
+@pytest.fixture(scope="session")
+def admin_storage_state(request, worker_id: str) -> StorageStateCache:
+    """Storage state of logged in admin, shared between tests of
+    the same worker and kept in pytest cache between runs"""
+    cache_dir = request.config.cache.mkdir("storage_state")
+    return StorageStateCache(cache_dir / f"admin_{worker_id}.json")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def category_navigation(request) -> NavigationMode:
+    """Sets navigation mode for admin category pages
+    from '--category-navigation' CLI option"""
+    mode = NavigationMode(request.config.getoption("--category-navigation"))
+    AdminSideMenu.navigation_mode = mode
+    return mode
+
+
+@pytest.fixture(scope="session", autouse=True)
+def api_sessions():
+    """Closes API sessions at the end of the worker's session
+    and logs sessions statistics"""
+    yield api.sessions
+
+    logging.info("API sessions statistics: %s", api.sessions.stats())
+    api.sessions.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def page_load_stats():
+    """Logs statistics of waiting for pages readiness
+    at the end of the worker's session"""
+    yield base_page.page_load_stats
+
+    logging.info(
+        "Pages readiness statistics: %s",
+        base_page.page_load_stats.summary()
+    )
+
+
+@pytest.fixture(scope="session")
+def deletion_queue(
+    request, base_url: str
+) -> Generator[DeletionQueue | None, None, None]:
+    """Queue to delete test entities in background. Deletions are awaited
+    at the end of worker's session, failed deletions are reported.
+    Disabled if '--teardown-workers' CLI option is 0."""
+    workers = request.config.getoption("--teardown-workers")
+    if not workers:
+        yield None
+        return
+
+    queue = DeletionQueue(
+        base_url, SUPERADMIN_USERNAME, SUPERADMIN_PASSWORD, workers
+    )
+    yield queue
+
+    failures = queue.flush()
+    if not failures:
+        return
+
+    summary = "\n".join(
+        f"{failure.entity!r} - {failure.attempts} attempts - "
+        f"{failure.error!r}"
+        for failure in failures
+    )
+    logging.warning(
+        "[Fixture] Failed to delete %s entities:\n%s", len(failures), summary
+    )
+    allure.attach(
+        summary,
+        f"Failed to delete {len(failures)} entities",
+        allure.attachment_type.TEXT
+    )
+
+
+# --- Instrumentation
+@pytest.fixture(autouse=True)
+def locators_usage():
+    """Logs number of locators built and taken from cache
+    by elements during the test"""
+    locator_counter.reset()
+    yield locator_counter
+
+    logging.info(
+        "Locators built: %s, taken from cache: %s",
+        locator_counter.built, locator_counter.cached
+    )
 
 
 # --- Pages fixtures
@@ -33,82 +159,240 @@ def admin_login_page(prepared_page) -> AdminLoginPage:
 
 
 @pytest.fixture
-def admin_main_page(prepared_page) -> AdminMainPage:
+def admin_main_page(prepared_page, admin_storage_state) -> AdminMainPage:
     """Returns Admin Main Page"""
-    admin_page = login_as_admin_step(prepared_page)
+    admin_page = login_as_admin_step(prepared_page, admin_storage_state)
     return admin_page
 
 
 @pytest.fixture
-def admin_category_page(request, prepared_page) -> AdminBasicCategoryPage:
+def admin_category_page(
+    request, prepared_page, admin_storage_state
+) -> AdminBasicCategoryPage:
     """Returns Admin Category Page speciied by 'admin_category_page' marker
     of the test"""
     category = request.node.get_closest_marker("admin_category_page").args[0]
-    admin_page = login_as_admin_step(prepared_page)
-    category_page = admin_page.side_menu.change_category(category)
+    admin_page = login_as_admin_step(prepared_page, admin_storage_state)
+    category_page = admin_page.side_menu.change_category(
+        category, NavigationMode.AUTO
+    )
 
     return category_page
 
 
 # --- Data generation
+# Entity fixtures: type of entity, name of the marker with generator
+# options and default generator options
+ENTITY_FIXTURES: dict[str, tuple[EntityType, str, dict[str, Any] | None]] = {
+    "new_admin_user": (EntityType.USER, "", None),
+    "new_geozone": (
+        EntityType.GEOZONE, "new_geozone_options", {"add_countries": None}
+    ),
+    "new_product": (
+        EntityType.PRODUCT, "new_product_options", {"add_images": None}
+    ),
+}
+
+
+def get_entity_options(node, fixture_name: str) -> dict[str, Any] | None:
+    """Returns entity generator options for entity fixture,
+    updated by options from fixture's marker of the test node"""
+    _, marker_name, default_options = ENTITY_FIXTURES[fixture_name]
+    if default_options is None:
+        return None
+
+    options = dict(default_options)
+    marker = node.get_closest_marker(marker_name)
+    if marker and marker.kwargs:
+        options.update(marker.kwargs)
+
+    return options
+
+
+def get_entity_demand(
+    items: list[pytest.Item]
+) -> list[tuple[EntityType, dict[str, Any] | None]]:
+    """Returns entity type and generator options for each entity
+    fixture requested by given tests"""
+    demand = []
+    for item in items:
+        fixturenames = getattr(item, "fixturenames", ())
+        for fixture_name, (entity_type, _, _) in ENTITY_FIXTURES.items():
+            if fixture_name in fixturenames:
+                demand.append(
+                    (entity_type, get_entity_options(item, fixture_name))
+                )
+    return demand
+
+
+# Pool, that is warmed up by lookahead of the worker's tests,
+# and the next test, scheduled before pool is created
+LOOKAHEAD_POOL_KEY = pytest.StashKey[EntityPool]()
+NEXT_ITEM_KEY = pytest.StashKey[pytest.Item | None]()
+
+
+def pytest_runtest_protocol(item: pytest.Item, nextitem: pytest.Item | None):
+    """Registers demand for entities of the next test of the worker"""
+    pool = item.config.stash.get(LOOKAHEAD_POOL_KEY, None)
+    if pool is None:
+        item.config.stash[NEXT_ITEM_KEY] = nextitem
+    elif nextitem is not None:
+        pool.warm_up(get_entity_demand([nextitem]))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def entity_pool(
+    request,
+    worker_id: str,
+    base_url: str,
+    deletion_queue: DeletionQueue | None
+) -> Generator[EntityPool | None, None, None]:
+    """Pool of entities pre-created in background for entity fixtures
+    of the tests run by this process. Enabled by '--entity-pool-size'
+    CLI option. Entities left in pool are deleted at the end.
+
+    Without pytest-xdist pool is warmed up for all selected tests.
+    Worker of pytest-xdist collects the whole suite and gets its tests
+    one by one, so pool is warmed up for the next test of the worker
+    only."""
+    size = request.config.getoption("--entity-pool-size")
+    if not size:
+        yield None
+        return
+
+    pool = EntityPool(
+        base_url, SUPERADMIN_USERNAME, SUPERADMIN_PASSWORD, size
+    )
+
+    stash = request.config.stash
+    if worker_id == "master":
+        pool.warm_up(get_entity_demand(request.session.items))
+    else:
+        next_item = stash.get(NEXT_ITEM_KEY, None)
+        pool.warm_up(get_entity_demand([next_item] if next_item else []))
+        stash[LOOKAHEAD_POOL_KEY] = pool
+
+    yield pool
+
+    if LOOKAHEAD_POOL_KEY in stash:
+        del stash[LOOKAHEAD_POOL_KEY]
+
+    leftovers = pool.close()
+    logging.info("[Fixture] Removing %s pooled entities", len(leftovers))
+    if deletion_queue is not None:
+        deletion_queue.put_many(leftovers)
+        return
+
+    api.delete_entities_parallel(
+        leftovers, base_url, SUPERADMIN_USERNAME, SUPERADMIN_PASSWORD
+    )
+
+
 @allure.step("Create new admin user via API request")
 @pytest.fixture
-def new_admin_user(base_url: str) -> Generator[BackOfficeEntity, None, None]:
+def new_admin_user(
+    request,
+    base_url: str,
+    entity_pool: EntityPool | None,
+    deletion_queue: DeletionQueue | None
+) -> Generator[BackOfficeEntity, None, None]:
     """Creates new admin user by API call"""
     yield from api.get_new_entity(
         entity_type=EntityType.USER,
-        options=None,
+        options=get_entity_options(request.node, "new_admin_user"),
         base_url=base_url,
         username=SUPERADMIN_USERNAME,
-        password=SUPERADMIN_PASSWORD
+        password=SUPERADMIN_PASSWORD,
+        pool=entity_pool,
+        deletion_queue=deletion_queue
     )
 
 
 @pytest.fixture
-def new_geozone(request, base_url: str) -> Generator[BackOfficeEntity, None, None]:
+def new_geozone(
+    request,
+    base_url: str,
+    entity_pool: EntityPool | None,
+    deletion_queue: DeletionQueue | None
+) -> Generator[BackOfficeEntity, None, None]:
     """Generates new geozone entity for tests and handling
     it's deletion afterwards"""
-    options = {
-        "add_countries": None
-    }
-    marker = request.node.get_closest_marker("new_geozone_options")
-    if marker and marker.kwargs:
-        options.update(marker.kwargs)
-
     yield from api.get_new_entity(
         entity_type=EntityType.GEOZONE,
-        options=options,
+        options=get_entity_options(request.node, "new_geozone"),
         base_url=base_url,
         username=SUPERADMIN_USERNAME,
-        password=SUPERADMIN_PASSWORD
+        password=SUPERADMIN_PASSWORD,
+        pool=entity_pool,
+        deletion_queue=deletion_queue
     )
 
 
 @pytest.fixture
-def new_product(request, base_url: str) -> Generator[BackOfficeEntity, None, None]:
+def new_product(
+    request,
+    base_url: str,
+    entity_pool: EntityPool | None,
+    deletion_queue: DeletionQueue | None
+) -> Generator[BackOfficeEntity, None, None]:
     """Generates new product entity for tests and handling
     it's deletion afterwards"""
+    yield from api.get_new_entity(
+        entity_type=EntityType.PRODUCT,
+        options=get_entity_options(request.node, "new_product"),
+        base_url=base_url,
+        username=SUPERADMIN_USERNAME,
+        password=SUPERADMIN_PASSWORD,
+        pool=entity_pool,
+        deletion_queue=deletion_queue
+    )
+
+
+@pytest.fixture
+def new_products(
+    request, base_url: str, deletion_queue: DeletionQueue | None
+) -> Generator[list[BackOfficeEntity], None, None]:
+    """Creates several product entities (10 by default) for tests
+    by concurrent API calls and handles their deletion afterwards
+    (or passes them to deletion queue).
+    Number of products and options are set by 'new_products_options'
+    marker"""
     options = {
         "add_images": None
     }
 
-    marker = request.node.get_closest_marker("new_product_options")
+    marker = request.node.get_closest_marker("new_products_options")
     if marker and marker.kwargs:
         options.update(marker.kwargs)
+    count = options.pop("count", 10)
 
-    yield from api.get_new_entity(
+    products = api.create_entities(
         entity_type=EntityType.PRODUCT,
+        count=count,
         options=options,
         base_url=base_url,
         username=SUPERADMIN_USERNAME,
         password=SUPERADMIN_PASSWORD
     )
 
+    yield products
+
+    logging.info("On Teardown: deleting %s products", len(products))
+    if deletion_queue is not None:
+        deletion_queue.put_many(products)
+        return
+
+    api.delete_entities_parallel(
+        products, base_url, SUPERADMIN_USERNAME, SUPERADMIN_PASSWORD
+    )
+
 
 @pytest.fixture
-def handle_entities(base_url: str) -> Generator[list[BackOfficeEntity], None, None]:
+def handle_entities(
+    base_url: str, deletion_queue: DeletionQueue | None
+) -> Generator[list[BackOfficeEntity], None, None]:
     """Deletes object of BackOfficeEntity (e.g. GeozoneEntity,
-    ProductEntity) after a test"""
+    ProductEntity) after a test (or passes them to deletion queue)"""
     pool: list[BackOfficeEntity] = []
     yield pool
 
@@ -124,6 +408,10 @@ def handle_entities(base_url: str) -> Generator[list[BackOfficeEntity], None, No
     logging.info(
         "[Fixture] Removing entities created during test: %s", entities
     )
+    if deletion_queue is not None:
+        deletion_queue.put_many(entities)
+        return
+
     api.delete_entities(
         entities, base_url, SUPERADMIN_USERNAME, SUPERADMIN_PASSWORD
     )
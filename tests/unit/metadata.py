@@ -0,0 +1,5 @@
+"""Metadata for tests in package"""
+
+EPIC = "Framework"
+FEATURE = "Helpers"
+STORY = "Offline checks"
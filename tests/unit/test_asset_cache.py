@@ -0,0 +1,78 @@
+"""
+Framework / Helpers / Static assets are served from cache
+"""
+import pathlib
+from unittest.mock import MagicMock
+
+import allure  # type: ignore
+
+from utils.asset_cache import AssetCache
+
+from .metadata import EPIC, FEATURE, STORY
+
+ASSET_URL = "http://localhost/litecart/assets/app.css"
+
+
+def make_route(status: int, body: bytes = b"") -> MagicMock:
+    """Returns route of stylesheet request, which is fetched
+    with given response"""
+    route = MagicMock()
+    route.request.method = "GET"
+    route.request.resource_type = "stylesheet"
+    route.request.url = ASSET_URL
+    route.request.headers = {}
+    route.fetch.return_value.status = status
+    route.fetch.return_value.headers = {"etag": f'"{len(body)}"'}
+    route.fetch.return_value.body.return_value = body
+    return route
+
+
+def make_cache(path: pathlib.Path, body: bytes) -> AssetCache:
+    """Returns cache with asset stored by previous run"""
+    cache = AssetCache(path, 1024)
+    cache._handle(make_route(200, body))  # pylint: disable=protected-access
+    cache.close()
+    return AssetCache(path, 1024)
+
+
+@allure.title("Asset of previous run is served, if it's not modified")
+@allure.epic(EPIC)
+@allure.feature(FEATURE)
+@allure.story(STORY)
+def test_not_modified(tmp_path: pathlib.Path):
+    """Tests that asset is served from disk after 304 response"""
+    cache = make_cache(tmp_path, b"old")
+    route = make_route(304)
+
+    cache._handle(route)  # pylint: disable=protected-access
+
+    route.fetch.assert_called_once()
+    route.fulfill.assert_called_once_with(
+        status=200, headers={"etag": '"3"'}, body=b"old"
+    )
+    assert cache.stats["revalidated"] == 1
+
+
+@allure.title("Modified asset of previous run is fetched once")
+@allure.epic(EPIC)
+@allure.feature(FEATURE)
+@allure.story(STORY)
+def test_modified(tmp_path: pathlib.Path):
+    """Tests that response of revalidation is served and stored,
+    when asset was modified"""
+    cache = make_cache(tmp_path, b"old")
+    route = make_route(200, b"new content")
+
+    cache._handle(route)  # pylint: disable=protected-access
+
+    route.fetch.assert_called_once()
+    route.fulfill.assert_called_once_with(response=route.fetch.return_value)
+    assert cache.stats["misses"] == 1
+
+    cached_route = make_route(304)
+    cache._handle(cached_route)  # pylint: disable=protected-access
+
+    cached_route.fetch.assert_not_called()
+    cached_route.fulfill.assert_called_once_with(
+        status=200, headers={"etag": '"11"'}, body=b"new content"
+    )
@@ -0,0 +1,37 @@
+"""
+Framework / Helpers / Golden snapshots are looked up like the plugin does
+"""
+import sys
+from unittest.mock import MagicMock
+
+import allure  # type: ignore
+import pytest
+
+from utils.snapshot_hash import get_golden_path
+
+from .metadata import EPIC, FEATURE, STORY
+
+
+@allure.title("Golden snapshot path matches pytest-playwright-visual")
+@allure.epic(EPIC)
+@allure.feature(FEATURE)
+@allure.story(STORY)
+@pytest.mark.parametrize(
+    "file_name, snapshots_dir",
+    (
+        ("test_login.py", "test_login"),
+        ("test_copy.py", "test_co"),
+        ("pytest_page.py", "test_page"),
+    ),
+)
+def test_golden_path(file_name: str, snapshots_dir: str):
+    """Tests that snapshots directory of the test file is derived
+    by the plugin's rule (stripping chars of '.py' from both ends)"""
+    request = MagicMock()
+    request.node.fspath = f"/suite/{file_name}"
+    request.node.name = "test_form[chromium]"
+
+    assert get_golden_path(request).as_posix().endswith(
+        f"/suite/snapshots/{snapshots_dir}/test_form/"
+        f"test_form[chromium][{sys.platform}].png"
+    )
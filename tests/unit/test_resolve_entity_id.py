@@ -0,0 +1,140 @@
+"""
+Framework / Helpers / ID of created entity is resolved from API response
+"""
+import logging
+
+import allure  # type: ignore
+import pytest
+import requests
+
+from utils.api_helpers import REQUESTS_PER_ENTITY_TYPE, resolve_entity_id
+from utils.models.admin_geozone import GeozoneEntity
+from utils.models.entitiy_types import EntityType
+
+from .metadata import EPIC, FEATURE, STORY
+
+GEOZONE_MAPPING = REQUESTS_PER_ENTITY_TYPE[EntityType.GEOZONE]
+
+# Redirect of Litecart after saving of the geo zone (to the listing)
+LISTING_LOCATION = (
+    "http://localhost/litecart/admin/?app=geo_zones&doc=geo_zones"
+)
+
+# Listing of geo zones (rows of the table, as rendered by Litecart)
+EDIT_URL = (
+    "http://localhost/litecart/admin/?app=geo_zones"
+    "&amp;doc=edit_geo_zone&amp;geo_zone_id={id}"
+)
+LISTING_ROW = f"""
+<tr>
+  <td><input type="checkbox" name="geo_zones[{{id}}]" value="{{id}}"></td>
+  <td>{{id}}</td>
+  <td><a class="link" href="{EDIT_URL}">{{name}}</a></td>
+  <td>0</td>
+  <td class="text-end">
+    <a class="btn btn-default btn-sm" href="{EDIT_URL}" title="Edit">
+      <i class="fa fa-pencil"></i>
+    </a>
+  </td>
+</tr>"""
+
+
+def make_response(
+    rows: list[tuple[int, str]], locations: tuple[str, ...] = ()
+) -> requests.Response:
+    """Returns response of create request with given redirects
+    and listing of entities (ID and HTML of the name)"""
+    history = []
+    for location in locations:
+        redirect = requests.Response()
+        redirect.status_code = 302
+        redirect.headers["Location"] = location
+        history.append(redirect)
+
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response.history = history
+    response._content = (  # pylint: disable=protected-access
+        "<table><tbody>"
+        + "".join(LISTING_ROW.format(id=id_, name=name) for id_, name in rows)
+        + "</tbody></table>"
+    ).encode("utf-8")
+    return response
+
+
+@allure.title("ID is resolved from redirect's Location")
+@allure.epic(EPIC)
+@allure.feature(FEATURE)
+@allure.story(STORY)
+def test_id_from_location():
+    """Tests that ID parameter of redirect's Location is preferred
+    over the listing"""
+    response = make_response(
+        [(3, "Zone")],
+        (
+            "http://localhost/litecart/admin/?app=geo_zones"
+            "&doc=edit_geo_zone&geo_zone_id=17",
+        )
+    )
+    entity = GeozoneEntity(entity_id=None, name="Zone")
+
+    assert resolve_entity_id(response, GEOZONE_MAPPING, entity) == 17
+
+
+@allure.title("ID is resolved from listing by escaped name")
+@allure.epic(EPIC)
+@allure.feature(FEATURE)
+@allure.story(STORY)
+@pytest.mark.parametrize(
+    "name, html_name",
+    (
+        ("Zone A", "Zone A"),
+        ('Zone "A" & <B>', "Zone &quot;A&quot; &amp; &lt;B&gt;"),
+        ("Zone's", "Zone&#039;s"),
+    ),
+)
+def test_id_from_listing(name: str, html_name: str):
+    """Tests that ID is taken from the link with entity's name,
+    when Location has no ID"""
+    response = make_response(
+        [(3, "Other"), (4, html_name), (5, f"{html_name} 2")],
+        (LISTING_LOCATION,)
+    )
+    entity = GeozoneEntity(entity_id=None, name=name)
+
+    assert resolve_entity_id(response, GEOZONE_MAPPING, entity) == 4
+
+
+@allure.title("The newest of entities with duplicate names is taken")
+@allure.epic(EPIC)
+@allure.feature(FEATURE)
+@allure.story(STORY)
+def test_duplicate_names(caplog: pytest.LogCaptureFixture):
+    """Tests that the newest entity is taken and warning is logged,
+    when several entities have the same name"""
+    response = make_response(
+        [(12, "Zone"), (5, "Zone"), (7, "Other")], (LISTING_LOCATION,)
+    )
+    entity = GeozoneEntity(entity_id=None, name="Zone")
+
+    with caplog.at_level(logging.WARNING):
+        assert resolve_entity_id(response, GEOZONE_MAPPING, entity) == 12
+
+    assert "Several entities match" in caplog.text
+    assert "[5, 12]" in caplog.text
+
+
+@allure.title("ID is not resolved if there is no link to entity")
+@allure.epic(EPIC)
+@allure.feature(FEATURE)
+@allure.story(STORY)
+def test_missing_link():
+    """Tests that None is returned, when listing has no link
+    with entity's name"""
+    response = make_response(
+        [(3, "Other"), (4, "Zone 2")], (LISTING_LOCATION,)
+    )
+    entity = GeozoneEntity(entity_id=None, name="Zone")
+
+    assert resolve_entity_id(response, GEOZONE_MAPPING, entity) is None
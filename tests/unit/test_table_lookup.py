@@ -0,0 +1,142 @@
+"""
+Framework / Helpers / Entries are looked up in table snapshots
+"""
+from unittest.mock import MagicMock
+
+import allure  # type: ignore
+import pytest
+
+from utils.elements import Table
+from utils.models.admin_geozone import CountryZoneEntity, GeozoneEntity
+from utils.models.table_snapshot import TableSnapshot
+from utils.pages.geozones.admin_geozones_page import AdminGeozonesPage
+
+from .metadata import EPIC, FEATURE, STORY
+
+LISTING_URL = "http://localhost/litecart/admin/?app=geo_zones&doc=geo_zones"
+
+
+def make_snapshot(
+    rows: list[tuple[int, str, int]],
+    url: str = LISTING_URL,
+    next_page_url: str | None = None
+) -> TableSnapshot:
+    """Returns snapshot of Geo Zones table with given rows
+    (ID, name and number of zones)"""
+    id_st, name_st, zones_st = AdminGeozonesPage(
+        MagicMock()
+    ).table_row_lookup_strategy
+    columns = [
+        [str(id_) for id_, _, _ in rows],
+        [name for _, name, _ in rows],
+        [str(zones) for _, _, zones in rows],
+    ]
+    return TableSnapshot(
+        url=url,
+        next_page_url=next_page_url,
+        row_count=len(rows),
+        headers=["ID", "Name", "Zones"],
+        texts=columns,
+        values=[columns[0], [None] * len(rows), [None] * len(rows)],
+        hidden=[[] for _ in rows],
+        links=[[] for _ in rows],
+        derived=dict(zip((id_st.key, name_st.key, zones_st.key), columns))
+    )
+
+
+def make_geozone(name: str, zones: int, entity_id: int | None = None):
+    """Returns Geo Zone entity with given number of zones"""
+    return GeozoneEntity(
+        entity_id=entity_id,
+        name=name,
+        zones=[CountryZoneEntity("US") for _ in range(zones)]
+    )
+
+
+@pytest.fixture
+def read_snapshots(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replaces reading of the table from the browser, returns mock
+    to set snapshots to read (in order of reads)"""
+    read = MagicMock()
+    monkeypatch.setattr(
+        Table, "_read_snapshot",
+        lambda self, table, keys: read(table, keys)
+    )
+    return read
+
+
+@allure.title("Several entries are found by single read of the table")
+@allure.epic(EPIC)
+@allure.feature(FEATURE)
+@allure.story(STORY)
+def test_find_many(read_snapshots: MagicMock):
+    """Tests that entities are found in the table, IDs are updated
+    and table is read once"""
+    read_snapshots.return_value = make_snapshot(
+        [(3, "Zone A", 1), (4, "Zone B", 2), (5, "Zone C", 0)]
+    )
+    entities = [make_geozone("Zone C", 0), make_geozone("Zone A", 1)]
+
+    found = AdminGeozonesPage(MagicMock()).find_many(entities)
+
+    assert found == [(entities[0], 2), (entities[1], 0)]
+    assert [entity.entity_id for entity in entities] == [5, 3]
+    assert read_snapshots.call_count == 1
+
+
+@allure.title("Entry found by ID should match by the rest of fields")
+@allure.epic(EPIC)
+@allure.feature(FEATURE)
+@allure.story(STORY)
+def test_find_many_mismatch(read_snapshots: MagicMock):
+    """Tests that entry matched by primary key fails, when other
+    fields differ"""
+    read_snapshots.return_value = make_snapshot(
+        [(3, "Zone A", 1), (4, "Zone B", 2)]
+    )
+    entities = [make_geozone("Zone B", 3, entity_id=4)]
+
+    with pytest.raises(AssertionError, match="zones: expected '3'"):
+        AdminGeozonesPage(MagicMock()).find_many(entities)
+
+
+@allure.title("Entry is found on the next page of the table")
+@allure.epic(EPIC)
+@allure.feature(FEATURE)
+@allure.story(STORY)
+def test_find_entry_in_pages(read_snapshots: MagicMock):
+    """Tests that pages are read until entry is found"""
+    next_url = f"{LISTING_URL}&page=2"
+    read_snapshots.side_effect = [
+        make_snapshot([(3, "Zone A", 1)], next_page_url=next_url),
+        make_snapshot([(4, "Zone B", 2)], next_url, f"{LISTING_URL}&page=3"),
+    ]
+    page = AdminGeozonesPage(MagicMock())
+
+    assert page.table.find_entry_in_pages(
+        make_geozone("Zone B", 2), page.table_row_lookup_strategy
+    ) == (next_url, 0)
+    assert read_snapshots.call_count == 2
+    page.page.context.new_page.return_value.close.assert_called_once()
+
+
+@allure.title("Entry is not found on any page of the table")
+@allure.epic(EPIC)
+@allure.feature(FEATURE)
+@allure.story(STORY)
+def test_find_entry_in_pages_missing(read_snapshots: MagicMock):
+    """Tests that error lists content of the last page, when entry
+    is not found on any page"""
+    read_snapshots.side_effect = [
+        make_snapshot([(3, "Zone A", 1)], next_page_url=f"{LISTING_URL}&p=2"),
+        make_snapshot([(4, "Zone B", 2)], f"{LISTING_URL}&p=2"),
+    ]
+    page = AdminGeozonesPage(MagicMock())
+
+    with pytest.raises(ValueError, match="any page of the Geo Zones") as err:
+        page.table.find_entry_in_pages(
+            make_geozone("Zone C", 2), page.table_row_lookup_strategy
+        )
+
+    assert "Zone B" in str(err.value)
+    assert read_snapshots.call_count == 2
@@ -1,16 +1,26 @@
 """Collection of helpers to access API"""
+import html
 import logging
-from typing import Any
-from collections.abc import Generator, Callable
-from functools import cache
+import re
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from collections.abc import Generator, Callable, Sequence
 
 import allure  # type: ignore
 import requests
 
+from constants import API_MAX_WORKERS
+from utils.api_session import AdminApiSession, sessions
 from utils.models.base_entity import BackOfficeEntity
 from utils.models.entitiy_types import EntityType, EntityApiMapping
 from utils import helpers
 
+if TYPE_CHECKING:
+    from utils.deletion_queue import DeletionQueue
+    from utils.entity_pool import EntityPool
 
 GENERATOR_FUNCTIONS_PER_TYPE: \
     dict[EntityType, Callable[..., BackOfficeEntity]] = \
@@ -23,27 +33,39 @@ GENERATOR_FUNCTIONS_PER_TYPE: \
 REQUESTS_PER_ENTITY_TYPE: dict[EntityType, EntityApiMapping] = {
         EntityType.USER: EntityApiMapping(
             create_url="/admin/?app=users&doc=edit_user",
-            delete_url="/admin/?app=users&doc=edit_user&user_id={entity_id}"
+            delete_url="/admin/?app=users&doc=edit_user&user_id={entity_id}",
+            id_param="user_id",
+            lookup_field="username"
         ),
         EntityType.GEOZONE: EntityApiMapping(
             create_url="/admin/?app=geo_zones&doc=edit_geo_zone",
             delete_url="/admin/?app=geo_zones&doc=edit_geo_zone"
-                       "&geo_zone_id={entity_id}"
+                       "&geo_zone_id={entity_id}",
+            id_param="geo_zone_id"
         ),
         EntityType.PRODUCT: EntityApiMapping(
             create_url="/admin/?category_id=0&app=catalog&doc=edit_product",
             delete_url="/admin/?app=catalog&doc=edit_product&category_id=0"
                        "&product_id={entity_id}",
-            create_as_url_form=False
+            create_as_url_form=False,
+            id_param="product_id"
         )
     }
 
 
-@cache
+@dataclass
+class ApiCallResult:
+    """Result of API call made for entity in bulk operation"""
+    entity: BackOfficeEntity
+    latency: float
+    error: Exception | None = None
+
+
 def prepare_logged_admin_session(
     base_url: str, username: str, password: str
-) -> requests.Session:
-    """Logins using given creds and retun authorized session.
+) -> AdminApiSession:
+    """Retuns authorized session for given creds.
+    Session is shared between threads and logs in on first use.
 
     Args:
         base_url (str): URL of API.
@@ -51,39 +73,22 @@ def prepare_logged_admin_session(
         password (str): password to use.
 
     Returns:
-        requests.Session: authorized session.
+        AdminApiSession: authorized session.
     """
-    session = requests.session()
-
-    base_url = base_url.rstrip("/")
-    session.post(
-        f"{base_url}/admin/login.php",
-        data={
-            "redirect_url": "",
-            "login": "Login",
-            "username": username,
-            "password": password
-        },
-        allow_redirects=False,
-        timeout=10,
-    )
-
-    return session
+    return sessions.get(base_url, username, password)
 
 
 def create_entity_request(
     entity_type: EntityType,
     entity: BackOfficeEntity,
-    session: requests.Session,
-    base_url: str
+    session: AdminApiSession
 ) -> None:
-    """API request to create new product from provided ProductEntity."""
+    """API request to create new entity from provided entity.
+    On success - entity's ID is resolved from API response."""
     request_mapping = REQUESTS_PER_ENTITY_TYPE[entity_type]
-    request_url = request_mapping.create_url
 
     request_params: dict[str, Any] = {
-        "url": f"{base_url}{request_url}",
-        "timeout": 10
+        "path": request_mapping.create_url
     }
 
     if request_mapping.create_as_url_form:
@@ -105,6 +110,81 @@ def create_entity_request(
 
     logging.info("Entity creation API call succeeded!")
 
+    entity.entity_id = resolve_entity_id(response, request_mapping, entity)
+    if entity.entity_id is None:
+        logging.warning(
+            "Failed to resolve ID of created entity %s from API response",
+            entity
+        )
+
+
+def resolve_entity_id(
+    response: requests.Response,
+    request_mapping: EntityApiMapping,
+    entity: BackOfficeEntity
+) -> int | None:
+    """Resolves ID of created entity from response of create request:
+    from redirect's Location (if it contains ID parameter), otherwise
+    from the table of entities on page where API redirects to after
+    creation (link to edit form with entity's lookup field as a text).
+    If several entities are matching - the newest one is selected
+    and warning is logged.
+
+    Args:
+        response (requests.Response): response of create request.
+        request_mapping (EntityApiMapping): API mapping of entity's type.
+        entity (BackOfficeEntity): created entity.
+
+    Returns:
+        int | None: ID of entity or None if ID can't be resolved.
+    """
+    id_param = request_mapping.id_param
+    if not id_param:
+        return None
+
+    id_in_url = re.compile(rf"[?&;]{id_param}=(\d+)")
+    for redirect in response.history:
+        found = id_in_url.search(redirect.headers.get("Location", ""))
+        if found:
+            return int(found.group(1))
+
+    lookup_value = entity.get_lookup_params().get(request_mapping.lookup_field)
+    if lookup_value is None:
+        return None
+
+    # Link like: <a href="...&amp;geo_zone_id=5">Name</a>
+    # (text is compared unescaped, as escaping of quotes may vary)
+    link_pattern = re.compile(
+        rf"[?&;]{id_param}=(\d+)[^\"']*[\"'][^>]*>([^<]*)<"
+    )
+    found_ids = sorted({
+        int(value) for value, text in link_pattern.findall(response.text)
+        if html.unescape(text).strip() == str(lookup_value)
+    })
+    if not found_ids:
+        return None
+
+    if len(found_ids) > 1:
+        logging.warning(
+            "Several entities match %s=%r (IDs: %s), the newest one "
+            "is taken as ID of created entity",
+            request_mapping.lookup_field, lookup_value, found_ids
+        )
+
+    return found_ids[-1]
+
+
+def generate_entity(
+    entity_type: EntityType,
+    options: dict[str, Any] | None
+) -> BackOfficeEntity:
+    """Generates entity of given type using generator options"""
+    entity_generator = GENERATOR_FUNCTIONS_PER_TYPE[entity_type]
+    if options is not None:
+        return entity_generator(**options)
+
+    return entity_generator()
+
 
 def get_new_entity(
     entity_type: EntityType,
@@ -112,11 +192,15 @@ def get_new_entity(
     base_url: str,
     username: str,
     password: str,
+    pool: "EntityPool | None" = None,
+    deletion_queue: "DeletionQueue | None" = None
 ) -> Generator[BackOfficeEntity, None, None]:
     """Creates entity of supported entity type using API
-    request, returns entity to a fixture (and test),
+    request (or takes pre-created entity from the pool),
+    returns entity to a fixture (and test),
     on teardown - deletes entity by another API call
-    (if entity_id was reqtrieved from)
+    (if entity_id was reqtrieved from) or passes entity
+    to the deletion queue
 
     Args:
         entity_type (EntityType): type of the entity to create.
@@ -124,31 +208,202 @@ def get_new_entity(
         base_url (str): host of the API.
         username (str): admin username to use.
         password (str): admin password to user.
+        pool (EntityPool, optional): pool of pre-created entities.
+        Defaults to None (entity is created on call).
+        deletion_queue (DeletionQueue, optional): queue to delete entity
+        in background. Defaults to None (entity is deleted on teardown).
 
     Yields:
         BackOfficeEntity: generated entity that was created on backend.
     """
-    entity_generator = GENERATOR_FUNCTIONS_PER_TYPE[entity_type]
-    if options is not None:
-        entity = entity_generator(**options)
+    session = prepare_logged_admin_session(
+        base_url, username, password
+    )
+
+    if pool is not None:
+        entity = pool.acquire(entity_type, options)
     else:
-        entity = entity_generator()
+        entity = generate_entity(entity_type, options)
+        logging.info(
+            "Creating new %s entity for test: %s",
+            entity_type.value,
+            entity
+        )
+        create_entity_request(entity_type, entity, session)
+
+    yield entity
+
+    if deletion_queue is not None:
+        deletion_queue.put(entity)
+        return
+
+    logging.info("On Teardown: deleting entity %s", entity)
+    delete_entity(entity, session)
 
+
+def create_entities(
+    entity_type: EntityType,
+    count: int,
+    options: dict[str, Any] | None,
+    base_url: str,
+    username: str,
+    password: str,
+    max_workers: int = API_MAX_WORKERS
+) -> list[BackOfficeEntity]:
+    """Creates several entities of given type using concurrent API
+    requests. Latency of each request is reported to log and Allure.
+
+    If any of requests fails - created entities are deleted and
+    error is raised.
+
+    Args:
+        entity_type (EntityType): type of the entities to create.
+        count (int): number of entities to create.
+        options (dict[str, Any]): options for entity generator.
+        base_url (str): host of the API.
+        username (str): admin username to use.
+        password (str): admin password to user.
+        max_workers (int, optional): max number of concurrent requests.
+        Defaults to API_MAX_WORKERS.
+
+    Raises:
+        RuntimeError: if any of entities failed to be created.
+
+    Returns:
+        list[BackOfficeEntity]: entities created on backend.
+    """
+    entities = [generate_entity(entity_type, options) for _ in range(count)]
     logging.info(
-        "Creating new %s entity for test: %s",
-        entity_type.value,
-        entity
+        "Creating %s new %s entities for test", count, entity_type.value
     )
 
-    session = prepare_logged_admin_session(
-        base_url, username, password
+    session = prepare_logged_admin_session(base_url, username, password)
+    results = run_concurrently(
+        lambda entity: create_entity_request(entity_type, entity, session),
+        entities,
+        max_workers
     )
-    create_entity_request(entity_type, entity, session, base_url)
+    report_latencies(f"Create {count} {entity_type.value} entities", results)
 
-    yield entity
+    failed = [result for result in results if result.error is not None]
+    if not failed:
+        return entities
 
-    logging.info("On Teardown: deleting entity %s", entity)
-    delete_entity(entity, session, base_url)
+    delete_entities_parallel(
+        [result.entity for result in results if result.error is None],
+        base_url, username, password, max_workers
+    )
+    raise RuntimeError(
+        f"Failed to create {len(failed)} of {count} entities by API call. "
+        f"First error: {failed[0].error!r}"
+    )
+
+
+def delete_entities_parallel(
+    entities: Sequence[BackOfficeEntity],
+    base_url: str,
+    username: str,
+    password: str,
+    max_workers: int = API_MAX_WORKERS
+) -> list[BackOfficeEntity]:
+    """Performs Delete requests to API for given entities concurrently.
+    Entities without entity_id are skipped.
+
+    Args:
+        entities (Sequence[BackOfficeEntity]): entities to delete.
+        base_url (str): host of the API.
+        username (str): admin username to use.
+        password (str): admin password to user.
+        max_workers (int, optional): max number of concurrent requests.
+        Defaults to API_MAX_WORKERS.
+
+    Returns:
+        list[BackOfficeEntity]: entities that failed to be deleted
+        (request error or HTTP error status).
+    """
+    entities = [entity for entity in entities if entity.entity_id]
+    if not entities:
+        return []
+
+    logging.info("Deleting %s entities", len(entities))
+    session = prepare_logged_admin_session(base_url, username, password)
+    results = run_concurrently(
+        # HTTP errors are counted as failures, like in DeletionQueue
+        lambda entity: delete_entity(entity, session).raise_for_status(),
+        entities,
+        max_workers
+    )
+    report_latencies(f"Delete {len(entities)} entities", results)
+
+    failed = []
+    for result in results:
+        if result.error is None:
+            continue
+        logging.warning(
+            "Failed to delete entity %s: %r", result.entity, result.error
+        )
+        failed.append(result.entity)
+
+    return failed
+
+
+def run_concurrently(
+    func: Callable[[BackOfficeEntity], Any],
+    entities: Sequence[BackOfficeEntity],
+    max_workers: int
+) -> list[ApiCallResult]:
+    """Calls given function for each entity using thread pool
+    and measures latency of each call.
+
+    Note: func should not use Allure steps/attachments, as
+    those are not supported in threads.
+
+    Returns:
+        list[ApiCallResult]: results in order of given entities.
+    """
+    def timed_call(entity: BackOfficeEntity) -> ApiCallResult:
+        started = time.perf_counter()
+        try:
+            func(entity)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            return ApiCallResult(entity, time.perf_counter() - started, err)
+
+        return ApiCallResult(entity, time.perf_counter() - started)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(entities))),
+        thread_name_prefix="api"
+    ) as executor:
+        return list(executor.map(timed_call, entities))
+
+
+def report_latencies(title: str, results: Sequence[ApiCallResult]) -> None:
+    """Logs summary of API calls latencies and attaches
+    latency of each call to Allure report"""
+    if not results:
+        return
+
+    latencies = [result.latency for result in results]
+    logging.info(
+        "%s: %s requests, %s failed, latency min/median/max = "
+        "%.3f/%.3f/%.3f sec",
+        title,
+        len(results),
+        sum(1 for result in results if result.error is not None),
+        min(latencies),
+        statistics.median(latencies),
+        max(latencies)
+    )
+
+    allure.attach(
+        "\n".join(
+            f"{result.latency:.3f} sec - "
+            f"{'FAILED' if result.error else 'OK'} - {result.entity!r}"
+            for result in results
+        ),
+        f"{title} (latency)",
+        allure.attachment_type.TEXT
+    )
 
 
 def delete_entities(
@@ -168,14 +423,15 @@ def delete_entities(
         with allure.step(
             f"Sending API request to delete entity {entity}"
         ):
-            delete_entity(entity, session, base_url)
+            delete_entity(entity, session)
 
 
 def delete_entity(
     entity: BackOfficeEntity,
-    session: requests.Session, base_url: str
-):
-    """Deletes entity using request selected by entity class"""
+    session: AdminApiSession
+) -> requests.Response:
+    """Deletes entity using request selected by entity class.
+    Returns response of API."""
     request_mapping = REQUESTS_PER_ENTITY_TYPE[entity.entity_type]
     request_url = request_mapping.delete_url
     if not isinstance(request_url, str):
@@ -186,8 +442,7 @@ def delete_entity(
 
     request_url = request_url.format(entity_id=entity.entity_id)
 
-    session.post(
-        f"{base_url}{request_url}",
-        data={"delete": "Delete"},
-        timeout=10,
+    return session.post(
+        request_url,
+        data={"delete": "Delete"}
     )
@@ -0,0 +1,298 @@
+"""Pooled, thread-safe sessions of logged in admin to access API"""
+import logging
+import threading
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from constants import API_POOL_SIZE, API_REQUEST_RETRIES, API_REQUEST_TIMEOUT
+
+LOGIN_PATH = "/admin/login.php"
+
+
+class AdminApiSession:
+    """Session of logged in admin, that may be shared between threads.
+
+    Each thread uses it's own requests.Session, while keep-alive
+    connection pool and cookies are shared. Responses redirected
+    to login form are detected, then session logs in again and
+    repeats the request.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        pool_size: int = API_POOL_SIZE,
+        retries: int = API_REQUEST_RETRIES,
+        timeout: float = API_REQUEST_TIMEOUT
+    ) -> None:
+        """Instantiate session. Log in is performed on first request.
+
+        Args:
+            base_url (str): URL of API.
+            username (str): username to use.
+            password (str): password to use.
+            pool_size (int, optional): max number of keep-alive
+            connections. Defaults to API_POOL_SIZE.
+            retries (int, optional): number of retries on connection
+            errors (and on 502/503/504 responses of idempotent requests).
+            Defaults to API_REQUEST_RETRIES.
+            timeout (float, optional): default request timeout in seconds.
+            Defaults to API_REQUEST_TIMEOUT.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.timeout = timeout
+        self._password = password
+
+        # Connections are blocked until pool has free connection,
+        # so number of connections to server never exceeds pool size
+        self._adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            pool_block=True,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False
+            )
+        )
+        self._cookies = requests.cookies.RequestsCookieJar()
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+
+        self._lock = threading.Lock()
+        self._login_lock = threading.Lock()
+        self._login_generation = 0
+        self._counters = {"requests": 0, "logins": 0, "relogins": 0}
+
+    def __repr__(self) -> str:
+        return f"AdminApiSession({self.base_url}, user={self.username})"
+
+    @staticmethod
+    def is_logged_out_response(response: requests.Response) -> bool:
+        """Checks that response (or one of redirects) leads to login form"""
+        for resp in (*response.history, response):
+            if LOGIN_PATH in resp.headers.get("Location", ""):
+                return True
+
+        return LOGIN_PATH in response.url
+
+    def login(self) -> None:
+        """Logs in using session's credentials.
+
+        Raises:
+            RuntimeError: if API rejected credentials.
+        """
+        with self._login_lock:
+            self._login()
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Sends request to API. Logs in if session is not logged yet,
+        or logs in again if session was expired and repeats request.
+
+        Args:
+            method (str): HTTP method.
+            path (str): path relative to base URL (e.g. '/admin/?app=..').
+            **kwargs: any of requests.Session.request() arguments.
+
+        Returns:
+            requests.Response: response of API.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        url = f"{self.base_url}{path}"
+
+        generation = self._ensure_logged_in()
+        response = self._session().request(method, url, **kwargs)
+
+        if self.is_logged_out_response(response):
+            logging.info(
+                "%s: session was logged out, logging in again", self
+            )
+            self._relogin(generation)
+            self._rewind_files(kwargs.get("files"))
+            response = self._session().request(method, url, **kwargs)
+
+        self._count("requests")
+        return response
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        """Sends POST request to API (see .request())"""
+        return self.request("POST", path, **kwargs)
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        """Sends GET request to API (see .request())"""
+        return self.request("GET", path, **kwargs)
+
+    def stats(self) -> dict[str, int]:
+        """Returns statistics of the session and it's connection pool"""
+        with self._lock:
+            output = dict(self._counters)
+            output["threads"] = len(self._sessions)
+
+        pools = self._adapter.poolmanager.pools
+        connection_pools = [pools[key] for key in pools.keys()]
+        output["connections_created"] = sum(
+            pool.num_connections for pool in connection_pools
+        )
+        output["pool_requests"] = sum(
+            pool.num_requests for pool in connection_pools
+        )
+
+        return output
+
+    def close(self) -> None:
+        """Closes all thread sessions and connection pool"""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+            self._local = threading.local()
+
+        self._adapter.close()
+
+    def _session(self) -> requests.Session:
+        """Returns requests.Session of current thread"""
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            return session
+
+        session = requests.Session()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        session.cookies = self._cookies
+
+        self._local.session = session
+        with self._lock:
+            self._sessions.append(session)
+
+        return session
+
+    def _login(self) -> None:
+        self._cookies.clear()
+        response = self._session().post(
+            f"{self.base_url}{LOGIN_PATH}",
+            data={
+                "redirect_url": "",
+                "login": "Login",
+                "username": self.username,
+                "password": self._password
+            },
+            allow_redirects=False,
+            timeout=self.timeout,
+        )
+
+        if not response.is_redirect or self.is_logged_out_response(response):
+            raise RuntimeError(
+                f"Failed to log in to {self.base_url} as {self.username}. "
+                f"API returns code {response.status_code}."
+            )
+
+        self._login_generation += 1
+        self._count("logins")
+        logging.info("%s: logged in", self)
+
+    def _ensure_logged_in(self) -> int:
+        """Logs in if session was never logged in.
+        Returns current login generation."""
+        if not self._login_generation:
+            with self._login_lock:
+                if not self._login_generation:
+                    self._login()
+
+        return self._login_generation
+
+    def _relogin(self, generation: int) -> None:
+        """Logs in again, unless other thread already did it
+        after given login generation"""
+        with self._login_lock:
+            if self._login_generation != generation:
+                return
+            self._login()
+            self._count("relogins")
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    @staticmethod
+    def _rewind_files(files: Any) -> None:
+        """Rewinds file objects of multipart request to re-send them"""
+        if not isinstance(files, dict):
+            return
+
+        for value in files.values():
+            if not isinstance(value, tuple) or len(value) < 2:
+                continue
+            if hasattr(value[1], "seek"):
+                value[1].seek(0)
+
+
+class ApiSessionManager:
+    """Thread-safe registry of admin API sessions,
+    one session per base URL and username."""
+
+    def __init__(
+        self,
+        pool_size: int = API_POOL_SIZE,
+        retries: int = API_REQUEST_RETRIES,
+        timeout: float = API_REQUEST_TIMEOUT
+    ) -> None:
+        self.pool_size = pool_size
+        self.retries = retries
+        self.timeout = timeout
+
+        self._sessions: dict[tuple[str, str], AdminApiSession] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, base_url: str, username: str, password: str
+    ) -> AdminApiSession:
+        """Returns session for given base URL and user,
+        creates new one if needed.
+
+        Args:
+            base_url (str): URL of API.
+            username (str): username to use.
+            password (str): password to use.
+
+        Returns:
+            AdminApiSession: session of admin user.
+        """
+        key = (base_url.rstrip("/"), username)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = AdminApiSession(
+                    base_url, username, password,
+                    pool_size=self.pool_size,
+                    retries=self.retries,
+                    timeout=self.timeout
+                )
+                self._sessions[key] = session
+
+        return session
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Returns statistics of each session"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+
+        return {repr(session): session.stats() for session in sessions}
+
+    def close(self) -> None:
+        """Closes all sessions"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+
+sessions = ApiSessionManager()
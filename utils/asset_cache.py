@@ -0,0 +1,272 @@
+"""On-disk cache of static assets (CSS, JS, fonts, images) of the pages.
+Allows to download assets once per test worker instead of once per
+browser context (i.e. per test)."""
+import hashlib
+import json
+import logging
+import pathlib
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+from playwright.sync_api import APIResponse, Error, Page, Route
+
+# Resource types of requests that are served from cache
+CACHEABLE_RESOURCE_TYPES = frozenset(
+    ("stylesheet", "script", "font", "image")
+)
+
+# Response headers that are not valid for content served from disk
+# (body of fetched response is already decoded)
+SKIPPED_HEADERS = frozenset(
+    ("content-encoding", "content-length", "transfer-encoding", "date")
+)
+
+INDEX_FILENAME = "index.json"
+
+
+@dataclass
+class AssetEntry:
+    """Cached asset of the given URL.
+
+    Args:
+        digest (str): SHA-256 of the content (name of the blob file).
+        etag (str | None): ETag of the response, used to revalidate
+        entries loaded from previous runs.
+        size (int): size of the content in bytes.
+        headers (dict[str, str]): response headers to serve content with.
+        validated (bool): whether entry is known to be fresh
+        in the current session.
+    """
+    digest: str
+    etag: str | None
+    size: int
+    headers: dict[str, str]
+    validated: bool = False
+
+
+class AssetCache:
+    """Worker-level content-addressed store of static assets
+    with size-bounded LRU eviction.
+
+    Assets are keyed by URL; content is stored in blob files named
+    by SHA-256 of the content, so identical assets of different URLs
+    are stored once. Entries from previous runs are revalidated
+    by ETag once per session, then served from disk.
+    """
+
+    def __init__(self, path: pathlib.Path, max_size: int) -> None:
+        """Instantiate cache and load index of previous runs (if any).
+
+        Args:
+            path (pathlib.Path): directory to store assets in.
+            max_size (int): max total size of stored content in bytes.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "evicted": 0,
+            "bytes_served": 0,
+        }
+
+        self._entries: OrderedDict[str, AssetEntry] = OrderedDict()
+        self._blob_sizes: dict[str, int] = {}
+        self._load_index()
+
+    @property
+    def size(self) -> int:
+        """Total size of stored content in bytes"""
+        return sum(self._blob_sizes.values())
+
+    def install(self, page: Page) -> None:
+        """Installs route handler serving static assets from cache
+        to the page.
+
+        Note: should be installed before other route handlers,
+        which fall back to cache handler.
+        """
+        page.route("**/*", self._handle)
+
+    def uninstall(self, page: Page) -> None:
+        """Removes route handler from the page"""
+        page.unroute("**/*", self._handle)
+
+    def close(self) -> None:
+        """Saves index of the cache to disk"""
+        index = {url: asdict(entry) for url, entry in self._entries.items()}
+        for entry in index.values():
+            del entry["validated"]
+
+        try:
+            (self.path / INDEX_FILENAME).write_text(
+                json.dumps(index), "utf-8"
+            )
+        except OSError as err:
+            logging.warning("[AssetCache] Failed to save index: %s", err)
+
+    def _handle(self, route: Route) -> None:
+        """Serves static asset from cache, fetches and stores it
+        on cache miss"""
+        request = route.request
+        if (
+            request.method != "GET"
+            or request.resource_type not in CACHEABLE_RESOURCE_TYPES
+        ):
+            route.fallback()
+            return
+
+        url = request.url
+        entry = self._entries.get(url)
+        response = None
+        if entry is not None and not entry.validated:
+            entry, response = self._revalidate(route, url, entry)
+
+        if entry is not None and self._serve(route, url, entry):
+            return
+
+        self.stats["misses"] += 1
+        if response is None:
+            try:
+                response = route.fetch()
+            except Error as err:
+                logging.debug(
+                    "[AssetCache] Failed to fetch %s: %s", url, err
+                )
+                route.fallback()
+                return
+
+        if response.status == 200 and "no-store" not in response.headers.get(
+            "cache-control", ""
+        ):
+            self._store(url, response.headers, response.body())
+
+        route.fulfill(response=response)
+
+    def _serve(self, route: Route, url: str, entry: AssetEntry) -> bool:
+        """Fulfills request with cached content of the entry.
+        Returns False (and drops entry) if content is missing."""
+        body = self._read_blob(entry.digest)
+        if body is None:
+            self._remove(url)
+            return False
+
+        self._entries.move_to_end(url)
+        self.stats["hits"] += 1
+        self.stats["bytes_served"] += entry.size
+        route.fulfill(status=200, headers=entry.headers, body=body)
+        return True
+
+    def _revalidate(
+        self, route: Route, url: str, entry: AssetEntry
+    ) -> tuple[AssetEntry | None, APIResponse | None]:
+        """Checks entry loaded from previous run by ETag.
+        Returns entry if it's still fresh, otherwise drops it and
+        returns response of revalidation (if any) to serve instead
+        of fetching the asset again."""
+        response = None
+        if entry.etag is not None:
+            try:
+                response = route.fetch(
+                    headers={
+                        **route.request.headers,
+                        "if-none-match": entry.etag
+                    }
+                )
+            except Error:
+                response = None
+
+            if response is not None and response.status == 304:
+                self.stats["revalidated"] += 1
+                entry.validated = True
+                return entry, None
+
+        self._remove(url)
+        return None, response
+
+    def _store(self, url: str, headers: dict[str, str], body: bytes) -> None:
+        """Stores content of the asset and evicts least recently used
+        assets if cache size limit is exceeded"""
+        if len(body) > self.max_size:
+            return
+
+        self._remove(url)
+        digest = hashlib.sha256(body).hexdigest()
+        if digest not in self._blob_sizes:
+            try:
+                (self.path / digest).write_bytes(body)
+            except OSError as err:
+                logging.warning(
+                    "[AssetCache] Failed to store %s: %s", url, err
+                )
+                return
+            self._blob_sizes[digest] = len(body)
+
+        self._entries[url] = AssetEntry(
+            digest=digest,
+            etag=headers.get("etag"),
+            size=len(body),
+            headers={
+                name: value for name, value in headers.items()
+                if name.lower() not in SKIPPED_HEADERS
+            },
+            validated=True
+        )
+
+        while self.size > self.max_size and self._entries:
+            self._remove(next(iter(self._entries)))
+            self.stats["evicted"] += 1
+
+    def _remove(self, url: str) -> None:
+        """Removes entry and its blob if no other entry uses it"""
+        entry = self._entries.pop(url, None)
+        if entry is None:
+            return
+
+        if any(
+            other.digest == entry.digest for other in self._entries.values()
+        ):
+            return
+
+        self._blob_sizes.pop(entry.digest, None)
+        (self.path / entry.digest).unlink(missing_ok=True)
+
+    def _read_blob(self, digest: str) -> bytes | None:
+        """Reads content of the asset, None if blob is missing"""
+        try:
+            return (self.path / digest).read_bytes()
+        except OSError:
+            return None
+
+    def _load_index(self) -> None:
+        """Loads index of previous runs, dropping entries
+        with missing blobs"""
+        index_path = self.path / INDEX_FILENAME
+        if not index_path.exists():
+            return
+
+        try:
+            index = json.loads(index_path.read_text("utf-8"))
+        except (OSError, ValueError) as err:
+            logging.warning("[AssetCache] Failed to load index: %s", err)
+            return
+
+        for url, data in index.items():
+            blob = self.path / data["digest"]
+            if not blob.exists():
+                continue
+            self._entries[url] = AssetEntry(**data)
+            self._blob_sizes[data["digest"]] = data["size"]
+
+        # Blobs of entries, which were not saved to index
+        for blob in self.path.iterdir():
+            if blob.name != INDEX_FILENAME and (
+                blob.name not in self._blob_sizes
+            ):
+                blob.unlink(missing_ok=True)
+
+        logging.info(
+            "[AssetCache] Loaded %s cached asset(s) from %s",
+            len(self._entries), self.path
+        )
@@ -0,0 +1,206 @@
+"""Service to run CPU-bound image comparisons in a process pool.
+Test continues browser steps while images are compared, comparison
+results are resolved at the end of the test."""
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from io import BytesIO
+
+import allure  # type: ignore
+from PIL import Image
+
+from utils.image_compare import compare_images
+
+ImageSource = Image.Image | bytes
+
+
+@dataclass
+class CompareResult:
+    """Result of images comparison.
+
+    Args:
+        mismatch (int): number of mismatched pixels.
+        error (str | None): error message, if images are not
+        comparable (e.g. different sizes).
+        attachments (list[tuple[str, bytes]]): PNG images to attach
+        to report (name and content).
+    """
+    mismatch: int
+    error: str | None = None
+    attachments: list[tuple[str, bytes]] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        """Returns True if images match"""
+        return self.error is None and self.mismatch == 0
+
+
+def _open_image(source: ImageSource) -> Image.Image:
+    if isinstance(source, bytes):
+        return Image.open(BytesIO(source))
+    return source
+
+
+def _encode_png(image: Image.Image) -> bytes:
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+    return image_bytes.getvalue()
+
+
+def compare_job(
+    expected: ImageSource,
+    actual: ImageSource,
+    threshold: float,
+    fail_fast: bool = False
+) -> CompareResult:
+    """Compares images, renders expected/actual/diff images on mismatch.
+    Runs in the worker process of the pool.
+
+    Args:
+        expected (ImageSource): expected image (PNG data or image).
+        actual (ImageSource): actual image (PNG data or image).
+        threshold (float): comparison threshold (0...1).
+        fail_fast (bool, optional): stop on the first mismatched pixel.
+        Defaults to False.
+
+    Returns:
+        CompareResult: result of the comparison.
+    """
+    expected_image = _open_image(expected)
+    actual_image = _open_image(actual)
+    if expected_image.size != actual_image.size:
+        return CompareResult(
+            mismatch=-1,
+            error=f"Image sizes do not match: expected "
+            f"{expected_image.size}, actual {actual_image.size}",
+            attachments=[
+                ("Expected", _encode_png(expected_image)),
+                ("Actual", _encode_png(actual_image)),
+            ]
+        )
+
+    mismatch = compare_images(
+        expected_image, actual_image, threshold=threshold, fail_fast=fail_fast
+    )
+    if not mismatch:
+        return CompareResult(mismatch=0)
+
+    diff = Image.new("RGBA", expected_image.size)
+    compare_images(
+        expected_image, actual_image, threshold=threshold, diff=diff
+    )
+    return CompareResult(
+        mismatch=mismatch,
+        attachments=[
+            ("Expected", _encode_png(expected_image)),
+            ("Actual", _encode_png(actual_image)),
+            ("Difference", _encode_png(diff)),
+        ]
+    )
+
+
+class CompareService:
+    """Worker-level queue of image comparisons, executed in background
+    processes.
+
+    Comparisons are submitted by tests and resolved by .resolve() -
+    results are attached to the current Allure step and
+    AssertionError is raised for mismatched images.
+    """
+
+    def __init__(self) -> None:
+        self.max_workers = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: list[tuple[str, Future]] = []
+
+    @property
+    def enabled(self) -> bool:
+        """Returns True if comparisons are offloaded to process pool"""
+        return self.max_workers > 0
+
+    @property
+    def pending(self) -> int:
+        """Number of scheduled, but not resolved comparisons"""
+        return len(self._pending)
+
+    def configure(self, max_workers: int) -> None:
+        """Sets number of worker processes (0 - disabled)"""
+        self.max_workers = max(0, max_workers)
+
+    def submit(
+        self,
+        name: str,
+        expected: ImageSource,
+        actual: ImageSource,
+        threshold: float,
+        fail_fast: bool = False
+    ) -> None:
+        """Schedules comparison of the images.
+
+        Args:
+            name (str): name of the comparison for report.
+            expected (ImageSource): expected image (PNG data or image).
+            actual (ImageSource): actual image (PNG data or image).
+            threshold (float): comparison threshold (0...1).
+            fail_fast (bool, optional): stop on the first mismatched
+            pixel. Defaults to False.
+        """
+        if self._executor is None:
+            # Spawned processes don't inherit threads of Playwright
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+
+        logging.info("[CompareService] Scheduled comparison: %s", name)
+        self._pending.append((
+            name,
+            self._executor.submit(
+                compare_job, expected, actual, threshold, fail_fast
+            )
+        ))
+
+    def resolve(self) -> None:
+        """Waits for scheduled comparisons, attaches results to
+        the current Allure step (or test).
+
+        Raises:
+            AssertionError: if any of images do not match.
+        """
+        pending, self._pending = self._pending, []
+        failures = []
+        for name, future in pending:
+            result: CompareResult = future.result()
+            logging.info(
+                "[CompareService] Comparison '%s' error is %s",
+                name, result.mismatch
+            )
+            for title, content in result.attachments:
+                allure.attach(
+                    content, f"{name}: {title}", allure.attachment_type.PNG
+                )
+
+            if not result.passed:
+                failures.append(
+                    f"{name}: {result.error or 'images differ'} "
+                    f"(error: {result.mismatch})"
+                )
+
+        assert not failures, "Images do not match:\n" + "\n".join(failures)
+
+    def discard(self) -> None:
+        """Drops scheduled comparisons (e.g. when test already failed)"""
+        pending, self._pending = self._pending, []
+        for _, future in pending:
+            future.cancel()
+
+    def close(self) -> None:
+        """Shuts down worker processes"""
+        self.discard()
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+compare_service = CompareService()
@@ -2,9 +2,9 @@
 from typing import TYPE_CHECKING
 
 import allure  # type: ignore
-from playwright.sync_api import Page
 
-from utils.elements import Button
+from utils.elements import Button, LazyElement
+from utils.models.navigation_mode import NavigationMode
 
 from .base_component import BaseComponent
 
@@ -18,39 +18,69 @@ class AdminSideMenu(BaseComponent):
     like Catalog, Customers, Settings, etc.
     """
 
-    def __init__(self, page: Page):
-        super().__init__(page)
+    # Navigation mode forced for all category changes
+    # ('auto' - mode requested by caller is used)
+    navigation_mode = NavigationMode.AUTO
 
-        self.logo_button = Button(
-            page, "#sidebar > #logotype > a", "Logo button"
-        )
-        self.category_button = Button(
-            page,
-            "#sidebar > #box-apps-menu > .app[data-code={category}] > a",
-            "Category button",
-        )
-        self.subcategory_button = Button(
-            page,
-            "#sidebar > #box-apps-menu .doc[data-id={category}] a",
-            "Subcategory button",
-        )
+    logo_button = LazyElement(
+        Button, "#sidebar > #logotype > a", "Logo button"
+    )
+
+    category_button = LazyElement(
+        Button,
+        "#sidebar > #box-apps-menu > .app[data-code={category}] > a",
+        "Category button"
+    )
+
+    subcategory_button = LazyElement(
+        Button,
+        "#sidebar > #box-apps-menu .doc[data-id={category}] a",
+        "Subcategory button"
+    )
 
     @property
     def name(self):
         return "Side Menu"
 
     @allure.step("Switching category using side menu")
-    def change_category(self, category: "AdminCategory"):
-        """Performs series of cliks needed to change category page"""
-        self.log("Swithing category in side menu to %s", category)
+    def change_category(
+        self,
+        category: "AdminCategory",
+        navigation: NavigationMode = NavigationMode.CLICK
+    ):
+        """Navigates to category page, by performing series of clicks
+        in side menu or by direct navigation to category page URL.
+
+        Args:
+            category (AdminCategory): category to switch to.
+            navigation (NavigationMode, optional): navigation mode,
+            where 'auto' means direct navigation. Defaults to 'click'.
+            Overriden by .navigation_mode (if set to 'click' or 'direct').
+
+        Returns:
+            BasePage: page of the category.
+        """
+        mode = navigation
+        if self.navigation_mode != NavigationMode.AUTO:
+            mode = self.navigation_mode
+        elif mode == NavigationMode.AUTO:
+            mode = NavigationMode.DIRECT
+
+        self.log(
+            "Swithing category in side menu to %s (navigation: %s)",
+            category, mode.value
+        )
 
         category_id, subcategory_id, page_cls = category.value
+        new_page = page_cls(self.page)
 
-        self.click_category(category_id)
-        if subcategory_id is not None:
-            self.click_sub_category(subcategory_id)
+        if mode == NavigationMode.DIRECT:
+            new_page.visit()
+        else:
+            self.click_category(category_id)
+            if subcategory_id is not None:
+                self.click_sub_category(subcategory_id)
 
-        new_page = page_cls(self.page)
         self.log("Category switched, new page is %s", new_page.name)
 
         return new_page
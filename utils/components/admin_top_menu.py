@@ -1,7 +1,6 @@
 """Admin's page top strip menu - logout button, to frontend button"""
-from playwright.sync_api import Page
 
-from utils.elements import Button, List
+from utils.elements import Button, List, LazyElement
 
 from .base_component import BaseComponent
 
@@ -9,16 +8,15 @@ from .base_component import BaseComponent
 class AdminTopMenu(BaseComponent):
     """Admin's page top strip menu - logout button, to frontend button, etc."""
 
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
+    log_out_button = LazyElement(
+        Button, "a[title='Sign Out']", "Log Out button"
+    )
 
-        self.log_out_button = Button(
-            page, "a[title='Sign Out']", "Log Out button"
-        )
-        self.frontend_button = Button(
-            page, "a[title='Frontend']", "Frontend button"
-        )
-        self.breadcrumbs = List(page, ".breadcrumb li", "Breadcrumbs items")
+    frontend_button = LazyElement(
+        Button, "a[title='Frontend']", "Frontend button"
+    )
+
+    breadcrumbs = LazyElement(List, ".breadcrumb li", "Breadcrumbs items")
 
     @property
     def name(self):
@@ -1,5 +1,6 @@
 """Input elements class"""
 from copy import copy
+from functools import cached_property
 from logging import DEBUG
 
 from playwright.sync_api import Page
@@ -58,25 +59,35 @@ class Field(BaseComponent):
                 level=DEBUG,
             )
 
-        self.label = Label(
-            page,
-            f"{locator} {self.element_selectors['label']}",
-            f"Label for {name}",
+        self.locator = locator
+        self.input_type = input_type
+
+    @cached_property
+    def label(self) -> Label:
+        """Label element of the field (created on first access)"""
+        return Label(
+            self.page,
+            f"{self.locator} {self.element_selectors['label']}",
+            f"Label for {self.name_prefix}",
         )
 
-        if input_type == "input":
-            self.input = Input(
-                page,
-                f"{locator} {self.element_selectors['input']}",
-                f"Input for {name}",
-            )
-        elif input_type == "textarea":
-            self.input = Textarea(
-                page,
-                f"{locator} {self.element_selectors['textarea']}",
-                f"Textarea for {name}",
+    @cached_property
+    def input(self) -> Input | Textarea:
+        """Input or Textarea element of the field, depending on
+        input type (created on first access)"""
+        if self.input_type == "textarea":
+            return Textarea(
+                self.page,
+                f"{self.locator} {self.element_selectors['textarea']}",
+                f"Textarea for {self.name_prefix}",
             )
 
+        return Input(
+            self.page,
+            f"{self.locator} {self.element_selectors['input']}",
+            f"Input for {self.name_prefix}",
+        )
+
     @property
     def name(self):
         return f'"{self.name_prefix}" Field'
@@ -1,7 +1,8 @@
 """Component for group of elements: Input, Labels and
 extra elements in label"""
+from functools import cached_property
+
 import allure  # type: ignore
-from playwright.sync_api import Page
 
 from utils.elements import Link
 
@@ -20,21 +21,13 @@ class LinkAnnotatedField(Field):
         "link": "a",
     }
 
-    def __init__(
-        self,
-        page: Page,
-        locator: str,
-        name: str,
-        input_type: str = "input",
-        elements_selectors_override: dict | None = None,
-    ) -> None:
-        super().__init__(
-            page, locator, name, input_type, elements_selectors_override
-        )
-        self.label_link = Link(
-            page,
-            f"{locator} label {self.element_selectors['link']}",
-            f"Link of Annotated Field {name}",
+    @cached_property
+    def label_link(self) -> Link:
+        """Link element in the label (created on first access)"""
+        return Link(
+            self.page,
+            f"{self.locator} label {self.element_selectors['link']}",
+            f"Link of Annotated Field {self.name_prefix}",
         )
 
     @property
@@ -0,0 +1,190 @@
+"""Capture of browser console errors, page errors and failed requests
+with bounded memory. Repeated errors are deduplicated and counted."""
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+import allure  # type: ignore
+from playwright.sync_api import ConsoleMessage, Error, Page, Request
+
+
+@dataclass
+class ConsoleRecord:
+    """Captured error of the page.
+
+    Args:
+        kind (str): source of the error: 'console', 'pageerror'
+        or 'requestfailed'.
+        type (str): console message type or request's resource type.
+        text (str): error text.
+        location (str): URL (and line:column) the error came from.
+        timestamp (float): seconds since capture start to the first
+        occurrence.
+        count (int): number of occurrences.
+    """
+    kind: str
+    type: str
+    text: str
+    location: str
+    timestamp: float
+    count: int = 1
+
+    def __str__(self) -> str:
+        repeats = f" (x{self.count})" if self.count > 1 else ""
+        return (
+            f"[{self.timestamp:.3f}s] {self.kind}/{self.type} "
+            f"at {self.location}: {self.text}{repeats}"
+        )
+
+
+class ConsoleCapture:
+    """Collects errors of the page into a ring buffer of unique records.
+
+    Repeated errors (same kind, text and location) increase count
+    of the existing record. When buffer is full, the oldest records
+    are dropped.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        max_records: int,
+        page_errors: bool = True,
+        failed_requests: bool = False,
+        attach_to_step: bool = False,
+        ignore_request: Callable[[Request], bool] | None = None
+    ) -> None:
+        """Instantiate capture.
+
+        Args:
+            page (Page): page to capture errors of.
+            max_records (int): max number of unique records to keep.
+            page_errors (bool, optional): capture uncaught exceptions
+            of the page. Defaults to True.
+            failed_requests (bool, optional): capture failed requests.
+            Defaults to False.
+            attach_to_step (bool, optional): attach the first occurrence
+            of each error to the current Allure step. Defaults to False.
+            ignore_request (Callable[[Request], bool], optional): filter
+            of failed requests to ignore (e.g. blocked on purpose).
+        """
+        self.page = page
+        self.max_records = max(1, max_records)
+        self.page_errors = page_errors
+        self.failed_requests = failed_requests
+        self.attach_to_step = attach_to_step
+        self.ignore_request = ignore_request
+
+        self.dropped = 0
+        self._records: OrderedDict[
+            tuple[str, str, str], ConsoleRecord
+        ] = OrderedDict()
+        self._started = time.monotonic()
+
+    def install(self) -> "ConsoleCapture":
+        """Starts listening to page events"""
+        self.page.on("console", self._on_console)
+        if self.page_errors:
+            self.page.on("pageerror", self._on_page_error)
+        if self.failed_requests:
+            self.page.on("requestfailed", self._on_request_failed)
+        return self
+
+    def uninstall(self) -> None:
+        """Stops listening to page events"""
+        self.page.remove_listener("console", self._on_console)
+        if self.page_errors:
+            self.page.remove_listener("pageerror", self._on_page_error)
+        if self.failed_requests:
+            self.page.remove_listener(
+                "requestfailed", self._on_request_failed
+            )
+
+    @property
+    def records(self) -> list[ConsoleRecord]:
+        """Captured records, in order of the first occurrence"""
+        return list(self._records.values())
+
+    @property
+    def total(self) -> int:
+        """Total number of captured errors (including repeats)"""
+        return sum(record.count for record in self._records.values())
+
+    def report(self) -> str:
+        """Returns text report of captured records"""
+        lines = [str(record) for record in self._records.values()]
+        if self.dropped:
+            lines.append(f"... {self.dropped} older record(s) dropped")
+        return "\n".join(lines)
+
+    def attach(self) -> None:
+        """Attaches captured records to Allure report
+        as a single attachment"""
+        allure.attach(
+            json.dumps(
+                {
+                    "records": [asdict(r) for r in self._records.values()],
+                    "dropped": self.dropped
+                },
+                indent=2
+            ),
+            "Browser Errors (All)",
+            allure.attachment_type.JSON
+        )
+
+    def _add(self, kind: str, type_: str, text: str, location: str) -> None:
+        """Adds record or increases count of the existing one"""
+        key = (kind, text, location)
+        record = self._records.get(key)
+        if record is not None:
+            record.count += 1
+            return
+
+        record = ConsoleRecord(
+            kind=kind,
+            type=type_,
+            text=text,
+            location=location,
+            timestamp=time.monotonic() - self._started
+        )
+        self._records[key] = record
+        if len(self._records) > self.max_records:
+            self._records.popitem(last=False)
+            self.dropped += 1
+
+        logging.warning("Browser error! %s", record)
+        if self.attach_to_step:
+            allure.attach(
+                str(record), "Browser Error", allure.attachment_type.TEXT
+            )
+
+    def _on_console(self, msg: ConsoleMessage) -> None:
+        if msg.type != "error":
+            return
+
+        location = msg.location
+        self._add(
+            "console",
+            msg.type,
+            msg.text,
+            f"{location.get('url', '')}:{location.get('lineNumber', 0)}:"
+            f"{location.get('columnNumber', 0)}"
+        )
+
+    def _on_page_error(self, error: Error) -> None:
+        self._add("pageerror", error.name or "Error", error.message,
+                  self.page.url)
+
+    def _on_request_failed(self, request: Request) -> None:
+        if self.ignore_request is not None and self.ignore_request(request):
+            return
+
+        self._add(
+            "requestfailed",
+            request.resource_type,
+            f"{request.method} {request.failure}",
+            request.url
+        )
@@ -0,0 +1,127 @@
+"""Queue of entities to be deleted via API in background"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from constants import DELETION_ATTEMPTS, DELETION_RETRY_DELAY
+from utils import api_helpers as api
+from utils.models.base_entity import BackOfficeEntity
+
+
+@dataclass
+class DeletionFailure:
+    """Entity that failed to be deleted and the last error"""
+    entity: BackOfficeEntity
+    attempts: int
+    error: Exception
+
+
+class DeletionQueue:
+    """Worker-level queue of entities to delete.
+
+    Entities are deleted by API requests in background threads with
+    bounded concurrency, each deletion is retried on error.
+    Caller is blocked only on .flush() (e.g. at the end of session).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        max_workers: int,
+        attempts: int = DELETION_ATTEMPTS,
+        retry_delay: float = DELETION_RETRY_DELAY
+    ) -> None:
+        """Instantiate queue.
+
+        Args:
+            base_url (str): host of the API.
+            username (str): admin username to use.
+            password (str): admin password to user.
+            max_workers (int): max number of concurrent deletions.
+            attempts (int, optional): number of attempts to delete entity.
+            Defaults to DELETION_ATTEMPTS.
+            retry_delay (float, optional): delay in seconds before first
+            retry, doubled on each next retry.
+            Defaults to DELETION_RETRY_DELAY.
+        """
+        self.attempts = max(1, attempts)
+        self.retry_delay = retry_delay
+        self._session = api.prepare_logged_admin_session(
+            base_url, username, password
+        )
+
+        self._futures: list[Future] = []
+        self._failures: list[DeletionFailure] = []
+        self._deleted = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="deletion"
+        )
+
+    def put(self, entity: BackOfficeEntity) -> None:
+        """Schedules deletion of the entity. Entities without
+        entity_id are skipped."""
+        if not entity.entity_id:
+            logging.warning(
+                "[DeletionQueue] Entity without ID can't be deleted: %s",
+                entity
+            )
+            return
+
+        logging.info("[DeletionQueue] Scheduled deletion of %s", entity)
+        future = self._executor.submit(self._delete, entity)
+        with self._lock:
+            self._futures.append(future)
+
+    def put_many(self, entities: list[BackOfficeEntity]) -> None:
+        """Schedules deletion of several entities"""
+        for entity in entities:
+            self.put(entity)
+
+    def flush(self) -> list[DeletionFailure]:
+        """Waits for all scheduled deletions to complete and stops
+        the queue.
+
+        Returns:
+            list[DeletionFailure]: entities that failed to be deleted.
+        """
+        self._executor.shutdown(wait=True)
+
+        with self._lock:
+            failures = list(self._failures)
+            logging.info(
+                "[DeletionQueue] Flushed: %s deleted, %s failed",
+                self._deleted, len(failures)
+            )
+
+        return failures
+
+    def _delete(self, entity: BackOfficeEntity) -> None:
+        """Deletes entity with retries (runs in worker thread)"""
+        delay = self.retry_delay
+        for attempt in range(1, self.attempts + 1):
+            try:
+                api.delete_entity(entity, self._session).raise_for_status()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                if attempt < self.attempts:
+                    time.sleep(delay)
+                    delay *= 2
+                    continue
+
+                logging.warning(
+                    "[DeletionQueue] Failed to delete %s after %s "
+                    "attempts: %r", entity, attempt, err
+                )
+                with self._lock:
+                    self._failures.append(
+                        DeletionFailure(entity, attempt, err)
+                    )
+                return
+
+            with self._lock:
+                self._deleted += 1
+            return
@@ -4,6 +4,7 @@ specific HTML elements"""
 from .button import Button
 from .input import Input
 from .label import Label
+from .lazy_element import LazyElement
 from .link import Link
 from .list import List
 from .list_item import ListItem
@@ -1,11 +1,32 @@
 """Basic component class"""
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 import allure  # type: ignore
 from playwright.sync_api import Locator, Page, expect
 
 
+# Max number of cached locators per element
+LOCATOR_CACHE_SIZE = 32
+
+
+class LocatorCounter:
+    """Counter of locators built and taken from cache by elements"""
+
+    def __init__(self) -> None:
+        self.built = 0
+        self.cached = 0
+
+    def reset(self) -> None:
+        """Resets counters"""
+        self.built = 0
+        self.cached = 0
+
+
+locator_counter = LocatorCounter()
+
+
 class BaseElement(ABC):
     """Base class for HTML element"""
 
@@ -13,6 +34,7 @@ class BaseElement(ABC):
         self.page = page
         self.name = name
         self.locator = locator
+        self._locators: OrderedDict[tuple, Locator] = OrderedDict()
 
     @property
     @abstractmethod
@@ -21,19 +43,37 @@ class BaseElement(ABC):
         return "element"
 
     def log(self, msg: str, *args, level: int = logging.DEBUG):
-        """Logs message"""
+        """Logs message (if given level is enabled)"""
+        if not logging.root.isEnabledFor(level):
+            return
+
         logging.log(
             level, f"[Element: {self.name} {self.type_of}] {msg}", *args
         )
 
     def get_locator(self, **locator_qualifiers) -> Locator:
         """Returns qalified locator of the element.
+        Locators are cached per qualifiers (least recently used
+        are dropped).
 
         Returns:
             Locator: locator object.
         """
+        key = tuple(sorted(locator_qualifiers.items()))
+        locator = self._locators.get(key)
+        if locator is not None:
+            self._locators.move_to_end(key)
+            locator_counter.cached += 1
+            return locator
+
         locator = self.page.locator(self.locator.format(**locator_qualifiers))
+        locator_counter.built += 1
         self.log("Locator found (%s)", locator)
+
+        self._locators[key] = locator
+        if len(self._locators) > LOCATOR_CACHE_SIZE:
+            self._locators.popitem(last=False)
+
         return locator
 
     def get_first(self,  **locator_qualifiers) -> Locator:
@@ -0,0 +1,44 @@
+"""Descriptor for lazy declaration of page's elements"""
+from typing import Any, Callable, Generic, TypeVar, overload
+
+T = TypeVar("T")
+
+
+class LazyElement(Generic[T]):
+    """Declares element (or component) of the page/component as class
+    attribute. Element is created on first access as
+    cls(instance.page, *args, **kwargs) and cached per page instance.
+
+    Example:
+        class LoginPage(BasePage):
+            login_button = LazyElement(Button, "button", "Login button")
+    """
+
+    def __init__(
+        self, cls: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> None:
+        self.cls = cls
+        self.args = args
+        self.kwargs = kwargs
+        self.attr_name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr_name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> "LazyElement[T]":
+        ...
+
+    @overload
+    def __get__(self, instance: Any, owner: type) -> T:
+        ...
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        element = self.cls(instance.page, *self.args, **self.kwargs)
+        # Instance attribute takes precedence over non-data descriptor,
+        # so element is created only once
+        instance.__dict__[self.attr_name] = element
+        return element
@@ -1,63 +1,190 @@
-"""List item element"""
-from typing import cast
+"""Table element"""
+from contextlib import closing
+from functools import lru_cache
+from typing import Any, Generator, Sequence, cast
+from urllib.parse import parse_qsl, urlsplit
+from weakref import WeakKeyDictionary, WeakSet
+
 import allure  # type: ignore
-from playwright.sync_api import Locator, Page, expect
+from playwright.sync_api import Frame, Locator, Page, expect
 
 from utils.models.entry_lookup_strategy import (
     EntryReadStrategy,
     LookupStrategiesType,
-    ReadStrategiesType
+    ReadStrategiesType,
+    StrategyKey
 )
 from utils.models.base_entity import BackOfficeEntity
+from utils.models.table_snapshot import TableSnapshot
 from .base_element import BaseElement
 
 
-# Snippet loops through rows, gets desired cells
-# for specific elements text/values and compare to expected values.
-# On success - returns index of a row; otherwise returns null (None).
-JS_SNIPPET_FIND = """rows => {
-  expected_data = [%s];
-  let found = false;
-  for (let i = 0; i < rows.length; ++i) {
-    for (let j = 0; j < expected_data.length; ++j) {
-      const [ sel, exp_val, by_text, expr, is_uid ] = expected_data[j];
-      data_match = false;
-      const element = rows[i].querySelector(sel);
-      if (!element) { found = false; break; };
-      let value = by_text ? element.innerText : element.value;
-      if (expr) value = expr(value);
-      if (exp_val != value) { found = false; break; };
-      if (is_uid) return i;
-      found = true;
+# Max number of rows to include into diagnostics of failed lookup
+DIAGNOSTICS_MAX_ROWS = 20
+
+# Link to the next page of Litecart's pagination
+# (last item of pagination is disabled on the last page)
+NEXT_PAGE_LOCATOR = "ul.pagination li:last-child:not(.disabled) a[href]"
+
+# Script installs table reader into the document (once per document,
+# registered as page's init script). Reader reads whole table body
+# at once: text content, input values, hidden inputs and links of each
+# row, plus values read by given strategies - [selector, by_text,
+# expression] (innerText or value of the element in a row, with
+# expression applied). Also reads URL of the document and URL of
+# the next page (if any). Expressions are compiled once per document.
+JS_TABLE_READER = """(() => {
+  if (window.__tableReader) return;
+  const expressions = new Map();
+  const compile = expr => {
+    if (!expr) return null;
+    let func = expressions.get(expr);
+    if (!func) {
+      func = new Function("value", `return (${expr});`);
+      expressions.set(expr, func);
+    };
+    return func;
+  };
+  const snapshot = (table, strategies, next_page_sel) => {
+    const headers = Array.from(
+      table.querySelectorAll("thead th"), th => th.textContent.trim()
+    );
+    const rows = Array.from(table.querySelectorAll("tbody tr"));
+    const texts = [];
+    const values = [];
+    const hidden = [];
+    const links = [];
+    rows.forEach((row, i) => {
+      const cells = row.querySelectorAll(":scope > td");
+      cells.forEach((cell, j) => {
+        if (!texts[j]) {
+          texts[j] = new Array(rows.length).fill(null);
+          values[j] = new Array(rows.length).fill(null);
+        };
+        texts[j][i] = cell.textContent.trim();
+        const input = cell.querySelector(
+          "input:not([type=hidden]), select, textarea"
+        );
+        values[j][i] = input ? input.value : null;
+      });
+      hidden.push(Array.from(
+        row.querySelectorAll(":scope > td > input[type=hidden]"),
+        e => e.value
+      ));
+      links.push(Array.from(
+        row.querySelectorAll("a[href]"), e => e.getAttribute("href")
+      ));
+    });
+    const derived = strategies.map(([ sel, by_text, expr ]) => {
+      const apply = compile(expr);
+      return rows.map(row => {
+        const element = row.querySelector(sel);
+        if (!element) return null;
+        let value = by_text ? element.innerText : element.value;
+        if (value && apply) value = apply(value);
+        return value == null ? null : String(value);
+      });
+    });
+    const next_page = next_page_sel
+      ? document.querySelector(next_page_sel) : null;
+    return {
+      url: document.location.href,
+      next_page_url: next_page ? next_page.href : null,
+      rows: rows.length, headers, texts, values, hidden, links, derived
     };
-    if (found) return i;
   };
-  return null;
-};"""
-
-# Snippet acquires 'tr' element and loops through desired td elements
-# (according to provided strategy - index, nested element, etc)
-# and collecting desired data (text or value), applying modifiers.
-# Returns an array of gathered data.
-JS_SNIPPET_GET_FROM_ROW = """row => {
-  strategy = [%s];
-  const result = [];
-  for (let i = 0; i < strategy.length; ++i) {
-    const [ sel, by_text, expr ] = strategy[i];
-    const element = row.querySelector(sel);
-    if (!element) { return null; };
-    let value = by_text ? element.innerText : element.value;
-    if (value && expr) value = expr(value);
-    result.push(value);
-  }
-  return result;
-};"""
+  Object.defineProperty(
+    window, "__tableReader", { value: { snapshot }, enumerable: false }
+  );
+})();"""
+
+# Snippet calls table reader, returns null if reader is not installed
+# into current document yet
+JS_SNIPPET_SNAPSHOT = """(table, [ strategies, next_page_sel ]) =>
+  window.__tableReader
+    ? window.__tableReader.snapshot(table, strategies, next_page_sel)
+    : null;"""
+
+# Pages with registered table reader init script
+_reader_pages: WeakSet[Page] = WeakSet()
+
+# Tables with cached snapshots per page, which are invalidated
+# on navigation of the page
+_page_tables: WeakKeyDictionary[Page, WeakSet["Table"]] = WeakKeyDictionary()
+
+
+def normalize_url(url: str) -> tuple:
+    """Returns comparable form of the URL: scheme and host are
+    case-insensitive, trailing slash of the path, order of query
+    parameters and fragment are ignored"""
+    parts = urlsplit(url)
+    return (
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        tuple(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    )
+
+
+@lru_cache(maxsize=None)
+def compile_strategies(
+    strategies: LookupStrategiesType | ReadStrategiesType
+) -> tuple[StrategyKey, ...]:
+    """Returns keys of given strategies, used by table reader
+    (cached by strategies tuple)"""
+    return tuple(st.key for st in strategies)
+
+
+def install_table_reader(page: Page) -> None:
+    """Registers table reader as init script of the page
+    (once per page)"""
+    if page in _reader_pages:
+        return
+
+    page.add_init_script(JS_TABLE_READER)
+    _reader_pages.add(page)
+
+
+def _on_frame_navigated(frame: Frame) -> None:
+    """Drops cached snapshots of the tables of the page,
+    when new document is loaded"""
+    if frame.parent_frame is not None:
+        return
+
+    for table in list(_page_tables.get(frame.page, ())):
+        table.invalidate()
+
+
+def _watch_navigation(table: "Table") -> None:
+    """Registers table to drop its cached snapshots on navigation
+    of the page (single listener per page)"""
+    tables = _page_tables.get(table.page)
+    if tables is None:
+        tables = _page_tables[table.page] = WeakSet()
+        table.page.on("framenavigated", _on_frame_navigated)
+
+    tables.add(table)
+
+
+def unwatch_tables(page: Page) -> None:
+    """Removes navigation listener of the page's tables
+    (e.g. before page is reused by another test)"""
+    if _page_tables.pop(page, None) is not None:
+        page.remove_listener("framenavigated", _on_frame_navigated)
 
 
 class Table(BaseElement):
     """List element, representing group of <table> tag elements"""
-    def __init__(self, page: Page, locator: str, name: str) -> None:
+    def __init__(
+        self,
+        page: Page,
+        locator: str,
+        name: str,
+        next_page_locator: str = NEXT_PAGE_LOCATOR
+    ) -> None:
         super().__init__(page, locator, name)
+        self.next_page_locator = next_page_locator
+        self._snapshots: dict[str, TableSnapshot] = {}
 
     @property
     def type_of(self) -> str:
@@ -86,12 +213,153 @@ class Table(BaseElement):
         table = self.get_locator(**locator_qualifiers)
         return table.locator(f"tbody tr:nth-child({row_idx+1})")
 
-    def count_rows(self, **locator_qualifiers) -> int:
+    def snapshot(
+        self,
+        strategies: LookupStrategiesType | ReadStrategiesType = (),
+        cached: bool = False,
+        **locator_qualifiers
+    ) -> TableSnapshot:
+        """Returns snapshot of the table content, read by single call
+        to the browser. Table is read on each call, unless cached
+        snapshot is explicitly requested - for several reads of
+        the table, that is not changed in between. Cache is dropped
+        when page navigates or .invalidate() is called. Cached snapshot
+        is re-read if it lacks values of given strategies.
+
+        Args:
+            strategies (optional, tuple[EntryReadStrategy, ...] |
+            tuple[EntryLookupStrategy, ...]): strategies to read values
+            by. Defaults to none.
+            cached (bool, optional): return snapshot cached by previous
+            read, if any. Defaults to False (table is re-read, as it may
+            change without navigation).
+            **locator_qualifiers (optional): kwargs for formatting
+            base locator of the element.
+
+        Returns:
+            TableSnapshot: content of the table.
+        """
+        keys = list(compile_strategies(strategies))
+        locator = self.locator.format(**locator_qualifiers)
+
+        snapshot = self._snapshots.get(locator) if cached else None
+        if snapshot is not None and snapshot.has_keys(keys):
+            return snapshot
+
+        if snapshot is not None:
+            keys = list(dict.fromkeys([*snapshot.derived, *keys]))
+
+        _watch_navigation(self)
+        snapshot = self._read_snapshot(
+            self.get_locator(**locator_qualifiers), keys
+        )
+        self._snapshots[locator] = snapshot
+        return snapshot
+
+    def iter_pages(
+        self,
+        strategies: LookupStrategiesType | ReadStrategiesType = (),
+        prefetch: bool = False,
+        **locator_qualifiers
+    ) -> Generator[TableSnapshot, None, None]:
+        """Yields snapshots of the table on current page and each of
+        the next pages of pagination. Next pages are read in separate
+        tab, so current page stays as is. Pages are read lazily, only
+        when consumer asks for the next one.
+
+        Args:
+            strategies (optional, tuple[EntryReadStrategy, ...] |
+            tuple[EntryLookupStrategy, ...]): strategies to read values
+            by. Defaults to none.
+            prefetch (bool, optional): flag to start loading of the next
+            page while current one is consumed. Defaults to False.
+            **locator_qualifiers (optional): kwargs for formatting
+            base locator of the element.
+
+        Yields:
+            TableSnapshot: content of the table on each page.
+        """
+        snapshot = self.snapshot(strategies, **locator_qualifiers)
+        keys = list(compile_strategies(strategies))
+        reader_tab = None
+
+        try:
+            while True:
+                next_page_url = snapshot.next_page_url
+                if next_page_url is not None and prefetch:
+                    reader_tab = reader_tab or self._open_reader_tab()
+                    self.log("Prefetching next page %s", next_page_url)
+                    # Assigning location doesn't wait for navigation
+                    reader_tab.evaluate(
+                        "url => { window.location.href = url; }",
+                        next_page_url
+                    )
+
+                yield snapshot
+
+                if next_page_url is None:
+                    return
+
+                if prefetch and reader_tab is not None:
+                    # Browser may normalize assigned URL (e.g. encoding
+                    # or order of query parameters)
+                    expected_url = normalize_url(next_page_url)
+                    reader_tab.wait_for_url(
+                        lambda url: normalize_url(url) == expected_url,
+                        wait_until="domcontentloaded"
+                    )
+                else:
+                    reader_tab = reader_tab or self._open_reader_tab()
+                    self.log("Loading next page %s", next_page_url)
+                    reader_tab.goto(
+                        next_page_url, wait_until="domcontentloaded"
+                    )
+
+                snapshot = self._read_snapshot(
+                    reader_tab.locator(
+                        self.locator.format(**locator_qualifiers)
+                    ),
+                    keys
+                )
+        finally:
+            if reader_tab is not None:
+                reader_tab.close()
+
+    def iter_rows(
+        self,
+        columns: list[int] | tuple[int, ...] | None = None,
+        prefetch: bool = False,
+        **locator_qualifiers
+    ) -> Generator[list[str], None, None]:
+        """Yields text content of the cells of each row on all pages
+        of the table (see .iter_pages()).
+
+        Args:
+            columns (list[int] | tuple[int], optional): columns number to
+            get data from. Defaults to None (all columns included).
+            prefetch (bool, optional): flag to load the next page while
+            current one is consumed. Defaults to False.
+
+        Yields:
+            list[str]: text content of the row's cells.
+        """
+        for snapshot in self.iter_pages(
+            prefetch=prefetch, **locator_qualifiers
+        ):
+            for row_idx in range(snapshot.row_count):
+                yield snapshot.get_row_texts(row_idx, columns)
+
+    def invalidate(self) -> None:
+        """Drops cached snapshots of the table"""
+        self._snapshots.clear()
+
+    def count_rows(self, cached: bool = False, **locator_qualifiers) -> int:
         """Returns number of rows in the table body"""
-        return self.get_rows_locator(**locator_qualifiers).count()
+        return self.snapshot(cached=cached, **locator_qualifiers).row_count
 
     def find_entry(self, table_entry: BackOfficeEntity,
                    strategies: LookupStrategiesType,
+                   cached: bool = False,
                    **locator_qualifiers) -> int:
         """Find given target values using given lookup strategy
         and return row index, where entry was found.
@@ -104,6 +372,8 @@ class Table(BaseElement):
             strategies (optional, tuple[EntryLookupStrategy]): list of
             strategies to use. Defaults to strategies set with
             .set_default_strategies(lookup=...) method
+            cached (bool, optional): use snapshot cached by previous
+            read (see .snapshot()). Defaults to False.
             **locator_qualifiers (optional): kwargs for formatting
             base locator of the element.
 
@@ -113,64 +383,139 @@ class Table(BaseElement):
         Returns:
             int: row index (0-based) of found entry.
         """
-        for st in strategies:
-            if isinstance(st, EntryReadStrategy):
-                raise RuntimeError(
-                    "EntryReadStrategy should not be used "
-                    "for Entry Lookup (.find_entry). "
-                    "Use EntryLookupStrategy only!"
-                )
+        target_values, expected = self._prepare_lookup(
+            table_entry, strategies
+        )
 
-        target_values = table_entry.get_lookup_params()
+        snapshot = self.snapshot(
+            strategies, cached=cached, **locator_qualifiers
+        )
+        row_idx = snapshot.find(expected)
 
-        if not any(target_values.values()):
-            raise RuntimeError(
-                f"Impossible to look up for null entity {table_entry}! "
-                "At least 1 lookup field should not be None."
+        if row_idx is None:
+            raise self._entry_not_found_error(
+                target_values, expected, strategies, snapshot
             )
 
-        js_expr, strategy_data = self._preprare_lookup_expression(
-            strategies, target_values
-        )
+        self.log('Find Entry resulted in ROW IDX: %s', row_idx)
+        return row_idx
 
-        self.log(
-            "Going to Find Entry in table using strategy data: %s",
-            strategy_data
+    def find_entries(
+        self,
+        table_entries: Sequence[BackOfficeEntity],
+        strategies: LookupStrategiesType,
+        cached: bool = False,
+        **locator_qualifiers
+    ) -> list[int]:
+        """Finds several entries like .find_entry(), using single
+        read of the table.
+
+        Args:
+            table_entries (Sequence[BackOfficeEntity]): entities to find.
+            strategies (tuple[EntryLookupStrategy]): list of
+            strategies to use.
+            cached (bool, optional): use snapshot cached by previous
+            read (see .snapshot()). Defaults to False.
+            **locator_qualifiers (optional): kwargs for formatting
+            base locator of the element.
+
+        Raises:
+            ValueError: if any of entries was not found.
+
+        Returns:
+            list[int]: row indicies (0-based) of found entries,
+            in order of given entries.
+        """
+        snapshot = self.snapshot(
+            strategies, cached=cached, **locator_qualifiers
         )
 
-        try:
-            row_idx = self.get_rows_locator(**locator_qualifiers). \
-                evaluate_all(js_expr)
-        except Exception as exc:
-            exc.add_note(
-                "Error occured on attempting to find entry in table "
-                f"using stratgy: {strategy_data}"
+        rows = []
+        for table_entry in table_entries:
+            target_values, expected = self._prepare_lookup(
+                table_entry, strategies
             )
-
-        if row_idx is None:
-            current_table_content = "\n".join([
-                f"  {i:>3}) {cnt}"
-                for i, cnt in enumerate(
-                    self.get_rows_content(row_idx, **locator_qualifiers)
+            row_idx = snapshot.find(expected)
+            if row_idx is None:
+                raise self._entry_not_found_error(
+                    target_values, expected, strategies, snapshot
                 )
-            ])
-            strategy_info = "\n  ".join([str(st) for st in strategies])
-            raise ValueError(
-                f"There is no row with data like {target_values}, "
-                f"in the {self.name}!\n"
-                "Table content:\n"
-                f"  {current_table_content}\n"
-                "Strategy:\n"
-                f"  {strategy_info}"
-            )
+            rows.append(row_idx)
 
-        self.log('Find Entry resulted in ROW IDX: %s', row_idx)
-        return row_idx
+        self.log('Find Entries resulted in ROW IDXs: %s', rows)
+        return rows
+
+    def has_entry(
+        self,
+        table_entry: BackOfficeEntity,
+        strategies: LookupStrategiesType,
+        **locator_qualifiers
+    ) -> bool:
+        """Checks that table contains given entry (see .find_entry()).
+        Unlike .find_entry() - no diagnostics is collected, if entry
+        is missing.
+
+        Returns:
+            bool: True if entry was found, False otherwise.
+        """
+        _, expected = self._prepare_lookup(table_entry, strategies)
+        snapshot = self.snapshot(strategies, **locator_qualifiers)
+        return snapshot.find(expected) is not None
+
+    def find_entry_in_pages(
+        self,
+        table_entry: BackOfficeEntity,
+        strategies: LookupStrategiesType,
+        prefetch: bool = False,
+        **locator_qualifiers
+    ) -> tuple[str, int]:
+        """Finds entry like .find_entry(), but looks through all pages
+        of the table, starting from current one (see .iter_pages()).
+        Stops on the first page where entry was found.
+
+        Args:
+            table_entry (BackOfficeEntity): entity to look for.
+            strategies (tuple[EntryLookupStrategy]): list of
+            strategies to use.
+            prefetch (bool, optional): flag to load the next page while
+            current one is searched. Defaults to False.
+            **locator_qualifiers (optional): kwargs for formatting
+            base locator of the element.
+
+        Raises:
+            ValueError: if row was not found on any page.
+
+        Returns:
+            tuple[str, int]: URL of the page and row index (0-based)
+            of found entry.
+        """
+        target_values, expected = self._prepare_lookup(
+            table_entry, strategies
+        )
+
+        last_snapshot = None
+        pages = self.iter_pages(strategies, prefetch, **locator_qualifiers)
+        with closing(pages):
+            for snapshot in pages:
+                last_snapshot = snapshot
+                row_idx = snapshot.find(expected)
+                if row_idx is not None:
+                    self.log(
+                        "Find Entry resulted in ROW IDX: %s at page %s",
+                        row_idx, snapshot.url
+                    )
+                    return (snapshot.url, row_idx)
+
+        raise self._entry_not_found_error(
+            target_values, expected, strategies,
+            cast(TableSnapshot, last_snapshot), "any page of "
+        )
 
     def get_entry_texts(
         self,
         row_idx: int,
         strategy: ReadStrategiesType | LookupStrategiesType,
+        cached: bool = False,
         **locator_qualifiers
     ) -> list[str]:
         """Returns text from given row using given get_text_strategy.
@@ -182,6 +527,8 @@ class Table(BaseElement):
             tuple[EntryReadStrategy, ...] | tuple[EntryLookupStrategy, ...] ):
             list of strategies to use. Defaults to strategies set with
             .set_default_strategies(texts=...) method
+            cached (bool, optional): use snapshot cached by previous
+            read (see .snapshot()). Defaults to False.
             **locator_qualifiers (optional): kwargs for formatting
             base locator of the element.
 
@@ -196,6 +543,7 @@ class Table(BaseElement):
         return self._get_entry_data(
             row_idx=row_idx,
             strategy=cast(ReadStrategiesType, strategy),
+            cached=cached,
             **locator_qualifiers
         )
 
@@ -203,6 +551,7 @@ class Table(BaseElement):
         self,
         row_idx: int,
         strategy: ReadStrategiesType,
+        cached: bool = False,
         **locator_qualifiers
     ) -> list[str]:
         """Returns values from given row using given get_values_strategy.
@@ -214,7 +563,8 @@ class Table(BaseElement):
             tuple[EntryReadStrategy | EntryLookupStrat]): list of
             strategies to use. Defaults to strategies set with
             .set_default_strategies(values=...) method.
-
+            cached (bool, optional): use snapshot cached by previous
+            read (see .snapshot()). Defaults to False.
             **locator_qualifiers (optional): kwargs for formatting
             base locator of the element.
 
@@ -230,12 +580,14 @@ class Table(BaseElement):
         return self._get_entry_data(
             row_idx=row_idx,
             strategy=strategy,
+            cached=cached,
             **locator_qualifiers
         )
 
     def get_rows_content(
         self,
         columns: list[int] | tuple[int, ...] | None = None,
+        cached: bool = False,
         **locator_qualifiers,
     ) -> list[list[str]]:
         """Returns inner text content of all <td> blocks as list
@@ -244,60 +596,148 @@ class Table(BaseElement):
         Args:
             columns (list[int] | tuple[int], optional): columns number to
             get data from. Defaults to None (all columns included).
+            cached (bool, optional): use snapshot cached by previous
+            read (see .snapshot()). Defaults to False.
 
         Returns:
             list[tuple[str]]: rows text data, where index is row index,
             and tuple - inner text values of each cell in a row.
         """
-        table = self.get_locator(**locator_qualifiers)
-        columns_count = table.locator("thead th").count()
-        if columns is None:
-            columns = tuple(range(columns_count))
+        return self.snapshot(
+            cached=cached, **locator_qualifiers
+        ).get_rows_texts(columns)
 
-        output = []
-        rows_content = table.locator("tbody td").all_text_contents()
-        for i in range(0, len(rows_content), columns_count):
-            if not columns:
-                row_data = rows_content[i: i + columns_count]
-            else:
-                # Filter by given column indicies
-                row_data = []
-                for j in columns:
-                    row_data.append(rows_content[i + j])
+    def get_rows_hidden_values(
+        self, cached: bool = False, **locator_qualifiers
+    ) -> list[list[str]]:
+        """Returns values of hidden inputs in cells of each row"""
+        return self.snapshot(cached=cached, **locator_qualifiers).hidden
+
+    def _read_snapshot(
+        self, table: Locator, keys: list[StrategyKey]
+    ) -> TableSnapshot:
+        """Reads snapshot of the table by given locator"""
+        self.log("Reading table snapshot using strategies: %s", keys)
+        install_table_reader(table.page)
+        args = [[list(key) for key in keys], self.next_page_locator]
+        try:
+            data = table.first.evaluate(JS_SNIPPET_SNAPSHOT, args)
+            if data is None:
+                # Document was loaded before reader was registered
+                table.page.evaluate(JS_TABLE_READER)
+                data = table.first.evaluate(JS_SNIPPET_SNAPSHOT, args)
+        except Exception as exc:
+            exc.add_note(
+                "Error occured on attempting to read table's snapshot "
+                f"using strategies: {keys}"
+            )
+            raise
 
-            output.append([line.strip() for line in row_data])
+        return TableSnapshot.from_evaluated(data, keys)
 
-        return output
+    def _open_reader_tab(self) -> Page:
+        """Opens new tab to read next pages of the table"""
+        tab = self.page.context.new_page()
+        install_table_reader(tab)
+        return tab
+
+    def _prepare_lookup(
+        self,
+        table_entry: BackOfficeEntity,
+        strategies: LookupStrategiesType
+    ) -> tuple[dict, list[tuple[StrategyKey, str, bool]]]:
+        """Validates lookup strategies and entity, returns entity's lookup
+        params and expected values per strategy."""
+        for st in strategies:
+            if isinstance(st, EntryReadStrategy):
+                raise RuntimeError(
+                    "EntryReadStrategy should not be used "
+                    "for Entry Lookup (.find_entry). "
+                    "Use EntryLookupStrategy only!"
+                )
+
+        target_values = table_entry.get_lookup_params()
+
+        if not any(target_values.values()):
+            raise RuntimeError(
+                f"Impossible to look up for null entity {table_entry}! "
+                "At least 1 lookup field should not be None."
+            )
+
+        expected = [
+            (st.key, expected_value, st.is_primary_key)
+            for st in strategies
+            if (expected_value := st.get_expected_value(target_values))
+            is not None
+        ]
+
+        self.log(
+            "Going to Find Entry in table using strategy data: %s",
+            expected
+        )
+        return target_values, expected
+
+    def _entry_not_found_error(
+        self,
+        target_values: dict,
+        expected: list[tuple[StrategyKey, str, bool]],
+        strategies: LookupStrategiesType,
+        snapshot: TableSnapshot,
+        location: str = ""
+    ) -> ValueError:
+        """Returns error for missing entry, with rows that are nearest
+        to expected and capped dump of the table's content"""
+        nearest_matches = "\n".join([
+            f"  {i:>3}) {matched}/{len(expected)} matched: "
+            f"{snapshot.read(i, [key for key, _, _ in expected])}"
+            for i, matched in snapshot.nearest(expected, DIAGNOSTICS_MAX_ROWS)
+        ]) or "  none"
+
+        rows_to_dump = min(snapshot.row_count, DIAGNOSTICS_MAX_ROWS)
+        current_table_content = "\n".join([
+            f"  {i:>3}) {snapshot.get_row_texts(i)}"
+            for i in range(rows_to_dump)
+        ])
+        if snapshot.row_count > rows_to_dump:
+            current_table_content += (
+                f"\n  ... and {snapshot.row_count - rows_to_dump} more rows"
+            )
+
+        strategy_info = "\n  ".join([str(st) for st in strategies])
+        return ValueError(
+            f"There is no row with data like {target_values}, "
+            f"in {location}the {self.name}!\n"
+            "Nearest matches:\n"
+            f"{nearest_matches}\n"
+            f"Table content ({snapshot.row_count} rows):\n"
+            f"{current_table_content}\n"
+            "Strategy:\n"
+            f"  {strategy_info}"
+        )
 
     def _get_entry_data(
         self,
         row_idx: int,
         strategy: ReadStrategiesType,
+        cached: bool = False,
         **locator_qualifiers
     ) -> list[str]:
-        js_expr, strategy_data = self._prepare_read_expression(
-            strategy
-        )
-
+        keys = list(compile_strategies(strategy))
         self.log(
             "Going to Get Entry Texts/Values from table "
             "using strategy data: %s",
-            strategy_data
+            keys
         )
 
-        try:
-            row_data = self.get_row_locator(row_idx, **locator_qualifiers). \
-                evaluate(js_expr)
-        except Exception as exc:
-            exc.add_note(
-                "Error occured on attempting to retrieve table's "
-                f"row {row_idx} data using stratgy: {strategy_data}"
-            )
+        snapshot = self.snapshot(strategy, cached=cached, **locator_qualifiers)
+        row_data = None
+        if 0 <= row_idx < snapshot.row_count:
+            row_data = snapshot.read(row_idx, keys)
 
         if row_data is None:
             raise ValueError(
                 f"Failed to find or retrieve data from row {row_idx} "
-                f"using strategy: \n{strategy_data}"
+                f"using strategy: \n{keys}"
             )
 
         self.log(
@@ -307,84 +747,31 @@ class Table(BaseElement):
 
         return row_data
 
-    def _preprare_lookup_expression(
-        self,
-        strategy: LookupStrategiesType,
-        entity_fields_collection: dict[str, str | int]
-    ):
-        """Prepares JS expression using JS lookup snippet and
-        given strategy and fields collection.
-
-        Returns:
-            tuple[str, list[str]]: ready to use JS code and prepared
-            strategy data.
-        """
-        prepared_lookup_data = (
-            st.prepare_strategy_data(entity_fields_collection)
-            for st in strategy
-        )
-
-        strategy_data = [
-            prepared
-            for prepared in prepared_lookup_data
-            if prepared is not None
-        ]
-
-        snippet = JS_SNIPPET_FIND % ",".join(strategy_data)
-        return (snippet, strategy_data)
-
-    def _prepare_read_expression(
-        self,
-        strategy: ReadStrategiesType,
-    ) -> tuple[str, list[str]]:
-        """Prepares JS expression using given snippet and strategy.
-        If loadout was given - pass loadout values into a snippet.
-
-        Returns:
-            tuple[str, list[str]]: ready to use JS code and prepared
-            strategy data.
-        """
-        prepared_read_data = (
-            st.prepare_strategy_data() for st in strategy
-        )
-
-        strategy_data = [
-            prepared
-            for prepared in prepared_read_data
-            if prepared is not None
-        ]
-
-        snippet = JS_SNIPPET_GET_FROM_ROW % ",".join(strategy_data)
-        return (snippet, strategy_data)
-
     # --- Actions
     def evaluate_on_nested_elements(
         self, nested_locator: str, callback: str, **locator_qualifiers
-    ) -> list[tuple[Locator]]:
-        """Executes given JS code at each element found by
-        given locator and returns result of the function
-        callback.
+    ) -> list[Any]:
+        """Executes given JS code on elements found by given locator
+        in each row and returns results of the callback per row.
 
         Args:
             nested_locator (str): locator inside table body's
             cell (<td>).
-            callback (str): Javascript function to execute.
+            callback (str): Javascript function to execute, that takes
+            list of found elements.
 
         Returns:
-            list[tuple[Locator]]: _description_
+            list[Any]: results of the callback for each row.
         """
-
-        table = self.get_locator(**locator_qualifiers)
-        rows_count = table.locator("tbody tr").count()
-        output = []
-
-        for row_idx in range(rows_count):
-            row_result = table.locator(
-                f"tbody tr:nth-child({row_idx+1}) > td > {nested_locator}"
-            ).evaluate_all(callback)
-            output.append(row_result)
-
-        return output
+        return self.get_rows_locator(**locator_qualifiers).evaluate_all(
+            """(rows, [selector, callback]) => {
+              const func = new Function(`return (${callback});`)();
+              return rows.map(row => func(
+                Array.from(row.querySelectorAll(`:scope > td > ${selector}`))
+              ));
+            }""",
+            [nested_locator, callback]
+        )
 
     # --- Assertions
     def should_have_size_of(self, size: int, **locator_qualifiers) -> None:
@@ -411,6 +798,50 @@ class Table(BaseElement):
         ):
             expect(tbody).not_to_be_empty()
 
+    def entry_should_match(
+        self,
+        row_idx: int,
+        table_entry: BackOfficeEntity,
+        strategies: LookupStrategiesType,
+        cached: bool = False,
+        **locator_qualifiers
+    ) -> None:
+        """Asserts that values of the row, read by each of lookup
+        strategies, are equal to entry's lookup params. Unlike lookup,
+        strategies after matched primary key are checked too.
+
+        Args:
+            row_idx (int): row index (0-based) of the entry.
+            table_entry (BackOfficeEntity): expected entity.
+            strategies (tuple[EntryLookupStrategy]): list of
+            strategies to use.
+            cached (bool, optional): use snapshot cached by previous
+            read (see .snapshot()). Defaults to False.
+            **locator_qualifiers (optional): kwargs for formatting
+            base locator of the element.
+        """
+        target_values, _ = self._prepare_lookup(table_entry, strategies)
+        snapshot = self.snapshot(
+            strategies, cached=cached, **locator_qualifiers
+        )
+
+        mismatches = []
+        for st in strategies:
+            expected_value = st.get_expected_value(target_values)
+            actual_value = snapshot.derived[st.key][row_idx]
+            if expected_value is not None and actual_value != expected_value:
+                mismatches.append(
+                    f"  {st.field}: expected {expected_value!r}, "
+                    f"actual {actual_value!r}"
+                )
+
+        with allure.step(f"Entry at row {row_idx} should match to expected"):
+            assert not mismatches, (
+                f"Entry at row {row_idx} of the {self.name} does not match "
+                f"to {table_entry.get_lookup_params()}:\n"
+                + "\n".join(mismatches)
+            )
+
     @allure.step("Entry at row {row_idx} should be visible")
     def entry_should_be_visible(self, row_idx):
         """Asserts that row and it's first and last cell are visibile."""
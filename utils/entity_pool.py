@@ -0,0 +1,209 @@
+"""Pool of entities, pre-created in background for tests"""
+import logging
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from constants import API_MAX_WORKERS
+from utils import api_helpers as api
+from utils.models.base_entity import BackOfficeEntity
+from utils.models.entitiy_types import EntityType
+
+PoolKey = tuple[EntityType, tuple]
+
+
+def make_pool_key(
+    entity_type: EntityType, options: dict[str, Any] | None
+) -> PoolKey:
+    """Returns hashable pool key for entity type and generator options"""
+    return (entity_type, _freeze(options or {}))
+
+
+def _freeze(value: Any) -> Any:
+    """Converts dicts/lists to hashable tuples"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(val) for val in value)
+    return value
+
+
+class EntityPool:
+    """Pool of entities created via API in background threads.
+
+    Entities are pooled by entity type and generator options.
+    Pool is filled only for expected demand (number of tests that
+    will request entity of specific type/options), up to pool size
+    per key. Each acquired entity is refilled in background while
+    there is a demand for it.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        size: int,
+        max_workers: int = API_MAX_WORKERS,
+        acquire_timeout: float = 60
+    ) -> None:
+        """Instantiate pool.
+
+        Args:
+            base_url (str): host of the API.
+            username (str): admin username to use.
+            password (str): admin password to user.
+            size (int): max number of ready entities per pool key.
+            max_workers (int, optional): max number of concurrent
+            requests. Defaults to API_MAX_WORKERS.
+            acquire_timeout (float, optional): max time in seconds to
+            wait for pending entity on acquire. Defaults to 60.
+        """
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self._session = api.prepare_logged_admin_session(
+            base_url, username, password
+        )
+
+        self._ready: dict[PoolKey, deque[BackOfficeEntity]] = {}
+        self._options: dict[PoolKey, dict[str, Any] | None] = {}
+        self._pending: Counter[PoolKey] = Counter()
+        self._demand: Counter[PoolKey] = Counter()
+        self._leftovers: list[BackOfficeEntity] = []
+        self._closed = False
+
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="entity-pool"
+        )
+
+    def warm_up(
+        self,
+        demand: list[tuple[EntityType, dict[str, Any] | None]]
+    ) -> None:
+        """Registers expected demand for entities and starts creating
+        entities in background. Method returns immediately.
+
+        Args:
+            demand (list[tuple[EntityType, dict[str, Any] | None]]):
+            entity type and generator options for each expected
+            acquisition.
+        """
+        with self._cond:
+            for entity_type, options in demand:
+                key = make_pool_key(entity_type, options)
+                self._options[key] = options
+                self._demand[key] += 1
+
+            logging.info(
+                "[EntityPool] Warming up pool for demand: %s",
+                dict(self._demand)
+            )
+            for key in self._demand:
+                self._schedule_refill(key)
+
+    def acquire(
+        self,
+        entity_type: EntityType,
+        options: dict[str, Any] | None
+    ) -> BackOfficeEntity:
+        """Returns entity of given type and options from the pool.
+        If there is no ready or pending entity - creates entity
+        synchronously.
+
+        Args:
+            entity_type (EntityType): type of the entity.
+            options (dict[str, Any]): options for entity generator.
+
+        Returns:
+            BackOfficeEntity: entity created on backend.
+        """
+        key = make_pool_key(entity_type, options)
+        entity = None
+
+        with self._cond:
+            self._options.setdefault(key, options)
+            if self._demand[key]:
+                self._demand[key] -= 1
+
+            ready = self._ready.setdefault(key, deque())
+            if not ready and self._pending[key]:
+                self._cond.wait_for(
+                    lambda: bool(ready) or not self._pending[key],
+                    timeout=self.acquire_timeout
+                )
+
+            if ready:
+                entity = ready.popleft()
+            self._schedule_refill(key)
+
+        if entity is not None:
+            logging.info("[EntityPool] Entity taken from pool: %s", entity)
+            return entity
+
+        logging.info(
+            "[EntityPool] No pooled %s entity, creating one",
+            entity_type.value
+        )
+        entity = api.generate_entity(entity_type, options)
+        api.create_entity_request(entity_type, entity, self._session)
+        return entity
+
+    def close(self) -> list[BackOfficeEntity]:
+        """Stops refilling, waits for pending creations and
+        returns entities that were never acquired.
+
+        Returns:
+            list[BackOfficeEntity]: entities left in pool.
+        """
+        with self._cond:
+            self._closed = True
+
+        self._executor.shutdown(wait=True)
+
+        with self._cond:
+            leftovers = self._leftovers
+            for ready in self._ready.values():
+                leftovers.extend(ready)
+                ready.clear()
+            self._leftovers = []
+
+        logging.info("[EntityPool] Closed, %s entities left", len(leftovers))
+        return leftovers
+
+    def _schedule_refill(self, key: PoolKey) -> None:
+        """Submits creation of entities for given key to fill the pool
+        up to expected demand (but not more than pool size).
+        Should be called under lock."""
+        if self._closed:
+            return
+
+        available = len(self._ready.get(key, ())) + self._pending[key]
+        needed = min(self.size, self._demand[key]) - available
+
+        for _ in range(needed):
+            self._pending[key] += 1
+            self._executor.submit(self._create, key)
+
+    def _create(self, key: PoolKey) -> None:
+        """Creates entity for given pool key (runs in worker thread)"""
+        entity_type, _ = key
+        entity = api.generate_entity(entity_type, self._options[key])
+        created = True
+        try:
+            api.create_entity_request(entity_type, entity, self._session)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logging.warning(
+                "[EntityPool] Failed to create %s entity: %r",
+                entity_type.value, err
+            )
+            created = False
+
+        with self._cond:
+            self._pending[key] -= 1
+            if created and self._closed:
+                self._leftovers.append(entity)
+            elif created:
+                self._ready.setdefault(key, deque()).append(entity)
+            self._cond.notify_all()
@@ -0,0 +1,243 @@
+"""Vectorised (NumPy) port of pixelmatch image comparison.
+
+Keeps semantics of pixelmatch: perceptual color difference in YIQ space
+with threshold, and detection of anti-aliased pixels, which are not
+counted as mismatches. Anti-aliasing detection is done only for pixels
+that exceed the threshold, so comparison of similar images is cheap."""
+import numpy as np
+from PIL import Image
+
+# Max YIQ color delta (pixelmatch constant)
+MAX_YIQ_DELTA = 35215
+
+# Neighbour offsets (dx, dy) in pixelmatch's iteration order
+# (x - outer loop, y - inner loop), excluding pixel itself
+NEIGHBOURS = [
+    (dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy
+]
+
+# Number of candidate pixels checked for anti-aliasing at once
+# in fail fast mode
+FAIL_FAST_CHUNK = 1024
+
+AA_COLOR = (255, 255, 0)
+DIFF_COLOR = (255, 0, 0)
+
+
+def _blend(rgba: np.ndarray) -> np.ndarray:
+    """Blends RGB channels with white by alpha channel"""
+    rgb = rgba[..., :3]
+    alpha = rgba[..., 3:4] / 255
+    return 255 + (rgb - 255) * alpha
+
+
+def _rgb2y(rgb: np.ndarray) -> np.ndarray:
+    return rgb[..., 0] * 0.29889531 + rgb[..., 1] * 0.58662247 \
+        + rgb[..., 2] * 0.11448223
+
+
+def _rgb2i(rgb: np.ndarray) -> np.ndarray:
+    return rgb[..., 0] * 0.59597799 - rgb[..., 1] * 0.27417610 \
+        - rgb[..., 2] * 0.32180189
+
+
+def _rgb2q(rgb: np.ndarray) -> np.ndarray:
+    return rgb[..., 0] * 0.21147017 - rgb[..., 1] * 0.52261711 \
+        + rgb[..., 2] * 0.31114694
+
+
+class _ImageData:
+    """Pixel data of the image, padded by 1px for neighbours lookup"""
+
+    def __init__(self, image: Image.Image) -> None:
+        rgba = np.asarray(image.convert("RGBA"), dtype=np.int16)
+        self.height, self.width = rgba.shape[:2]
+        self.rgba = rgba
+        self.rgb = _blend(rgba.astype(np.float64))
+        self.y = _rgb2y(self.rgb)
+
+        # Padding never equals to real pixels/brightness
+        self.padded_rgba = np.pad(
+            rgba, ((1, 1), (1, 1), (0, 0)), constant_values=-1
+        )
+        self.padded_y = np.pad(self.y, 1, constant_values=np.nan)
+
+    def has_many_siblings(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Checks that pixels have more than 2 identical neighbours
+        (pixels at the edge of image count one extra)"""
+        center = self.padded_rgba[ys + 1, xs + 1]
+        zeroes = _is_edge(xs, ys, self.width, self.height).astype(np.int8)
+        for dx, dy in NEIGHBOURS:
+            zeroes += np.all(
+                self.padded_rgba[ys + 1 + dy, xs + 1 + dx] == center, axis=-1
+            )
+        return zeroes > 2
+
+
+def _is_edge(
+    xs: np.ndarray, ys: np.ndarray, width: int, height: int
+) -> np.ndarray:
+    return (xs == 0) | (xs == width - 1) | (ys == 0) | (ys == height - 1)
+
+
+def _antialiased(
+    img: _ImageData, other: _ImageData, xs: np.ndarray, ys: np.ndarray
+) -> np.ndarray:
+    """Checks that pixels of the image are likely anti-aliased
+    (pixelmatch's algorithm, vectorised over given pixels)"""
+    center = img.padded_y[ys + 1, xs + 1]
+    deltas = np.stack([
+        center - img.padded_y[ys + 1 + dy, xs + 1 + dx]
+        for dx, dy in NEIGHBOURS
+    ], axis=-1)
+
+    # Out of image neighbours (NaN) are not counted
+    zeroes = _is_edge(xs, ys, img.width, img.height) + np.sum(
+        deltas == 0, axis=-1
+    )
+    deltas = np.nan_to_num(deltas, nan=0.0)
+
+    offsets = np.array(NEIGHBOURS)
+    min_idx = np.argmin(deltas, axis=-1)
+    max_idx = np.argmax(deltas, axis=-1)
+    rows = np.arange(len(xs))
+    has_darker = deltas[rows, min_idx] < 0
+    has_brighter = deltas[rows, max_idx] > 0
+
+    # Coordinates are clipped for pixels without darker/brighter
+    # neighbours, as their result is discarded anyway
+    min_xs = np.clip(xs + offsets[min_idx, 0], 0, img.width - 1)
+    min_ys = np.clip(ys + offsets[min_idx, 1], 0, img.height - 1)
+    max_xs = np.clip(xs + offsets[max_idx, 0], 0, img.width - 1)
+    max_ys = np.clip(ys + offsets[max_idx, 1], 0, img.height - 1)
+
+    # Pixels with darker and brighter neighbours, where either
+    # the darkest or the brightest neighbour lies in flat area
+    # of both images
+    return (zeroes <= 2) & has_darker & has_brighter & (
+        (
+            img.has_many_siblings(min_xs, min_ys)
+            & other.has_many_siblings(min_xs, min_ys)
+        ) | (
+            img.has_many_siblings(max_xs, max_ys)
+            & other.has_many_siblings(max_xs, max_ys)
+        )
+    )
+
+
+def compare_images(
+    img1: Image.Image,
+    img2: Image.Image,
+    threshold: float = 0.1,
+    include_aa: bool = False,
+    fail_fast: bool = False,
+    diff: Image.Image | None = None,
+    alpha: float = 0.1
+) -> int:
+    """Compares images pixel by pixel the same way as pixelmatch does.
+
+    Args:
+        img1 (Image.Image): first image.
+        img2 (Image.Image): second image of the same size.
+        threshold (float, optional): matching threshold (0...1, bigger
+        more tolerant). Defaults to 0.1.
+        include_aa (bool, optional): count anti-aliased pixels as
+        mismatched. Defaults to False.
+        fail_fast (bool, optional): stop on the first mismatched pixel
+        (result is 0 or 1). Defaults to False.
+        diff (Image.Image, optional): RGBA image to draw difference to.
+        Not drawn in fail fast mode.
+        alpha (float, optional): opacity of unchanged pixels on
+        diff image. Defaults to 0.1.
+
+    Raises:
+        ValueError: if images have different sizes.
+
+    Returns:
+        int: number of mismatched pixels.
+    """
+    if img1.size != img2.size:
+        raise ValueError(
+            f"Image sizes do not match: {img1.size} vs {img2.size}"
+        )
+
+    data1 = _ImageData(img1)
+    data2 = _ImageData(img2)
+    identical = np.array_equal(data1.rgba, data2.rgba)
+    if identical and (diff is None or fail_fast):
+        return 0
+
+    delta = np.zeros(data1.y.shape)
+    if not identical:
+        rgb_delta = data1.rgb - data2.rgb
+        delta = (
+            0.5053 * _rgb2y(rgb_delta) ** 2
+            + 0.299 * _rgb2i(rgb_delta) ** 2
+            + 0.1957 * _rgb2q(rgb_delta) ** 2
+        )
+
+    ys, xs = np.nonzero(delta > MAX_YIQ_DELTA * threshold * threshold)
+
+    if fail_fast:
+        return int(_has_mismatch(data1, data2, xs, ys, include_aa))
+
+    aa = np.zeros(len(xs), dtype=bool)
+    if not include_aa:
+        aa = _antialiased_mask(data1, data2, xs, ys)
+
+    if diff is not None:
+        _draw_diff(diff, data1, xs, ys, aa, alpha)
+
+    return int(np.count_nonzero(~aa))
+
+
+def _antialiased_mask(
+    data1: _ImageData, data2: _ImageData, xs: np.ndarray, ys: np.ndarray
+) -> np.ndarray:
+    """Returns mask of the pixels, that are anti-aliased
+    in either of the images"""
+    if not len(xs):
+        return np.zeros(0, dtype=bool)
+
+    return _antialiased(data1, data2, xs, ys) | \
+        _antialiased(data2, data1, xs, ys)
+
+
+def _has_mismatch(
+    data1: _ImageData,
+    data2: _ImageData,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    include_aa: bool
+) -> bool:
+    """Checks that any of the pixels exceeding threshold is mismatched,
+    checking anti-aliasing by chunks to stop early"""
+    if include_aa:
+        return len(xs) > 0
+
+    for start in range(0, len(xs), FAIL_FAST_CHUNK):
+        chunk = slice(start, start + FAIL_FAST_CHUNK)
+        if not np.all(_antialiased_mask(data1, data2, xs[chunk], ys[chunk])):
+            return True
+    return False
+
+
+def _draw_diff(
+    diff: Image.Image,
+    data: _ImageData,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    aa: np.ndarray,
+    alpha: float
+) -> None:
+    """Draws faded first image with highlighted mismatched (red)
+    and anti-aliased (yellow) pixels to diff image"""
+    # Brightness of not blended pixels, as pixelmatch does
+    gray = 255 + (_rgb2y(data.rgba.astype(np.float64)) - 255) \
+        * alpha * data.rgba[..., 3] / 255
+    output = np.empty((data.height, data.width, 4), dtype=np.uint8)
+    output[..., :3] = np.clip(gray, 0, 255)[..., None]
+    output[..., 3] = 255
+    output[ys[aa], xs[aa], :3] = AA_COLOR
+    output[ys[~aa], xs[~aa], :3] = DIFF_COLOR
+    diff.paste(Image.fromarray(output, "RGBA"))
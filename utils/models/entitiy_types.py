@@ -14,6 +14,12 @@ class EntityType(StrEnum):
 
 @dataclass
 class EntityApiMapping:
+    """API requests of entity type and parameters to resolve ID
+    of created entity: name of entity's ID URL parameter and
+    entity's lookup field, displayed as link to edit form in
+    the table of entities"""
     create_url: str
     delete_url: str
     create_as_url_form: bool = True
+    id_param: str = ""
+    lookup_field: str = "name"
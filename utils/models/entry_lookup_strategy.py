@@ -1,9 +1,8 @@
 """Models related to Admin Table Component"""
-import json
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class EntryLookupStrategy:
     """Strategy definition for entry lookup in
     Admin Table Component.
@@ -38,12 +37,17 @@ class EntryLookupStrategy:
     apply_expression: str = "value.trim()"
     is_primary_key: bool = False
 
-    def prepare_strategy_data(
+    @property
+    def key(self) -> "StrategyKey":
+        """Returns key of the strategy, used to read data from
+        table snapshot (see EntryReadStrategy.key)"""
+        return self.to_read_strategy().key
+
+    def get_expected_value(
         self,
         entity_fields_collection: dict[str, str | int]
     ) -> str | None:
-        """Converts strategy data into JS-like array to be injected
-        into a snippet.
+        """Returns expected value of the strategy's field as string.
 
         Args:
             entity_fields_collection (dict[str, str | int]): field
@@ -51,23 +55,14 @@ class EntryLookupStrategy:
             TableEntry.get_lookup_params() method.
 
         Returns:
-            str: JS-like string containing strategy data.
+            str | None: expected value or None, if there is no value
+            for the field.
         """
         expected_value = entity_fields_collection.get(self.field, None)
         if expected_value is None:
             return None
 
-        output = json.dumps([
-            f"td:nth-child({self.column}) {self.selector}",
-            f"{expected_value}",
-            self.by_text,
-            "_EXPR_",
-            self.is_primary_key
-        ]).replace(
-            '"_EXPR_"', f"value => {self.apply_expression}"
-        )
-
-        return output
+        return f"{expected_value}"
 
     def to_read_strategy(self) -> 'EntryReadStrategy':
         """Converts object to EntryReadStrategy object"""
@@ -79,7 +74,7 @@ class EntryLookupStrategy:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class EntryReadStrategy:
     """Strategy definition for entry lookup in
     Admin Table Component.
@@ -117,23 +112,18 @@ class EntryReadStrategy:
             is_primary_key=is_primary_key
         )
 
-    def prepare_strategy_data(self) -> str:
-        """Converts strategy data into JS-like array to be injected
-        into a snippet.
-
-        Returns:
-            str: JS-like string containing strategy data.
-        """
-        output = json.dumps([
+    @property
+    def key(self) -> "StrategyKey":
+        """Returns key of the strategy: CSS selector of element inside
+        the row, flag to read innerText (or value) and JS expression
+        to apply. Used to read data from table snapshot."""
+        return (
             f"td:nth-child({self.column}) {self.selector}",
             self.by_text,
-            "_EXPR_"
-        ]).replace(
-            '"_EXPR_"', f"value => {self.apply_expression}"
+            self.apply_expression
         )
 
-        return output
-
 
+StrategyKey = tuple[str, bool, str]
 LookupStrategiesType = tuple[EntryLookupStrategy, ...]
 ReadStrategiesType = tuple[EntryReadStrategy, ...]
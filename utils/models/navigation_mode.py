@@ -0,0 +1,14 @@
+"""Modes of navigation between admin pages"""
+from enum import Enum
+
+
+class NavigationMode(Enum):
+    """Modes of navigation to category page:
+    - click: clicks category (and sub-category) buttons in side menu;
+    - direct: navigates to URL of the category page;
+    - auto: direct navigation, unless click is requested explicitly.
+    """
+
+    CLICK = "click"
+    DIRECT = "direct"
+    AUTO = "auto"
@@ -0,0 +1,176 @@
+"""Snapshot of the table content, read from the page at once"""
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+from .entry_lookup_strategy import StrategyKey
+
+
+@dataclass
+class TableSnapshot:
+    """Column-oriented content of the table's body.
+
+    Args:
+        url (str): URL of the page, where table was read.
+        next_page_url (str | None): URL of the next page of table's
+        pagination, None if it's the last page.
+        row_count (int): number of rows in the table's body.
+        headers (list[str]): texts of the table's header cells.
+        texts (list[list[str | None]]): text content of the cells
+        per column (texts[column][row]), None if row has no such cell.
+        values (list[list[str | None]]): values of the first input
+        element in the cells per column (values[column][row]),
+        None if there is no input in the cell.
+        hidden (list[list[str]]): values of hidden inputs per row.
+        links (list[list[str]]): hrefs of the links per row.
+        derived (dict[StrategyKey, list[str | None]]): values read
+        by strategy per row, None if strategy's element is missing.
+    """
+    url: str
+    next_page_url: str | None
+    row_count: int
+    headers: list[str]
+    texts: list[list[str | None]]
+    values: list[list[str | None]]
+    hidden: list[list[str]]
+    links: list[list[str]]
+    derived: dict[StrategyKey, list[str | None]] = field(
+        default_factory=dict
+    )
+    _indexes: dict[
+        tuple[StrategyKey, ...], dict[tuple[str | None, ...], int]
+    ] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_evaluated(
+        cls, data: dict[str, Any], keys: Sequence[StrategyKey]
+    ) -> "TableSnapshot":
+        """Creates snapshot from data returned by snapshot JS snippet
+        for given strategy keys"""
+        return cls(
+            url=data["url"],
+            next_page_url=data["next_page_url"],
+            row_count=data["rows"],
+            headers=data["headers"],
+            texts=data["texts"],
+            values=data["values"],
+            hidden=data["hidden"],
+            links=data["links"],
+            derived=dict(zip(keys, data["derived"]))
+        )
+
+    def has_keys(self, keys: Sequence[StrategyKey]) -> bool:
+        """Checks that snapshot contains values for all given
+        strategy keys"""
+        return all(key in self.derived for key in keys)
+
+    def get_row_texts(
+        self,
+        row_idx: int,
+        columns: Sequence[int] | None = None
+    ) -> list[str]:
+        """Returns text content of the row's cells (0-based columns,
+        all columns by default)"""
+        if columns is None:
+            columns = range(len(self.texts))
+
+        return [self.texts[column][row_idx] or "" for column in columns]
+
+    def get_rows_texts(
+        self,
+        columns: Sequence[int] | None = None
+    ) -> list[list[str]]:
+        """Returns text content of the cells of each row"""
+        return [
+            self.get_row_texts(row_idx, columns)
+            for row_idx in range(self.row_count)
+        ]
+
+    def read(
+        self,
+        row_idx: int,
+        keys: Sequence[StrategyKey]
+    ) -> list[str] | None:
+        """Returns values of the row read by given strategies.
+        Returns None if any of strategies failed to read value."""
+        output = []
+        for key in keys:
+            value = self.derived[key][row_idx]
+            if value is None:
+                return None
+            output.append(value)
+
+        return output
+
+    def find(
+        self,
+        expected: Sequence[tuple[StrategyKey, str, bool]]
+    ) -> int | None:
+        """Finds first row, where values read by strategies are equal
+        to expected. If value of primary key strategy is matching -
+        row is returned immediately, omitting checks of the following
+        strategies.
+
+        Lookup uses index by strategy keys, built on first lookup
+        and kept for the life of the snapshot.
+
+        Args:
+            expected (Sequence[tuple[StrategyKey, str, bool]]): strategy
+            key, expected value and primary key flag.
+
+        Returns:
+            int | None: row index (0-based) or None, if not found.
+        """
+        # Strategies after the first primary key are never checked
+        for idx, (_, _, is_primary_key) in enumerate(expected):
+            if is_primary_key:
+                expected = expected[:idx + 1]
+                break
+
+        keys = tuple(key for key, _, _ in expected)
+        values = tuple(value for _, value, _ in expected)
+        return self.get_index(keys).get(values)
+
+    def nearest(
+        self,
+        expected: Sequence[tuple[StrategyKey, str, bool]],
+        limit: int
+    ) -> list[tuple[int, int]]:
+        """Returns rows that match most of expected values (at least one),
+        best matches first.
+
+        Args:
+            expected (Sequence[tuple[StrategyKey, str, bool]]): strategy
+            key, expected value and primary key flag.
+            limit (int): max number of rows to return.
+
+        Returns:
+            list[tuple[int, int]]: row index and number of matched values.
+        """
+        matches = []
+        for row_idx in range(self.row_count):
+            matched = sum(
+                1 for key, expected_value, _ in expected
+                if self.derived[key][row_idx] == expected_value
+            )
+            if matched:
+                matches.append((row_idx, matched))
+
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches[:limit]
+
+    def get_index(
+        self, keys: tuple[StrategyKey, ...]
+    ) -> dict[tuple[str | None, ...], int]:
+        """Returns index of rows by values of given strategy keys
+        (first row for each combination of values)"""
+        index = self._indexes.get(keys)
+        if index is not None:
+            return index
+
+        index = {}
+        columns = [self.derived[key] for key in keys]
+        for row_idx, row_values in enumerate(zip(*columns)):
+            index.setdefault(row_values, row_idx)
+
+        self._indexes[keys] = index
+        return index
@@ -0,0 +1,222 @@
+"""Network profiles: declarative rules to abort or stub page requests,
+that are not asserted by tests (fonts, media, analytics, etc.).
+Provides classes and an instance accessing default 'network_profiles.ini'
+catalog."""
+import fnmatch
+import logging
+import re
+from configparser import ConfigParser
+from dataclasses import dataclass
+
+from playwright.sync_api import Page, Request, Response, Route
+
+from constants import NETWORK_PROFILES_REPOSITORY
+
+# Content type of the stubbed responses by request's resource type
+STUB_CONTENT_TYPES = {
+    "script": "application/javascript",
+    "stylesheet": "text/css",
+    "xhr": "application/json",
+    "fetch": "application/json",
+}
+
+# Sizes (bytes) of the resources, learned from responses of the pages.
+# Used to estimate amount of traffic saved by blocking.
+_known_sizes: dict[str, int] = {}
+
+
+def _compile_patterns(patterns: list[str]) -> re.Pattern[str] | None:
+    """Compiles list of shell-style URL patterns into single regex"""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    """Set of rules to block page requests.
+
+    Args:
+        name (str): name of the profile.
+        abort_resource_types (frozenset[str]): resource types
+        of requests to abort.
+        abort_urls (re.Pattern | None): pattern of URLs to abort.
+        stub_urls (re.Pattern | None): pattern of URLs to fulfil with
+        empty response.
+    """
+    name: str
+    abort_resource_types: frozenset[str] = frozenset()
+    abort_urls: re.Pattern[str] | None = None
+    stub_urls: re.Pattern[str] | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        """Returns True if profile doesn't block anything"""
+        return not (
+            self.abort_resource_types or self.abort_urls or self.stub_urls
+        )
+
+    def get_action(self, request: Request) -> str | None:
+        """Returns action for given request: 'abort', 'stub' or None
+        (request should be passed through)"""
+        if request.is_navigation_request():
+            return None
+
+        url = request.url
+        if self.stub_urls is not None and self.stub_urls.match(url):
+            return "stub"
+
+        if request.resource_type in self.abort_resource_types or (
+            self.abort_urls is not None and self.abort_urls.match(url)
+        ):
+            return "abort"
+
+        return None
+
+
+class NetworkProfileRepository:
+    """Class that reads network profiles catalog and provides
+    profiles by name."""
+
+    def __init__(self, file: str):
+        self.parser = ConfigParser()
+        with open(file, encoding="utf-8") as repo_file:
+            self.parser.read_file(repo_file)
+        self._profiles: dict[str, NetworkProfile] = {}
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the available profiles"""
+        return self.parser.sections()
+
+    def get(self, name: str) -> NetworkProfile:
+        """Returns profile of given name.
+
+        Args:
+            name (str): name of the profile (section of the catalog).
+
+        Raises:
+            ValueError: if there is no such profile.
+
+        Returns:
+            NetworkProfile: profile.
+        """
+        profile = self._profiles.get(name)
+        if profile is not None:
+            return profile
+
+        if not self.parser.has_section(name):
+            raise ValueError(
+                f'Unknown network profile "{name}", '
+                f'available profiles: {", ".join(self.names)}'
+            )
+
+        section = self.parser[name]
+        profile = NetworkProfile(
+            name=name,
+            abort_resource_types=frozenset(
+                value.strip()
+                for value in section.get("abort_resource_types", "").split(",")
+                if value.strip()
+            ),
+            abort_urls=_compile_patterns(
+                section.get("abort_urls", "").split()
+            ),
+            stub_urls=_compile_patterns(
+                section.get("stub_urls", "").split()
+            )
+        )
+        self._profiles[name] = profile
+        return profile
+
+
+class NetworkBlocker:
+    """Applies network profile to the page and counts blocked requests"""
+
+    def __init__(self, page: Page, profile: NetworkProfile) -> None:
+        self.page = page
+        self.profile = profile
+        # Resource type -> [number of requests, known bytes]
+        self.blocked: dict[str, list[int]] = {}
+        self._aborted_urls: set[str] = set()
+
+    def install(self) -> "NetworkBlocker":
+        """Installs route handler to the page (if profile is not empty)
+        and starts learning sizes of loaded resources"""
+        self.page.on("response", self._learn_size)
+        if not self.profile.is_empty:
+            self.page.route("**/*", self._handle)
+        return self
+
+    def uninstall(self) -> None:
+        """Removes route handler and listener from the page
+        (e.g. before page is reused by another test)"""
+        self.page.remove_listener("response", self._learn_size)
+        if not self.profile.is_empty:
+            self.page.unroute("**/*", self._handle)
+
+    @property
+    def requests(self) -> int:
+        """Total number of blocked requests"""
+        return sum(count for count, _ in self.blocked.values())
+
+    @property
+    def bytes(self) -> int:
+        """Total size of blocked resources (only known sizes)"""
+        return sum(size for _, size in self.blocked.values())
+
+    def is_aborted(self, request: Request) -> bool:
+        """Returns True if request was aborted by profile"""
+        return request.url in self._aborted_urls
+
+    def summary(self) -> str:
+        """Returns text report of blocked requests"""
+        lines = [
+            f"Profile: {self.profile.name}",
+            f"Blocked requests: {self.requests}",
+            f"Blocked bytes (known sizes): {self.bytes}",
+        ]
+        lines.extend(
+            f"  {resource_type}: {count} request(s), {size} byte(s)"
+            for resource_type, (count, size) in sorted(self.blocked.items())
+        )
+        return "\n".join(lines)
+
+    def _handle(self, route: Route) -> None:
+        """Aborts, stubs or passes through request by profile's rules"""
+        request = route.request
+        action = self.profile.get_action(request)
+        if action is None:
+            route.fallback()
+            return
+
+        counter = self.blocked.setdefault(request.resource_type, [0, 0])
+        counter[0] += 1
+        counter[1] += _known_sizes.get(request.url, 0)
+
+        if action == "abort":
+            self._aborted_urls.add(request.url)
+            route.abort("blockedbyclient")
+        else:
+            route.fulfill(
+                status=200,
+                body="",
+                content_type=STUB_CONTENT_TYPES.get(
+                    request.resource_type, "text/plain"
+                )
+            )
+
+        logging.debug(
+            "Request %s (%s) blocked by network profile '%s' (%s)",
+            request.url, request.resource_type, self.profile.name, action
+        )
+
+    @staticmethod
+    def _learn_size(response: Response) -> None:
+        """Remembers size of the loaded resource"""
+        size = response.headers.get("content-length")
+        if size and size.isdigit():
+            _known_sizes[response.url] = int(size)
+
+
+network_profiles = NetworkProfileRepository(NETWORK_PROFILES_REPOSITORY)
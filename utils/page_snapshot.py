@@ -0,0 +1,122 @@
+"""Snapshot assertion of the page: compares whole viewport or page
+regions with golden snapshots of pytest-playwright-visual, skipping
+pixel comparison of screenshots identical to golden ones."""
+import logging
+import sys
+from typing import Callable
+
+import allure  # type: ignore
+import pytest
+from playwright.sync_api import Page
+
+from utils.compare_service import compare_service
+from utils.snapshot_hash import get_golden_path, matches_golden
+
+
+class PageSnapshot:
+    """Callable assertion of the page's snapshot, that is set as
+    page's 'assert_snapshot' attribute (see BasePage)."""
+
+    def __init__(
+        self,
+        page: Page,
+        request: pytest.FixtureRequest,
+        assert_snapshot: Callable,
+        threshold: float
+    ) -> None:
+        """Instantiate assertion.
+
+        Args:
+            page (Page): page to take screenshots of.
+            request (pytest.FixtureRequest): request of the test.
+            assert_snapshot (Callable): pytest-playwright-visual's
+            snapshot assertion.
+            threshold (float): comparison threshold (0...1).
+        """
+        self.page = page
+        self.request = request
+        self.assert_snapshot = assert_snapshot
+        self.threshold = threshold
+        self.update_snapshots = request.config.getoption(
+            "--update-snapshots", default=False
+        )
+
+    def __call__(
+        self,
+        regions: dict[str, str] | None = None,
+        masks: list[str] | None = None
+    ) -> None:
+        """Compares whole viewport or each of given regions (name and
+        selector) with golden snapshots, masking volatile content"""
+        mask = [self.page.locator(selector) for selector in masks or []]
+        if regions and not self._should_compare_regions(regions):
+            # Regional goldens are not generated yet - keep comparing
+            # with full viewport golden until '--update-snapshots' run
+            logging.info(
+                "No golden snapshots of regions, comparing whole viewport"
+            )
+            regions = None
+
+        if not regions:
+            self.compare(self.page.screenshot(mask=mask))
+            return
+
+        failed = []
+        for region, selector in regions.items():
+            screenshot = self.page.locator(selector).first.screenshot(
+                mask=mask
+            )
+            try:
+                self.compare(screenshot, self.get_region_name(region))
+            except pytest.fail.Exception as err:
+                failed.append(f"{region}: {err}")
+                allure.attach(
+                    screenshot,
+                    f"Snapshot of region '{region}'",
+                    allure.attachment_type.PNG
+                )
+
+        if failed:
+            pytest.fail(
+                "Snapshot regions do not match:\n" + "\n".join(failed)
+            )
+
+    def get_region_name(self, region: str) -> str:
+        """Returns file name of golden snapshot of page region"""
+        return f"{self.request.node.name}[{region}][{sys.platform}].png"
+
+    def compare(self, screenshot: bytes, name: str | None = None) -> None:
+        """Compares screenshot with golden snapshot of given name
+        (default name of pytest-playwright-visual if not given)"""
+        # Fast path: skip pixel comparison if screenshot is identical
+        # to golden snapshot by block hash
+        golden = get_golden_path(self.request, name)
+        if not self.update_snapshots and matches_golden(golden, screenshot):
+            logging.info("Snapshot is identical to golden snapshot")
+            return
+
+        # Pixel comparison in background process, if enabled
+        # (new or updated snapshots are handled by plugin)
+        if compare_service.enabled and golden.exists() and (
+            not self.update_snapshots
+        ):
+            compare_service.submit(
+                f"Snapshot {golden.name}",
+                golden.read_bytes(),
+                screenshot,
+                threshold=self.threshold
+            )
+            return
+
+        options = {"name": name} if name else {}
+        self.assert_snapshot(screenshot, threshold=self.threshold, **options)
+
+    def _should_compare_regions(self, regions: dict[str, str]) -> bool:
+        """Checks that regions should be compared: any of regions
+        has golden snapshot, snapshots are updated or there is no
+        full viewport golden snapshot to fall back to"""
+        return self.update_snapshots or any(
+            get_golden_path(self.request, self.get_region_name(region))
+            .exists()
+            for region in regions
+        ) or not get_golden_path(self.request).exists()
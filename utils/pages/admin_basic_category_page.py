@@ -1,9 +1,7 @@
 """Admin category page (unspecified)"""
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
-import pytest
 import allure  # type: ignore
-from playwright.sync_api import Page
 
 from utils.models.base_entity import BackOfficeEntity
 from utils.models.entry_lookup_strategy import (
@@ -13,7 +11,7 @@ from utils.models.entry_lookup_strategy import (
     ReadStrategiesType
 )
 from utils.components import AdminSideMenu, AdminTopMenu
-from utils.elements import Title, Table
+from utils.elements import Title, Table, LazyElement
 
 from .base_page import BasePage
 
@@ -26,26 +24,33 @@ class AdminBasicCategoryPage(BasePage):
     Supports only minumal number of common elements.
     Use specific category pages for advanced use."""
 
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
+    header_title = LazyElement(
+        Title, "#main #content .card-title", "Title of the category"
+    )
 
-        self.header_title = Title(
-            page, "#main #content .card-title", "Title of the category"
-        )
+    top_menu = LazyElement(AdminTopMenu)
 
-        self.top_menu = AdminTopMenu(page)
-        self.side_menu = AdminSideMenu(page)
+    side_menu = LazyElement(AdminSideMenu)
 
-        self.table = Table(
-            page, "#main #content table",
-            "Main Table"
-        )
+    table = LazyElement(Table, "#main #content table", "Main Table")
 
     @property
     def url(self):
         """Return page's path URL."""
         return "/admin"
 
+    @property
+    def ready_selector(self):
+        return "#main #content .card-title"
+
+    @property
+    def snapshot_regions(self):
+        return {
+            "title": "#main #content .card-title",
+            "table_header": "#main #content table thead",
+            "table_body": "#main #content table tbody"
+        }
+
     @property
     def header(self) -> str:
         """Page header text"""
@@ -95,7 +100,8 @@ class AdminBasicCategoryPage(BasePage):
         Args (exclusive):
             entity (BackOfficeEntity): entity to find.
             update_entity_id (bool, optional). flag to update given entity
-            with found ID. Defaults to False.
+            with found ID. Defaults to False (ID is updated only if entity
+            have no ID yet).
 
         Returns:
             int: row index.
@@ -109,10 +115,16 @@ class AdminBasicCategoryPage(BasePage):
         row_idx = self.table.find_entry(entity, self.table_row_lookup_strategy)
         self.log("Entity was found at row %s", row_idx)
 
-        if update_entity_id:
+        # Lookup stops at matched ID, so other fields are checked apart
+        self.table.entry_should_match(
+            row_idx, entity, self.table_row_lookup_strategy, cached=True
+        )
+
+        if update_entity_id or entity.entity_id is None:
             entity.entity_id = int(self.table.get_entry_texts(
                 row_idx,
-                (self.entity_id_get_value_strategy, )
+                (self.entity_id_get_value_strategy, ),
+                cached=True
             )[0])
 
         allure.attach(
@@ -122,6 +134,55 @@ class AdminBasicCategoryPage(BasePage):
 
         return row_idx
 
+    def find_many(
+        self,
+        entities: Sequence[BackOfficeEntity],
+        update_entity_id: bool = False
+    ) -> list[tuple[BackOfficeEntity, int]]:
+        """Looks for given entities in the table, reading table only once.
+
+        Args (exclusive):
+            entities (Sequence[BackOfficeEntity]): entities to find.
+            update_entity_id (bool, optional). flag to update given entities
+            with found ID. Defaults to False (ID is updated only if entity
+            have no ID yet).
+
+        Returns:
+            list[tuple[BackOfficeEntity, int]]: entity and it's row index.
+        """
+        self.log("Looking for %s entities", len(entities))
+
+        # Read lookup and ID values at once
+        self.table.snapshot((
+            *self.table_row_lookup_strategy,
+            self.entity_id_get_value_strategy
+        ))
+        rows = self.table.find_entries(
+            entities, self.table_row_lookup_strategy, cached=True
+        )
+
+        for entity, row_idx in zip(entities, rows):
+            self.table.entry_should_match(
+                row_idx, entity, self.table_row_lookup_strategy, cached=True
+            )
+            if update_entity_id or entity.entity_id is None:
+                entity.entity_id = int(self.table.get_entry_texts(
+                    row_idx,
+                    (self.entity_id_get_value_strategy, ),
+                    cached=True
+                )[0])
+
+        found = list(zip(entities, rows))
+        allure.attach(
+            "\n".join(
+                f"At Row {row_idx}. Entity: {entity}"
+                for entity, row_idx in found
+            ),
+            "Entries Found", allure.attachment_type.TEXT
+        )
+
+        return found
+
     def get_row_text_for_entity(self, entity: BackOfficeEntity) -> list[str]:
         """Returns texts from given row index.
 
@@ -137,7 +198,7 @@ class AdminBasicCategoryPage(BasePage):
             self.table.entry_should_be_visible(row_idx)
 
         table_data = self.table.get_entry_texts(
-            row_idx, self.table_get_row_text_strategy
+            row_idx, self.table_get_row_text_strategy, cached=True
         )
 
         return table_data
@@ -176,7 +237,10 @@ class AdminBasicCategoryPage(BasePage):
         Args:
             entity (BackOfficeEntity): entity to look for.
         """
-        with pytest.raises(
-            ValueError, match=r"There is no row with data like.*"
-        ):
-            self.find_in_table(entity)
+        self.log(
+            "Checking that entity like %s is missing",
+            entity.get_lookup_params()
+        )
+        assert not self.table.has_entry(
+            entity, self.table_row_lookup_strategy
+        ), f"Entity like {entity.get_lookup_params()} is present in table!"
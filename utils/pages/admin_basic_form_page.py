@@ -1,10 +1,9 @@
 """Admin form page (unspecified)"""
 
 import allure  # type: ignore
-from playwright.sync_api import Page
 
 from utils.components import AdminSideMenu, AdminTopMenu
-from utils.elements import Title, Button
+from utils.elements import Title, Button, LazyElement
 
 from .base_page import BasePage
 
@@ -14,27 +13,35 @@ class AdminBasicFormPage(BasePage):
     Supports only minumal number of common elements.
     Use specific category pages for advanced use."""
 
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
+    header_title = LazyElement(
+        Title, "#main #content .card-title", "Form Title"
+    )
 
-        self.header_title = Title(
-            page, "#main #content .card-title", "Form Title"
-        )
-        self.top_menu = AdminTopMenu(page)
-        self.side_menu = AdminSideMenu(page)
+    top_menu = LazyElement(AdminTopMenu)
 
-        self.save_button = Button(
-            page, "#content .card-action button[name='save']", "Save"
-        )
-        self.cancel_button = Button(
-            page, "#content .card-action button[name='cancel']", "Cancel"
-        )
+    side_menu = LazyElement(AdminSideMenu)
+
+    save_button = LazyElement(
+        Button, "#content .card-action button[name='save']", "Save"
+    )
+
+    cancel_button = LazyElement(
+        Button, "#content .card-action button[name='cancel']", "Cancel"
+    )
 
     @property
     def url(self):
         """Return page's path URL."""
         return "/admin/?"
 
+    @property
+    def ready_selector(self):
+        return "#main #content .card-title"
+
+    @property
+    def snapshot_regions(self):
+        return {"content": "#main #content"}
+
     @property
     def header(self) -> str:
         """Page header text"""
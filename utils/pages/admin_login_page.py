@@ -1,8 +1,7 @@
 """Admin Login page"""
 import allure  # type: ignore
-from playwright.sync_api import Page
 
-from utils.elements import Button, Input, Label
+from utils.elements import Button, Input, Label, LazyElement
 from utils.helpers import mask_string_value
 
 from .admin_main_page import AdminMainPage
@@ -12,19 +11,19 @@ from .base_page import BasePage
 class AdminLoginPage(BasePage):
     """Admin login page"""
 
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
+    username_input = LazyElement(
+        Input, "input[name=username]", "Username field"
+    )
 
-        self.username_input = Input(
-            page, "input[name=username]", "Username field"
-        )
-        self.password_input = Input(
-            page, "input[name=password]", "Password field"
-        )
-        self.login_button = Button(page, "button[name=login]", "Login button")
-        self.failed_login_banner = Label(
-            page, ".alert-danger", "Failed login notification"
-        )
+    password_input = LazyElement(
+        Input, "input[name=password]", "Password field"
+    )
+
+    login_button = LazyElement(Button, "button[name=login]", "Login button")
+
+    failed_login_banner = LazyElement(
+        Label, ".alert-danger", "Failed login notification"
+    )
 
     @property
     def url(self):
@@ -34,9 +33,23 @@ class AdminLoginPage(BasePage):
     def name(self):
         return "Admin/Login"
 
+    @property
+    def ready_selector(self):
+        return "button[name=login]"
+
+    @property
+    def snapshot_regions(self):
+        return {"login_form": "form[name=login_form]"}
+
     def _verify_page_items(self):
         self.login_button.should_be_visible()
 
+    @staticmethod
+    def is_login_url(url: str) -> bool:
+        """Checks that given URL is URL of login form
+        (e.g. unauthorized user was redirected to login form)"""
+        return "/admin/login.php" in url
+
     def login(
         self,
         username: str,
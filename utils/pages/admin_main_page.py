@@ -1,9 +1,8 @@
 """Admin main page (after login)"""
 import allure  # type: ignore
-from playwright.sync_api import Page
 
 from utils.components import AdminSideMenu, AdminTopMenu
-from utils.elements import Label
+from utils.elements import Label, LazyElement
 
 from .base_page import BasePage
 
@@ -11,14 +10,13 @@ from .base_page import BasePage
 class AdminMainPage(BasePage):
     """Admin main page (after login)"""
 
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
+    notification_banner = LazyElement(
+        Label, ".alert-success", "Log In notification banner"
+    )
+
+    top_menu = LazyElement(AdminTopMenu)
 
-        self.notification_banner = Label(
-            page, ".alert-success", "Log In notification banner"
-        )
-        self.top_menu = AdminTopMenu(page)
-        self.side_menu = AdminSideMenu(page)
+    side_menu = LazyElement(AdminSideMenu)
 
     @property
     def url(self):
@@ -28,6 +26,10 @@ class AdminMainPage(BasePage):
     def name(self):
         return "Admin/Dashboard"
 
+    @property
+    def ready_selector(self):
+        return "#sidebar"
+
     # -- Actions
     def _verify_page_items(self):
         self.side_menu.should_be_visible()
@@ -1,10 +1,48 @@
 """Base page class to inherit by other pages"""
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from typing import Literal
 
 import allure  # type: ignore
 from playwright.sync_api import Page, Response, expect
 
+LoadState = Literal["commit", "domcontentloaded", "load", "networkidle"]
+
+
+class PageLoadStats:
+    """Statistics of waiting for pages to be ready after navigation,
+    grouped by page class and wait strategy"""
+
+    def __init__(self) -> None:
+        self._stats: dict[tuple[str, str], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, page_cls: str, strategy: str, seconds: float) -> None:
+        """Records wait time of the page"""
+        with self._lock:
+            self._stats.setdefault((page_cls, strategy), []).append(seconds)
+
+    def summary(self) -> dict[str, dict[str, float | int | str]]:
+        """Returns count, average and max wait time per page class
+        and strategy"""
+        with self._lock:
+            stats = dict(self._stats)
+
+        return {
+            page_cls: {
+                "strategy": strategy,
+                "count": len(waits),
+                "avg": round(sum(waits) / len(waits), 3),
+                "max": round(max(waits), 3)
+            }
+            for (page_cls, strategy), waits in stats.items()
+        }
+
+
+page_load_stats = PageLoadStats()
+
 
 class BasePage(ABC):
     """Basic class for page"""
@@ -24,10 +62,55 @@ class BasePage(ABC):
         """Name of the page for logging"""
         return "Default Page"
 
+    @property
+    def ready_selector(self) -> str | None:
+        """Selector of the element, that should be visible
+        when page is ready (None - page is ready on load state)"""
+        return None
+
+    @property
+    def ready_state(self) -> LoadState:
+        """Load state of the page, that should be reached
+        when page is ready"""
+        return "domcontentloaded"
+
+    @property
+    def snapshot_regions(self) -> dict[str, str]:
+        """Named selectors of page regions, that are compared with
+        their own golden snapshots (empty - whole viewport is compared)"""
+        return {}
+
+    @property
+    def snapshot_masks(self) -> list[str]:
+        """Selectors of volatile content to mask on snapshots"""
+        return []
+
     def log(self, msg: str, *args, level: int = logging.INFO):
         """Logs message"""
         logging.log(level, f"[Page: {self.name}] {msg}", *args)
 
+    def wait_until_ready(self) -> None:
+        """Waits for page's readiness contract: page's ready state
+        and visibility of page's ready selector (if any).
+        Wait time is recorded to page load stats."""
+        strategy = self.ready_state
+        if self.ready_selector:
+            strategy = f"{strategy} + {self.ready_selector}"
+
+        started = time.perf_counter()
+        self.page.wait_for_load_state(self.ready_state)
+        if self.ready_selector:
+            self.page.locator(self.ready_selector).first.wait_for(
+                state="visible"
+            )
+        waited = time.perf_counter() - started
+
+        page_load_stats.record(type(self).__name__, strategy, waited)
+        self.log(
+            "Page is ready (%s) in %.3f sec", strategy, waited,
+            level=logging.DEBUG
+        )
+
     def verify_page(self):
         """Verifies that page's key content present as Allure step"""
         self.log("Verification started")
@@ -51,12 +134,19 @@ class BasePage(ABC):
         self.log('Cheking page title to be "%s"', title)
         expect(self.page).to_have_title(title)
 
-    def visit(self, url: str | None = None) -> Response | None:
+    def visit(
+        self,
+        url: str | None = None,
+        wait_until: LoadState | None = None
+    ) -> Response | None:
         """Navigates to page.
 
         Args:
             url (str, optional): URL to navigate to. If not given -
             page's specific default URL will be used.
+            wait_until (str, optional): event to wait for navigation
+            to be considered complete. Defaults to None - navigation
+            is waited until commit, then page's readiness is awaited.
 
         Returns:
             Response | None: result of get request to page URL.
@@ -69,14 +159,18 @@ class BasePage(ABC):
         self.log("Visiting page with URL: %s", target_url)
 
         with allure.step(f"Visiting {target_url}"):
-            response = self.page.goto(target_url, wait_until="networkidle")
+            response = self.page.goto(
+                target_url, wait_until=wait_until or "commit"
+            )
+            if wait_until is None:
+                self.wait_until_ready()
 
         self.log("URL: %s is visited", target_url)
 
         return response
 
     def reload(self) -> Response | None:
-        """Reloads current page.
+        """Reloads current page and waits for page's readiness.
 
         Returns:
             Response | None: result of get request to page URL.
@@ -84,17 +178,34 @@ class BasePage(ABC):
         self.log("Reloading current page (URL: %s)", self.page.url)
 
         with allure.step(f"Reloading page {self.page.url}"):
-            response = self.page.reload(wait_until="domcontentloaded")
+            response = self.page.reload(wait_until="commit")
+            self.wait_until_ready()
 
         self.log("Page (URL: %s) reloaded", self.page.url)
         return response
 
     @allure.step("Snapshot of page visually matches to expected")
-    def should_match_snapshot(self) -> None:
+    def should_match_snapshot(self, regions: list[str] | None = None) -> None:
         """Checks page snapshot (screenshot) to match to
-        'golden' snapshot"""
-        self.log("Checking visual snapshot of the page")
+        'golden' snapshot. If page declares snapshot regions - each
+        region is captured and compared independently.
+
+        Args:
+            regions (list[str], optional): names of the page's snapshot
+            regions to check. Defaults to None - all regions.
+        """
+        snapshot_regions = self.snapshot_regions
+        if regions is not None:
+            snapshot_regions = {
+                name: snapshot_regions[name] for name in regions
+            }
+
+        self.log(
+            "Checking visual snapshot of the page (regions: %s)",
+            ", ".join(snapshot_regions) or "viewport"
+        )
+        # Screenshot requires all page's assets to be loaded
+        self.page.wait_for_load_state("networkidle")
         assert_snapshot = getattr(self.page, "assert_snapshot")
         if assert_snapshot:
-            assert_snapshot()
-        # self.page.assert_snapshot()  # type: ignore[attr-defined]
+            assert_snapshot(snapshot_regions, self.snapshot_masks)
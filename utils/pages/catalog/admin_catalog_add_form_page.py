@@ -1,70 +1,65 @@
 """Admin / Catalog / Create New Product form"""
 import allure  # type: ignore
 
-from playwright.sync_api import Page
-
 from utils.models.admin_catalog import ProductEntity, ProductFormTab
-from utils.elements import Button, Input, Textarea
+from utils.elements import Button, Input, Textarea, LazyElement
 from ..admin_basic_form_page import AdminBasicFormPage
 
 
 class AdminCatalogAddFormPage(AdminBasicFormPage):
     """Represents Admin / Catalog / Create New Product form"""
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
-
-        self.active_tab = Button(
-            page, "#content nav a.active",
-            "Active Tab"
-        )
-        self.form_tabs = Button(
-            page, "#content nav a[href='#tab-{name}']",
-            "Form Tab"
-        )
-
-        self.general_name_input = Input(
-            page, "#tab-general input[name='name[en]']",
-            "General/Name"
-        )
-        self.general_price_input = Input(
-            page, "#tab-general input[name='prices[USD]']",
-            "General/Price"
-        )
-        self.general_sku_input = Input(
-            page, "#tab-general input[name=sku]",
-            "General/SKU"
-        )
-        self.general_add_image_button = Button(
-            page, "#tab-general #images a.add",
-            "General/Add Image"
-        )
-
-        self.general_new_image_file_input = Input(
-            page,
-            "#tab-general #images div.new-images "
-            "div.image input",
-            "General/Last New Image"
-        )
-        self.general_new_image_index_input = Input(
-            page,
-            "#tab-general #images div.new-images "
-            "div.image:nth-child({idx}]) input",
-            "General/New Image"
-        )
-
-        self.info_short_desc_input = Input(
-            page, "#tab-information input[name*=short_description]",
-            "Information/Short Description"
-        )
-        self.info_desc_input = Textarea(
-            page, "#tab-information textarea[name^=description]",
-            "Information/Description"
-        )
-
-        self.stock_quantity = Input(
-            page, "#tab-stock tbody input[name=quantity]",
-            "Stock/Quantity"
-        )
+
+    active_tab = LazyElement(Button, "#content nav a.active", "Active Tab")
+
+    form_tabs = LazyElement(
+        Button, "#content nav a[href='#tab-{name}']", "Form Tab"
+    )
+
+    general_name_input = LazyElement(
+        Input, "#tab-general input[name='name[en]']", "General/Name"
+    )
+
+    general_price_input = LazyElement(
+        Input, "#tab-general input[name='prices[USD]']", "General/Price"
+    )
+
+    general_sku_input = LazyElement(
+        Input, "#tab-general input[name=sku]", "General/SKU"
+    )
+
+    general_add_image_button = LazyElement(
+        Button, "#tab-general #images a.add", "General/Add Image"
+    )
+
+    general_new_image_file_input = LazyElement(
+        Input,
+        "#tab-general #images div.new-images "
+        "div.image input",
+        "General/Last New Image"
+    )
+
+    general_new_image_index_input = LazyElement(
+        Input,
+        "#tab-general #images div.new-images "
+        "div.image:nth-child({idx}]) input",
+        "General/New Image"
+    )
+
+    info_short_desc_input = LazyElement(
+        Input,
+        "#tab-information input[name*=short_description]",
+        "Information/Short Description"
+    )
+
+    info_desc_input = LazyElement(
+        Textarea,
+        "#tab-information textarea[name^=description]",
+        "Information/Description"
+    )
+
+    stock_quantity = LazyElement(
+        Input, "#tab-stock tbody input[name=quantity]", "Stock/Quantity"
+    )
 
     @property
     def url(self):
@@ -4,13 +4,34 @@ import allure  # type: ignore
 from playwright.sync_api import Page, expect
 
 from utils.models.admin_catalog import ProductEntity, ProductFormTab
-from utils.elements import Button, Image
+from utils.elements import Button, Image, LazyElement
 
 from .admin_catalog_add_form_page import AdminCatalogAddFormPage
 
 
 class AdminCatalogEditFormPage(AdminCatalogAddFormPage):
     """Represents Admin -> Catalog -> Edit Product page"""
+
+    delete_button = LazyElement(
+        Button, "#content .card-action button[name='delete']", "Delete"
+    )
+
+    general_added_images = LazyElement(
+        Image, "#tab-general #images div.images img", "Added Images"
+    )
+
+    general_added_image = LazyElement(
+        Image,
+        "#tab-general #images div.images img:nth-child({idx})",
+        "Added Image"
+    )
+
+    general_remove_image_button = LazyElement(
+        Button,
+        "#tab-general div.images div.form-group:last-child a.remove",
+        "Remove Image"
+    )
+
     def __init__(
         self, page: Page, entity_id: int, entity_name: str
     ) -> None:
@@ -19,23 +40,6 @@ class AdminCatalogEditFormPage(AdminCatalogAddFormPage):
         self.entity_id = entity_id
         self.entity_name = entity_name
 
-        self.delete_button = Button(
-            page, "#content .card-action button[name='delete']", "Delete"
-        )
-
-        self.general_added_images = Image(
-            page, "#tab-general #images div.images img",
-            "Added Images"
-        )
-        self.general_added_image = Image(
-            page, "#tab-general #images div.images img:nth-child({idx})",
-            "Added Image"
-        )
-        self.general_remove_image_button = Button(
-            page, "#tab-general div.images div.form-group:last-child a.remove",
-            "Remove Image"
-        )
-
     @property
     def url(self):
         return (
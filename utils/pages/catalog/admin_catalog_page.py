@@ -2,13 +2,13 @@
 import allure  # type: ignore
 from typing import cast
 
-from playwright.sync_api import Page
 from utils.models.admin_catalog import ProductEntity
 from utils.models.entry_lookup_strategy import (
     EntryLookupStrategy,
     LookupStrategiesType
 )
-from utils.elements import Button, Label
+from utils.models.navigation_mode import NavigationMode
+from utils.elements import Button, Label, LazyElement
 from ..admin_basic_category_page import AdminBasicCategoryPage
 from .admin_catalog_add_form_page import AdminCatalogAddFormPage
 from .admin_catalog_edit_form_page import AdminCatalogEditFormPage
@@ -36,22 +36,19 @@ TABLE_STRATEGIES = (
 class AdminCatalogPage(AdminBasicCategoryPage):
     """Admin -> Catalog"""
 
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
-
-        self.crete_product_button = Button(
-            page, "#content .card-action li:last-child a",
-            "Create New Product"
-        )
+    crete_product_button = LazyElement(
+        Button, "#content .card-action li:last-child a", "Create New Product"
+    )
 
-        self.product_edit_button = Button(
-            page, "#content form tbody tr:nth-child({row}) a.btn[title=Edit]",
-            "Edit"
-        )
+    product_edit_button = LazyElement(
+        Button,
+        "#content form tbody tr:nth-child({row}) a.btn[title=Edit]",
+        "Edit"
+    )
 
-        self.notification_banner = Label(
-            page, ".alert-success", "Notification banner"
-        )
+    notification_banner = LazyElement(
+        Label, ".alert-success", "Notification banner"
+    )
 
     @property
     def url(self):
@@ -99,17 +96,35 @@ class AdminCatalogPage(AdminBasicCategoryPage):
         self,
         entity: ProductEntity,
         row_idx: int | None = None,
+        navigation: NavigationMode = NavigationMode.CLICK
     ) -> AdminCatalogEditFormPage:
-        """Clickes Edit button for selected geozone (by id or by name)"""
+        """Clickes Edit button for selected product (by id or by name).
+
+        Args:
+            entity (ProductEntity): entity to edit.
+            row_idx (int, optional): 0-based index of entity's row
+            in the table. Defaults to None - row is looked up.
+            navigation (NavigationMode, optional): CLICK - by Edit
+            button, DIRECT - by URL of Edit form, if entity ID is known
+            (for setup navigation only, Edit button is not checked).
+            Defaults to CLICK.
+        """
         if entity is None and row_idx is None:
             raise ValueError(
                 "Product identifier is not given "
                 "(product entity or row index)!"
             )
 
-        if not row_idx or not entity.entity_id:
-            row_idx = self.find_in_table(entity, True)
-            cast(int, row_idx)
+        if navigation == NavigationMode.DIRECT and entity.entity_id:
+            # Entity ID is known - open Edit form directly
+            edit_form = AdminCatalogEditFormPage(
+                self.page, entity.entity_id, entity.name
+            )
+            edit_form.visit()
+            return edit_form
+
+        if row_idx is None or not entity.entity_id:
+            row_idx = self.find_in_table(entity)
 
         # Note:
         # Shift row_idx +1 from 0-based index of py-array
@@ -3,10 +3,10 @@ from logging import WARNING
 
 import allure  # type: ignore
 import pytest
-from playwright.sync_api import Page, TimeoutError
+from playwright.sync_api import TimeoutError
 
 from utils.components import LinkAnnotatedField
-from utils.elements import Button
+from utils.elements import Button, LazyElement
 
 from ..admin_basic_form_page import AdminBasicFormPage
 
@@ -14,67 +14,74 @@ from ..admin_basic_form_page import AdminBasicFormPage
 class AdminCountriesAddFormPage(AdminBasicFormPage):
     """Admin -> Countries -> Create New Country page"""
 
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
-
-        self.satatus_enabled_button = Button(
-            page, "form input[name=status][value=1]", "Enabled"
-        )
-        self.satatus_disabled_button = Button(
-            page, "form input[name=status][value=0]", "Disabled"
-        )
-
-        self.iso_number_field = LinkAnnotatedField(
-            page,
-            "form div.form-group:has(input[name=iso_code_1])",
-            "Number (ISO Code)",
-        )
-        self.iso_code1_field = LinkAnnotatedField(
-            page,
-            "form div.form-group:has(input[name=iso_code_2])",
-            "Code (ISO Code)",
-        )
-        self.iso_code2_field = LinkAnnotatedField(
-            page,
-            "form div.form-group:has(input[name=iso_code_3])",
-            "Code (ISO Code)",
-        )
-
-        self.address_format_field = LinkAnnotatedField(
-            page,
-            "form div.form-group:has(textarea[name=address_format])",
-            "Address Format",
-            input_type="textarea",
-            elements_selectors_override={"link": "a:last-child"},
-        )
-        self.tax_id_format_field = LinkAnnotatedField(
-            page,
-            "form div.form-group:has(input[name=tax_id_format])",
-            "Tax ID Format",
-        )
-        self.postcode_format_field = LinkAnnotatedField(
-            page,
-            "form div.form-group:has(input[name=postcode_format])",
-            "Postcode Format",
-        )
-        self.language_code_field = LinkAnnotatedField(
-            page,
-            "form div.form-group:has(input[name=language_code])",
-            "Language Code",
-        )
-        self.currency_code_field = LinkAnnotatedField(
-            page,
-            "form div.form-group:has(input[name=currency_code])",
-            "Currency Code",
-        )
-        self.phone_country_code_field = LinkAnnotatedField(
-            page,
-            "form div.form-group:has(input[name=phone_code])",
-            "Phone Country Code",
-        )
-
-        # Collection of annotated fields (with links in label)
-        self.fields_with_links = {
+    satatus_enabled_button = LazyElement(
+        Button, "form input[name=status][value=1]", "Enabled"
+    )
+
+    satatus_disabled_button = LazyElement(
+        Button, "form input[name=status][value=0]", "Disabled"
+    )
+
+    iso_number_field = LazyElement(
+        LinkAnnotatedField,
+        "form div.form-group:has(input[name=iso_code_1])",
+        "Number (ISO Code)"
+    )
+
+    iso_code1_field = LazyElement(
+        LinkAnnotatedField,
+        "form div.form-group:has(input[name=iso_code_2])",
+        "Code (ISO Code)"
+    )
+
+    iso_code2_field = LazyElement(
+        LinkAnnotatedField,
+        "form div.form-group:has(input[name=iso_code_3])",
+        "Code (ISO Code)"
+    )
+
+    address_format_field = LazyElement(
+        LinkAnnotatedField,
+        "form div.form-group:has(textarea[name=address_format])",
+        "Address Format",
+        input_type="textarea",
+        elements_selectors_override={"link": "a:last-child"}
+    )
+
+    tax_id_format_field = LazyElement(
+        LinkAnnotatedField,
+        "form div.form-group:has(input[name=tax_id_format])",
+        "Tax ID Format"
+    )
+
+    postcode_format_field = LazyElement(
+        LinkAnnotatedField,
+        "form div.form-group:has(input[name=postcode_format])",
+        "Postcode Format"
+    )
+
+    language_code_field = LazyElement(
+        LinkAnnotatedField,
+        "form div.form-group:has(input[name=language_code])",
+        "Language Code"
+    )
+
+    currency_code_field = LazyElement(
+        LinkAnnotatedField,
+        "form div.form-group:has(input[name=currency_code])",
+        "Currency Code"
+    )
+
+    phone_country_code_field = LazyElement(
+        LinkAnnotatedField,
+        "form div.form-group:has(input[name=phone_code])",
+        "Phone Country Code"
+    )
+
+    @property
+    def fields_with_links(self) -> dict[str, LinkAnnotatedField]:
+        """Collection of annotated fields (with links in label)"""
+        return {
             "iso_code_1": self.iso_number_field,
             "iso_code_2": self.iso_code1_field,
             "iso_code_3": self.iso_code2_field,
@@ -2,9 +2,8 @@
 from logging import DEBUG
 
 import allure  # type: ignore
-from playwright.sync_api import Page
 
-from utils.elements import Button
+from utils.elements import Button, LazyElement
 
 from ..admin_basic_category_page import AdminBasicCategoryPage
 from .admin_countries_add_form_page import AdminCountriesAddFormPage
@@ -13,12 +12,9 @@ from .admin_countries_add_form_page import AdminCountriesAddFormPage
 class AdminCountriesPage(AdminBasicCategoryPage):
     """Admin -> Countries page"""
 
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
-
-        self.create_new_button = Button(
-            page, "#main #content .card-action a", "Create New Country"
-        )
+    create_new_button = LazyElement(
+        Button, "#main #content .card-action a", "Create New Country"
+    )
 
     @property
     def url(self):
@@ -41,9 +37,10 @@ class AdminCountriesPage(AdminBasicCategoryPage):
         self.table.should_be_visible()
 
     def get_countries(self) -> list:
-        """Returns list of countries from table rows"""
+        """Returns list of countries from table rows
+        (of all pages of the table)"""
         countries_names = [
-            row[0] for row in self.table.get_rows_content([4])
+            row[0] for row in self.table.iter_rows([4], prefetch=True)
         ]
 
         self.log("Countries table has %s items", len(countries_names))
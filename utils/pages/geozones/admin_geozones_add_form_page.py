@@ -2,9 +2,8 @@
 from logging import DEBUG
 
 import allure  # type: ignore
-from playwright.sync_api import Page
 
-from utils.elements import Button, Input, Select, Table
+from utils.elements import Button, Input, Select, Table, LazyElement
 from utils.models.admin_geozone import CountryZoneEntity, GeozoneEntity
 
 from ..admin_basic_form_page import AdminBasicFormPage
@@ -13,46 +12,45 @@ from ..admin_basic_form_page import AdminBasicFormPage
 class AdminGeozonesAddFormPage(AdminBasicFormPage):
     """Admin -> Geo Zones page"""
 
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
+    save_button = LazyElement(
+        Button, "#content .card-action button[name='save']", "Save"
+    )
 
-        self.save_button = Button(
-            page, "#content .card-action button[name='save']", "Save"
-        )
-        self.cancel_button = Button(
-            page, "#content .card-action button[name='cancel']", "Cancel"
-        )
+    cancel_button = LazyElement(
+        Button, "#content .card-action button[name='cancel']", "Cancel"
+    )
 
-        self.code_field = Input(
-            page, "#content form input[name='code']", "Code"
-        )
-        self.name_field = Input(
-            page, "#content form input[name='name']", "Name"
-        )
-        self.desc_field = Input(
-            page, "#content form input[name='description']", "Description"
-        )
+    code_field = LazyElement(Input, "#content form input[name='code']", "Code")
 
-        self.zone_country_select = Select(
-            page, "#content form select[name*='country_code']", "Zones/Country"
-        )
-        self.zone_zones_field = Input(
-            page, "#content form select[name*='zone_code']", "Zones/Zones"
-        )
-        self.zone_city_field = Input(
-            page, "#content form input[name='new_zone[city]']", "Zones/City"
-        )
+    name_field = LazyElement(Input, "#content form input[name='name']", "Name")
 
-        self.zone_add_button = Button(
-            page, "#content form button[name='add']", "Zones/Add"
-        )
-        self.zone_delete_button = Button(
-            page,
-            "#content tbody tr:nth-child({at_row}) td.text-end a",
-            "Delete Zone",
-        )
+    desc_field = LazyElement(
+        Input, "#content form input[name='description']", "Description"
+    )
+
+    zone_country_select = LazyElement(
+        Select, "#content form select[name*='country_code']", "Zones/Country"
+    )
+
+    zone_zones_field = LazyElement(
+        Input, "#content form select[name*='zone_code']", "Zones/Zones"
+    )
+
+    zone_city_field = LazyElement(
+        Input, "#content form input[name='new_zone[city]']", "Zones/City"
+    )
+
+    zone_add_button = LazyElement(
+        Button, "#content form button[name='add']", "Zones/Add"
+    )
 
-        self.zone_table = Table(page, "#content form table", "Zones")
+    zone_delete_button = LazyElement(
+        Button,
+        "#content tbody tr:nth-child({at_row}) td.text-end a",
+        "Delete Zone"
+    )
+
+    zone_table = LazyElement(Table, "#content form table", "Zones")
 
     @property
     def url(self):
@@ -90,10 +88,7 @@ class AdminGeozonesAddFormPage(AdminBasicFormPage):
 
     def get_added_zones_values(self):
         """Returns values of added zones from Zones table"""
-        return self.zone_table.evaluate_on_nested_elements(
-            nested_locator="input[type='hidden']",
-            callback="nodes => Array.prototype.map.call(nodes, e => e.value)",
-        )
+        return self.zone_table.get_rows_hidden_values()
 
     # --- Actions
     def fill_from_entity(self, entity: GeozoneEntity) -> None:
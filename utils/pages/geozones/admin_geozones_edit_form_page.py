@@ -2,7 +2,7 @@
 import allure  # type: ignore
 from playwright.sync_api import Page, expect
 
-from utils.elements import Button
+from utils.elements import Button, LazyElement
 from utils.models.admin_geozone import CountryZoneEntity, GeozoneEntity
 
 from .admin_geozones_add_form_page import AdminGeozonesAddFormPage
@@ -11,15 +11,15 @@ from .admin_geozones_add_form_page import AdminGeozonesAddFormPage
 class AdminGeozonesEditFormPage(AdminGeozonesAddFormPage):
     """Admin -> Geo Zones page"""
 
+    delete_button = LazyElement(
+        Button, "#content .card-action button[name='delete']", "Delete"
+    )
+
     def __init__(self, page: Page, entity_id: int) -> None:
         super().__init__(page)
 
         self.entity_id = entity_id
 
-        self.delete_button = Button(
-            page, "#content .card-action button[name='delete']", "Delete"
-        )
-
     @property
     def url(self):
         return (
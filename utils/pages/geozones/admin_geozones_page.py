@@ -3,9 +3,8 @@
 from typing import cast
 
 import allure  # type: ignore
-from playwright.sync_api import Page
 
-from utils.elements import Button, Label, Table
+from utils.elements import Button, Label, Table, LazyElement
 from utils.models.admin_geozone import GeozoneEntity
 from utils.models.entry_lookup_strategy import (
     EntryLookupStrategy,
@@ -13,6 +12,7 @@ from utils.models.entry_lookup_strategy import (
     LookupStrategiesType,
     ReadStrategiesType
 )
+from utils.models.navigation_mode import NavigationMode
 from ..admin_basic_category_page import AdminBasicCategoryPage
 from .admin_geozones_add_form_page import AdminGeozonesAddFormPage
 from .admin_geozones_edit_form_page import AdminGeozonesEditFormPage
@@ -21,22 +21,19 @@ from .admin_geozones_edit_form_page import AdminGeozonesEditFormPage
 class AdminGeozonesPage(AdminBasicCategoryPage):
     """Admin -> Geo Zones page"""
 
-    def __init__(self, page: Page) -> None:
-        super().__init__(page)
+    table = LazyElement(Table, "#content form table", "Geo Zones")
 
-        self.table = Table(page, "#content form table", "Geo Zones")
-
-        self.create_new_button = Button(
-            page, "#main #content .card-action a", "Create New Geo Zone"
-        )
+    create_new_button = LazyElement(
+        Button, "#main #content .card-action a", "Create New Geo Zone"
+    )
 
-        self.notification_banner = Label(
-            page, ".alert-success", "Notification banner"
-        )
+    notification_banner = LazyElement(
+        Label, ".alert-success", "Notification banner"
+    )
 
-        self.geozone_edit_button = Button(
-            page, "#content form tbody tr:nth-child({row}) a.btn", "Edit"
-        )
+    geozone_edit_button = LazyElement(
+        Button, "#content form tbody tr:nth-child({row}) a.btn", "Edit"
+    )
 
     @property
     def url(self):
@@ -89,16 +86,34 @@ class AdminGeozonesPage(AdminBasicCategoryPage):
         self,
         entity: GeozoneEntity,
         row_idx: int | None = None,
+        navigation: NavigationMode = NavigationMode.CLICK
     ) -> AdminGeozonesEditFormPage:
-        """Clickes Edit button for selected geozone (by id or by name)"""
+        """Clickes Edit button for selected geozone (by id or by name).
+
+        Args:
+            entity (GeozoneEntity): entity to edit.
+            row_idx (int, optional): 0-based index of entity's row
+            in the table. Defaults to None - row is looked up.
+            navigation (NavigationMode, optional): CLICK - by Edit
+            button, DIRECT - by URL of Edit form, if entity ID is known
+            (for setup navigation only, Edit button is not checked).
+            Defaults to CLICK.
+        """
         if entity is None and row_idx is None:
             raise ValueError(
                 "Geozone identifier is not given ('geozone' or 'row_id')!"
             )
 
-        if not row_idx or not entity.entity_id:
-            row_idx = self.find_in_table(entity, True)
-            cast(int, row_idx)
+        if navigation == NavigationMode.DIRECT and entity.entity_id:
+            # Entity ID is known - open Edit form directly
+            edit_form = AdminGeozonesEditFormPage(
+                self.page, entity.entity_id
+            )
+            edit_form.visit()
+            return edit_form
+
+        if row_idx is None or not entity.entity_id:
+            row_idx = self.find_in_table(entity)
 
         # Note:
         # Shift row_idx +1 from 0-based index of py-array
@@ -0,0 +1,172 @@
+"""Block hashes of snapshot images. Allow to skip full pixel comparison
+of the screenshot, when it's identical to golden snapshot.
+
+Hash of the golden snapshot is stored next to it in '.hash.json' file
+and recalculated when checksum of golden snapshot file is changed."""
+import hashlib
+import json
+import logging
+import os
+import sys
+from dataclasses import asdict, dataclass
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+# Size (px) of the square blocks of image to hash
+HASH_BLOCK_SIZE = 64
+HASH_FILE_SUFFIX = ".hash.json"
+
+
+@dataclass(frozen=True)
+class BlockHash:
+    """Hash of the image as digests of pixel data of its blocks.
+    Equal hashes mean pixel-identical images.
+
+    Args:
+        width (int): image width.
+        height (int): image height.
+        block_size (int): size of the blocks.
+        blocks (tuple[str, ...]): digests of the blocks (row by row).
+    """
+    width: int
+    height: int
+    block_size: int
+    blocks: tuple[str, ...]
+
+    @classmethod
+    def from_image(
+        cls, image: Image.Image, block_size: int = HASH_BLOCK_SIZE
+    ) -> "BlockHash":
+        """Calculates hash of the image"""
+        image = image.convert("RGBA")
+        width, height = image.size
+        blocks = tuple(
+            hashlib.blake2b(
+                image.crop((
+                    x, y,
+                    min(x + block_size, width), min(y + block_size, height)
+                )).tobytes(),
+                digest_size=8
+            ).hexdigest()
+            for y in range(0, height, block_size)
+            for x in range(0, width, block_size)
+        )
+        return cls(width, height, block_size, blocks)
+
+    @classmethod
+    def from_png(
+        cls, data: bytes, block_size: int = HASH_BLOCK_SIZE
+    ) -> "BlockHash":
+        """Calculates hash of the PNG image data"""
+        with Image.open(BytesIO(data)) as image:
+            return cls.from_image(image, block_size)
+
+    def mismatched_blocks(self, other: "BlockHash") -> list[int] | None:
+        """Returns indexes of the blocks that differ from other hash,
+        None if hashes are not comparable (different sizes)"""
+        if (self.width, self.height, self.block_size) != (
+            other.width, other.height, other.block_size
+        ):
+            return None
+
+        return [
+            idx for idx, (block, other_block)
+            in enumerate(zip(self.blocks, other.blocks))
+            if block != other_block
+        ]
+
+
+def get_golden_path(request, name: str | None = None) -> Path:
+    """Returns path to golden snapshot of the test, the same way
+    as pytest-playwright-visual's 'assert_snapshot' does.
+
+    Args:
+        request: pytest request of the test.
+        name (str, optional): name of the snapshot file. Defaults to
+        '<test name>[<platform>].png'.
+    """
+    node = request.node
+    if name is None:
+        name = f"{node.name}[{sys.platform}].png"
+
+    # Plugin strips any of '.', 'p', 'y' chars from both ends of file
+    # name (e.g. 'test_copy.py' -> 'test_co'), not just extension
+    test_file_name = os.path.basename(Path(node.fspath)).strip(".py")
+    return (
+        Path(node.fspath).parent.resolve()
+        / "snapshots"
+        / test_file_name
+        / node.name.split("[", 1)[0]
+        / name
+    )
+
+
+def load_golden_hash(golden: Path) -> BlockHash | None:
+    """Returns hash of the golden snapshot from '.hash.json' file.
+    Hash is recalculated and saved if file is missing or golden snapshot
+    was changed. Returns None if there is no golden snapshot."""
+    try:
+        golden_data = golden.read_bytes()
+    except OSError:
+        return None
+
+    # Checksum of the file is cheap comparing to decoding of the image
+    # and (unlike mtime) survives checkout of the repository
+    source = hashlib.sha256(golden_data).hexdigest()
+    hash_path = golden.with_suffix(HASH_FILE_SUFFIX)
+    try:
+        data = json.loads(hash_path.read_text("utf-8"))
+        if data["source"] == source and (
+            data["hash"]["block_size"] == HASH_BLOCK_SIZE
+        ):
+            data["hash"]["blocks"] = tuple(data["hash"]["blocks"])
+            return BlockHash(**data["hash"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    golden_hash = BlockHash.from_png(golden_data)
+
+    try:
+        hash_path.write_text(
+            json.dumps({"source": source, "hash": asdict(golden_hash)}),
+            "utf-8"
+        )
+    except OSError as err:
+        logging.warning("Failed to save snapshot hash %s: %s", hash_path, err)
+
+    return golden_hash
+
+
+def matches_golden(golden: Path, screenshot: bytes) -> bool:
+    """Checks that screenshot is pixel-identical to golden snapshot
+    by block hashes.
+
+    Args:
+        golden (Path): path to golden snapshot.
+        screenshot (bytes): PNG data of the screenshot.
+
+    Returns:
+        bool: True if screenshot matches golden snapshot, False if
+        it differs or there is no golden snapshot.
+    """
+    golden_hash = load_golden_hash(golden)
+    if golden_hash is None:
+        return False
+
+    mismatched = BlockHash.from_png(screenshot).mismatched_blocks(
+        golden_hash
+    )
+    if mismatched is None:
+        logging.info("Snapshot size differs from golden %s", golden.name)
+        return False
+
+    if mismatched:
+        logging.info(
+            "Snapshot differs from golden %s in %s of %s block(s)",
+            golden.name, len(mismatched), len(golden_hash.blocks)
+        )
+        return False
+
+    return True
@@ -1,49 +1,43 @@
 import math
 import logging
+import os
+from functools import lru_cache
 from io import BytesIO
 
 import allure  # type: ignore
+import pytest
 from PIL import Image
-from pixelmatch.contrib.PIL import pixelmatch
 
+from utils.compare_service import compare_service
+from utils.image_compare import compare_images
 
-@allure.step("Compaing original and uploaded pictures")
-def step_compare_uploaded_images(
-    original_image: str, uploaded_image: str,
-    uploaded_image_content: bytes,
-    threshold: float = 0.2, fail_fast: bool = True
-):
-    """Compares original image and image uploaded to server.
-
-    Uploaded image is expected to be scaled to 480x480,
-    saving aspect ratio and with canvas resize. Extra space
-    is expectd to be filled with plain white.
+# Max number of prepared reference images kept in memory
+REFERENCE_IMAGES_CACHE_SIZE = 8
 
-    Function will apply similar chnages to original image
-    and then compare both.
 
-    Args:
-        original_image (str): path to image.
-        uploaded_image (str): url to image.
-        uploaded_image_content (bytes): downloaded image as bytes.
-        threshold (optional, float): comparison threshold (0...1,
-        bigger more tolerant). Defaults to 0.2.
-        fail_fast (optional, bool): fail on any level of errors.
-        Defaults to True.
-    """
-
-    logging.info(
-        'Image comparison started for image: original = %s, target = %s',
-        original_image, uploaded_image
+def attach_image(image: Image.Image, name: str) -> None:
+    """Encodes image to PNG and attaches it to Allure report"""
+    image_bytes = BytesIO()
+    image.save(image_bytes, format='PNG')
+    allure.attach(
+        body=image_bytes.getvalue(),
+        name=name,
+        extension=allure.attachment_type.PNG
     )
 
-    src_img = Image.open(original_image)
-    tgt_img = Image.open(BytesIO(uploaded_image_content))
+
+@lru_cache(maxsize=REFERENCE_IMAGES_CACHE_SIZE)
+def _prepare_reference_image(
+    path: str, mtime_ns: int, file_size: int, target_size: tuple[int, int]
+) -> Image.Image:
+    """Prepares reference image, cached by file path, modification time
+    and size (to drop outdated images) and target size"""
+    src_img = Image.open(path)
 
     # --- Resize source image, saving aspect ratio
     w, h = src_img.size
     aspect = w / h
-    tgt_w, tgt_h = tgt_img.size
+    tgt_w, tgt_h = target_size
 
     if aspect > 1:
         new_w = tgt_w
@@ -74,31 +68,101 @@ def step_compare_uploaded_images(
 
     new_image = Image.new(mode, (tgt_w, tgt_h), new_background)
     new_image.paste(src_img, (x1, y1, x1 + w, y1 + h))
-    img_diff = Image.new("RGBA", tgt_img.size)
+    return new_image
 
-    src_img_bytes = BytesIO()
-    new_image.save(src_img_bytes, format='PNG')
 
-    tgt_img_bytes = BytesIO()
-    tgt_img.save(tgt_img_bytes, format='PNG')
+def get_reference_image(
+    path: str, target_size: tuple[int, int]
+) -> Image.Image:
+    """Returns reference image scaled to fit target size, saving aspect
+    ratio, and centered on white canvas of target size (like uploaded
+    images are processed by the server).
 
-    allure.attach(
-        body=src_img_bytes.getvalue(),
-        name="Original image (resized)",
-        extension=allure.attachment_type.PNG
+    Prepared images are cached per process, so returned image must not
+    be modified.
+
+    Args:
+        path (str): path to reference image.
+        target_size (tuple[int, int]): size of the uploaded image.
+
+    Returns:
+        Image.Image: prepared reference image.
+    """
+    stat = os.stat(path)
+    return _prepare_reference_image(
+        path, stat.st_mtime_ns, stat.st_size, tuple(target_size)
     )
-    allure.attach(
-        body=tgt_img_bytes.getvalue(),
-        name="Uploaded image",
-        extension=allure.attachment_type.PNG
+
+
+@allure.step("Compaing original and uploaded pictures")
+def step_compare_uploaded_images(
+    original_image: str, uploaded_image: str,
+    uploaded_image_content: bytes,
+    threshold: float = 0.2, fail_fast: bool = True,
+    attach_images: bool | None = None
+):
+    """Compares original image and image uploaded to server.
+
+    Uploaded image is expected to be scaled to 480x480,
+    saving aspect ratio and with canvas resize. Extra space
+    is expectd to be filled with plain white.
+
+    Function will apply similar chnages to original image
+    and then compare both.
+
+    Args:
+        original_image (str): path to image.
+        uploaded_image (str): url to image.
+        uploaded_image_content (bytes): downloaded image as bytes.
+        threshold (optional, float): comparison threshold (0...1,
+        bigger more tolerant). Defaults to 0.2.
+        fail_fast (optional, bool): fail on any level of errors.
+        Defaults to True.
+        attach_images (optional, bool): attach compared images to Allure
+        report even if images match. Defaults to None - value of
+        'allure.attach_compared_images' ini option.
+    """
+
+    logging.info(
+        'Image comparison started for image: original = %s, target = %s',
+        original_image, uploaded_image
     )
 
-    mismatch = pixelmatch(
-        new_image, tgt_img, img_diff,
+    tgt_img = Image.open(BytesIO(uploaded_image_content))
+    new_image = get_reference_image(original_image, tgt_img.size)
+
+    if attach_images is None:
+        attach_images = getattr(pytest, "pw_attach_compared_images", False)
+
+    # Comparison in background process, if enabled: result is checked
+    # at the end of the test
+    if compare_service.enabled:
+        if attach_images:
+            attach_image(new_image, "Original image (resized)")
+            attach_image(tgt_img, "Uploaded image")
+        compare_service.submit(
+            f"Image {uploaded_image}",
+            new_image, uploaded_image_content,
+            threshold=threshold,
+            fail_fast=fail_fast
+        )
+        return
+
+    mismatch = compare_images(
+        new_image, tgt_img,
         threshold=threshold,
         fail_fast=fail_fast
     )
-    print(f'Image comparison error is {mismatch}')
     logging.info('Image comparison error is %s', mismatch)
 
+    # Images are encoded for report only when needed
+    if mismatch or attach_images:
+        attach_image(new_image, "Original image (resized)")
+        attach_image(tgt_img, "Uploaded image")
+
+    if mismatch:
+        img_diff = Image.new("RGBA", tgt_img.size)
+        compare_images(new_image, tgt_img, threshold=threshold, diff=img_diff)
+        attach_image(img_diff, "Difference")
+
     assert mismatch == 0, f"Images differs (error: {mismatch})"
@@ -25,7 +25,7 @@ def find_user_exists(login_page: AdminLoginPage, entity):
     users_page: AdminUsersPage = main_page.side_menu.change_category(
         AdminCategory.USERS
     )
-    users_page.find_in_table(entity, True)
+    users_page.find_in_table(entity)
     logging.info("Find User Entity ID for %s was done", entity)
 
     users_page.top_menu.log_out()
@@ -0,0 +1,72 @@
+"""Cache of browser storage state (cookies) of logged in user.
+Allows to log in once per test worker and re-use the session
+in other browser contexts."""
+import json
+import logging
+import pathlib
+
+from playwright.sync_api import BrowserContext
+
+
+class StorageStateCache:
+    """Keeps Playwright storage state of logged in user on disk
+    and injects it into new browser contexts.
+
+    Note: only cookies are injected, as Litecart keeps admin
+    session in cookies.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """Instantiate cache and load previously saved state (if any).
+
+        Args:
+            path (pathlib.Path): path to a file to store state in.
+        """
+        self.path = path
+        self._state: dict | None = None
+
+        if self.path.exists():
+            try:
+                self._state = json.loads(self.path.read_text("utf-8"))
+                logging.info("Loaded cached storage state from %s", path)
+            except (OSError, ValueError) as err:
+                logging.warning(
+                    "Failed to load cached storage state from %s: %s",
+                    path, err
+                )
+
+    @property
+    def is_empty(self) -> bool:
+        """Returns True if there is no state cached"""
+        return self._state is None
+
+    def save(self, context: BrowserContext) -> None:
+        """Saves storage state of given browser context to cache.
+
+        Args:
+            context (BrowserContext): context of the logged in user.
+        """
+        self._state = dict(context.storage_state(path=self.path))
+        logging.info("Storage state cached to %s", self.path)
+
+    def apply(self, context: BrowserContext) -> bool:
+        """Injects cached cookies into given browser context.
+
+        Args:
+            context (BrowserContext): context to inject cookies into.
+
+        Returns:
+            bool: True if cookies were injected, False if cache is empty.
+        """
+        if self._state is None:
+            return False
+
+        context.add_cookies(self._state.get("cookies", []))
+        logging.debug("Cached cookies injected into context %s", context)
+        return True
+
+    def invalidate(self) -> None:
+        """Drops cached state (e.g. on session expiration)"""
+        logging.info("Cached storage state invalidated (%s)", self.path)
+        self._state = None
+        self.path.unlink(missing_ok=True)
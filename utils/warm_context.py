@@ -0,0 +1,88 @@
+"""Browser context kept warm between tests of the worker.
+Allows to skip creation of new browser context and page for each test."""
+import logging
+from typing import Any
+
+from playwright.sync_api import Browser, BrowserContext, Error, Page
+
+
+class WarmContext:
+    """Worker-level browser context with a single page, that is reset
+    to a clean state between tests instead of being recreated.
+
+    Reset clears cookies and storages, closes extra pages and navigates
+    page to blank. If reset fails - context is discarded and a fresh
+    one is created on next acquire.
+    """
+
+    def __init__(self, browser: Browser, context_args: dict[str, Any]):
+        """Instantiate warm context.
+
+        Args:
+            browser (Browser): browser to create contexts in.
+            context_args (dict[str, Any]): arguments for new contexts
+            (e.g. base URL, viewport).
+        """
+        self.browser = browser
+        self.context_args = context_args
+        self.stats = {"created": 0, "reused": 0, "failed_resets": 0}
+
+        self._context: BrowserContext | None = None
+        self._page: Page | None = None
+
+    def acquire(self) -> Page:
+        """Returns warm page, creates new context and page if there is
+        no warm one"""
+        if self._page is not None and not self._page.is_closed():
+            self.stats["reused"] += 1
+            return self._page
+
+        self._discard()
+        self._context = self.browser.new_context(**self.context_args)
+        self._page = self._context.new_page()
+        self.stats["created"] += 1
+        logging.debug("[WarmContext] New context created")
+        return self._page
+
+    def reset(self) -> None:
+        """Resets context and page to a clean state for the next test.
+        Context is discarded if reset fails."""
+        if self._context is None or self._page is None:
+            return
+
+        try:
+            for page in self._context.pages:
+                if page != self._page:
+                    page.close()
+
+            if self._page.url.startswith("http"):
+                self._page.evaluate(
+                    "() => { localStorage.clear(); sessionStorage.clear(); }"
+                )
+            self._context.clear_cookies()
+            self._context.clear_permissions()
+            self._page.goto("about:blank")
+        except Error as err:
+            logging.warning(
+                "[WarmContext] Failed to reset context, "
+                "it will be recreated: %s", err
+            )
+            self.stats["failed_resets"] += 1
+            self._discard()
+
+    def close(self) -> None:
+        """Closes warm context"""
+        self._discard()
+
+    def _discard(self) -> None:
+        """Closes current context (if any) ignoring errors"""
+        context = self._context
+        self._context = None
+        self._page = None
+        if context is None:
+            return
+
+        try:
+            context.close()
+        except Error as err:
+            logging.debug("[WarmContext] Failed to close context: %s", err)